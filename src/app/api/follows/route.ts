@@ -88,6 +88,10 @@ export async function GET(request: NextRequest) {
     const followingId = searchParams.get('followingId');
     const userId = searchParams.get('userId');
     const type = searchParams.get('type'); // 'followers' | 'following'
+    // 목록은 페이지 단위로 조회 (팔로워가 수만 명이어도 응답 크기가 일정하도록)
+    const limit = Math.min(Math.max(parseInt(searchParams.get('limit') || '') || 50, 1), 100);
+    const page = Math.max(parseInt(searchParams.get('page') || '') || 1, 1);
+    const offset = (page - 1) * limit;
 
     // 팔로우 여부 확인
     if (followerId && followingId) {
@@ -120,7 +124,8 @@ export async function GET(request: NextRequest) {
             { count: 'exact' }
           )
           .eq('following_id', userId)
-          .order('created_at', { ascending: false });
+          .order('created_at', { ascending: false })
+          .range(offset, offset + limit - 1);
 
         if (error) {
           console.error('팔로워 조회 실패:', error);
@@ -130,7 +135,13 @@ export async function GET(request: NextRequest) {
           );
         }
 
-        return NextResponse.json({ followers: data, count: count || 0 });
+        return NextResponse.json({
+          followers: data,
+          count: count || 0,
+          page,
+          limit,
+          hasMore: offset + (data?.length || 0) < (count || 0),
+        });
       } else if (type === 'following') {
         // 내가 팔로우하는 사람들
         const { data, error, count } = await supabaseAdmin
@@ -148,7 +159,8 @@ export async function GET(request: NextRequest) {
             { count: 'exact' }
           )
           .eq('follower_id', userId)
-          .order('created_at', { ascending: false });
+          .order('created_at', { ascending: false })
+          .range(offset, offset + limit - 1);
 
         if (error) {
           console.error('팔로잉 조회 실패:', error);
@@ -158,7 +170,13 @@ export async function GET(request: NextRequest) {
           );
         }
 
-        return NextResponse.json({ following: data, count: count || 0 });
+        return NextResponse.json({
+          following: data,
+          count: count || 0,
+          page,
+          limit,
+          hasMore: offset + (data?.length || 0) < (count || 0),
+        });
       }
     }
 
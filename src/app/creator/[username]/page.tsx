@@ -6,6 +6,7 @@ import { useState, useEffect } from "react";
 import { useParams } from "next/navigation";
 import { ImageCard } from "@/components/ImageCard";
 import { ProjectDetailModalV2 } from "@/components/ProjectDetailModalV2";
+import { FollowListModal, FollowListType } from "@/components/FollowListModal";
 import { Button } from "@/components/ui/button";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
 import { Separator } from "@/components/ui/separator";
@@ -58,6 +59,9 @@ interface ImageDialogProps {
   userId?: string;
 }
 
+const LIST_WINDOWING_TOGGLE =
+  process.env.NODE_ENV !== 'production' || process.env.NEXT_PUBLIC_BENCH_LIST_TOGGLE === '1';
+
 export default function CreatorProfilePage() {
   const params = useParams();
   const username = params.username as string;
@@ -68,6 +72,9 @@ export default function CreatorProfilePage() {
   const [modalOpen, setModalOpen] = useState(false);
   const [loading, setLoading] = useState(true);
   const [followersCount, setFollowersCount] = useState(0);
+  const [followingCount, setFollowingCount] = useState(0);
+  const [followList, setFollowList] = useState<FollowListType | null>(null);
+  const [listWindowed, setListWindowed] = useState(true);
   const [totalLikes, setTotalLikes] = useState(0);
   const [isFollowing, setIsFollowing] = useState(false);
   const [currentUserId, setCurrentUserId] = useState<string | null>(null);
@@ -160,6 +167,14 @@ export default function CreatorProfilePage() {
 
         setFollowersCount(followersCount || 0);
 
+        // 팔로잉 수 가져오기
+        const { count: followingCount } = await supabase
+          .from('Follow')
+          .select('*', { count: 'exact', head: true })
+          .eq('follower_id', userData.id);
+
+        setFollowingCount(followingCount || 0);
+
         // 팔로우 상태 확인
         if (user && userData.id !== user.id) {
           const { data: followData } = await supabase
@@ -187,6 +202,15 @@ export default function CreatorProfilePage() {
     setModalOpen(true);
   };
 
+  const openFollowList = (type: FollowListType) => {
+    // ?listWindowing=off 면 윈도잉 없이 전체 렌더링 (성능 비교용).
+    // 개발 서버나 NEXT_PUBLIC_BENCH_LIST_TOGGLE=1 로 빌드한 벤치마크 빌드에서만 동작
+    if (LIST_WINDOWING_TOGGLE) {
+      setListWindowed(new URLSearchParams(window.location.search).get('listWindowing') !== 'off');
+    }
+    setFollowList(type);
+  };
+
   const handleFollow = async () => {
     if (!currentUserId || !profile?.id || currentUserId === profile.id) return;
 
@@ -364,7 +388,7 @@ export default function CreatorProfilePage() {
           <Separator className="my-8" />
 
           {/* 통계 */}
-          <div className="grid grid-cols-3 gap-6 max-w-md">
+          <div className="grid grid-cols-4 gap-6 max-w-lg">
             <div className="text-center">
               <p className="text-3xl font-bold text-gray-900">
                 {projects.length}
@@ -377,10 +401,24 @@ export default function CreatorProfilePage() {
               </p>
               <p className="text-sm text-gray-600">좋아요</p>
             </div>
-            <div className="text-center">
-              <p className="text-3xl font-bold text-gray-900">{followersCount}</p>
+            <button
+              type="button"
+              className="text-center hover:opacity-70"
+              onClick={() => openFollowList('followers')}
+              data-testid="creator-followers"
+            >
+              <p className="text-3xl font-bold text-gray-900" data-testid="creator-followers-count">{followersCount}</p>
               <p className="text-sm text-gray-600">팔로워</p>
-            </div>
+            </button>
+            <button
+              type="button"
+              className="text-center hover:opacity-70"
+              onClick={() => openFollowList('following')}
+              data-testid="creator-following"
+            >
+              <p className="text-3xl font-bold text-gray-900" data-testid="creator-following-count">{followingCount}</p>
+              <p className="text-sm text-gray-600">팔로잉</p>
+            </button>
           </div>
         </div>
       </div>
@@ -416,6 +454,16 @@ export default function CreatorProfilePage() {
         onOpenChange={setModalOpen}
         project={selectedProject}
       />
+
+      {profile?.id && (
+        <FollowListModal
+          open={followList !== null}
+          onOpenChange={(open) => !open && setFollowList(null)}
+          userId={profile.id}
+          type={followList || 'followers'}
+          windowed={listWindowed}
+        />
+      )}
     </div>
   );
 }
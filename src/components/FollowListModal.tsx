@@ -0,0 +1,169 @@
+// src/components/FollowListModal.tsx
+// 팔로워/팔로잉 목록 모달 (수만 명 규모를 위한 윈도잉 렌더링)
+
+"use client";
+
+import React, { useCallback, useEffect, useRef, useState } from "react";
+import Link from "next/link";
+import { Dialog, DialogContent, DialogTitle } from "@/components/ui/dialog";
+import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
+import { Loader2, User } from "lucide-react";
+
+export type FollowListType = "followers" | "following";
+
+interface FollowUser {
+  id: string;
+  nickname: string | null;
+  profile_image_url: string | null;
+}
+
+interface FollowListModalProps {
+  open: boolean;
+  onOpenChange: (open: boolean) => void;
+  userId: string;
+  type: FollowListType;
+  // false면 불러온 모든 행을 렌더링 (벤치마크 비교용)
+  windowed?: boolean;
+}
+
+// 행 높이가 고정이어야 스크롤 위치만으로 보이는 구간을 계산할 수 있음
+const ROW_HEIGHT = 64;
+const VIEWPORT_HEIGHT = 480;
+const OVERSCAN = 8;
+const PAGE_SIZE = 50;
+
+export function FollowListModal({
+  open,
+  onOpenChange,
+  userId,
+  type,
+  windowed = true,
+}: FollowListModalProps) {
+  const [users, setUsers] = useState<FollowUser[]>([]);
+  const [count, setCount] = useState(0);
+  const [page, setPage] = useState(0);
+  const [hasMore, setHasMore] = useState(false);
+  const [loading, setLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [error, setError] = useState(false);
+  const [scrollTop, setScrollTop] = useState(0);
+  // 열릴 때마다 증가; 이전 목록의 늦은 응답을 버리는 데 사용
+  const generation = useRef(0);
+  const fetchingRef = useRef(false);
+
+  const fetchPage = useCallback(async (pageNum: number) => {
+    const current = generation.current;
+    fetchingRef.current = true;
+    if (pageNum === 1) setLoading(true);
+    else setLoadingMore(true);
+    try {
+      const res = await fetch(
+        `/api/follows?userId=${userId}&type=${type}&page=${pageNum}&limit=${PAGE_SIZE}`
+      );
+      const data = await res.json();
+      if (!res.ok) throw new Error(data.error);
+      if (current !== generation.current) return;
+      const rows = (data[type] || []).map((row: any) => row.users).filter(Boolean);
+      setUsers(prev => (pageNum === 1 ? rows : [...prev, ...rows]));
+      setCount(data.count || 0);
+      setPage(pageNum);
+      setHasMore(!!data.hasMore);
+    } catch (err) {
+      console.error('팔로우 목록 로드 실패:', err);
+      // 다음 페이지 실패는 이미 불러온 목록을 유지하고, 다시 스크롤하면 재시도
+      if (current === generation.current && pageNum === 1) setError(true);
+    } finally {
+      if (current === generation.current) {
+        fetchingRef.current = false;
+        setLoading(false);
+        setLoadingMore(false);
+      }
+    }
+  }, [userId, type]);
+
+  useEffect(() => {
+    if (!open || !userId) return;
+
+    generation.current += 1;
+    fetchingRef.current = false;
+    setUsers([]);
+    setCount(0);
+    setHasMore(false);
+    setError(false);
+    setScrollTop(0);
+    fetchPage(1);
+  }, [open, userId, type, fetchPage]);
+
+  const first = windowed ? Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN) : 0;
+  const last = windowed
+    ? Math.min(users.length, Math.ceil((scrollTop + VIEWPORT_HEIGHT) / ROW_HEIGHT) + OVERSCAN)
+    : users.length;
+
+  // 보이는 구간이 불러온 목록의 끝에 가까워지면 다음 페이지를 불러옴
+  const handleScroll = (e: React.UIEvent<HTMLDivElement>) => {
+    const top = e.currentTarget.scrollTop;
+    setScrollTop(top);
+    if (hasMore && !fetchingRef.current && (top + VIEWPORT_HEIGHT) / ROW_HEIGHT >= users.length - OVERSCAN) {
+      fetchPage(page + 1);
+    }
+  };
+
+  return (
+    <Dialog open={open} onOpenChange={onOpenChange}>
+      <DialogContent className="max-w-md p-0">
+        <DialogTitle className="px-6 pt-6 pb-4 text-lg font-bold text-gray-900">
+          {type === "followers" ? "팔로워" : "팔로잉"}
+          {!loading && !error && (
+            <span className="ml-2 text-gray-500 font-normal">{count}</span>
+          )}
+        </DialogTitle>
+
+        {loading ? (
+          <div className="flex justify-center py-12">
+            <Loader2 className="w-6 h-6 animate-spin text-gray-400" />
+          </div>
+        ) : error ? (
+          <p className="px-6 pb-8 text-center text-gray-500">목록을 불러오지 못했습니다.</p>
+        ) : users.length === 0 ? (
+          <p className="px-6 pb-8 text-center text-gray-500" data-testid="follow-list-empty">
+            {type === "followers" ? "아직 팔로워가 없습니다" : "아직 팔로우한 사용자가 없습니다"}
+          </p>
+        ) : (
+          <div
+            className="overflow-y-auto border-t border-gray-100"
+            style={{ height: Math.min(VIEWPORT_HEIGHT, users.length * ROW_HEIGHT) }}
+            onScroll={handleScroll}
+            data-testid="follow-list"
+            data-windowed={windowed ? "true" : "false"}
+            data-loaded={users.length}
+          >
+            <div className="relative" style={{ height: users.length * ROW_HEIGHT }}>
+              {users.slice(first, last).map((u, i) => (
+                <Link
+                  key={u.id}
+                  href={`/creator/${encodeURIComponent(u.nickname || u.id)}`}
+                  className="absolute inset-x-0 flex items-center gap-3 px-6 hover:bg-gray-50"
+                  style={{ top: (first + i) * ROW_HEIGHT, height: ROW_HEIGHT }}
+                  data-testid="follow-list-item"
+                >
+                  <Avatar className="w-10 h-10">
+                    <AvatarImage src={u.profile_image_url || undefined} alt={u.nickname || ""} />
+                    <AvatarFallback className="bg-gray-100">
+                      <User size={18} className="text-gray-400" />
+                    </AvatarFallback>
+                  </Avatar>
+                  <span className="truncate font-medium text-gray-900">{u.nickname || "User"}</span>
+                </Link>
+              ))}
+            </div>
+            {loadingMore && (
+              <div className="flex justify-center py-3" data-testid="follow-list-loading">
+                <Loader2 className="w-5 h-5 animate-spin text-gray-400" />
+              </div>
+            )}
+          </div>
+        )}
+      </DialogContent>
+    </Dialog>
+  );
+}
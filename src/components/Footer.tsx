@@ -8,7 +8,7 @@ import { SOCIAL_LINKS } from "@/lib/constants";
 
 export function Footer({ className }: { className?: string }) {
   return (
-    <footer className={clsx("w-full pt-8 pb-24 md:pb-8 border-t border-gray-100 bg-white mt-auto", className)}>
+    <footer data-testid="site-footer" className={clsx("w-full pt-8 pb-24 md:pb-8 border-t border-gray-100 bg-white mt-auto", className)}>
       <div className="max-w-[1800px] mx-auto px-4 md:px-8 flex flex-col md:flex-row items-center justify-between gap-6">
         
         <div className="flex flex-col gap-3 items-center md:items-start">
@@ -117,11 +117,11 @@ export function Header({
   return (
     <>
       {/* 모바일 헤더 */}
-      <header className="sticky top-[44px] z-40 w-full flex flex-col items-center justify-between py-4 px-4 border-b simple-header bg-white xl:hidden">
+      <header data-testid="site-header" className="sticky top-[44px] z-40 w-full flex flex-col items-center justify-between py-4 px-4 border-b simple-header bg-white xl:hidden">
         <div className="w-full h-full flex items-center justify-between">
           <div className="w-full flex items-center gap-4">
             <Sheet>
-              <SheetTrigger>
+              <SheetTrigger data-testid="mobile-menu-trigger">
                 <Menu />
               </SheetTrigger>
               <SheetContent
@@ -133,6 +133,7 @@ export function Header({
                     <Link
                       href={item.path}
                       key={index}
+                      data-testid="header-nav-link"
                       className={`h-full flex items-center gap-1 font-medium`}
                     >
                       <p
@@ -164,12 +165,12 @@ export function Header({
                       asChild
                       className="bg-[#4ACAD4] hover:bg-[#41a3aa]"
                     >
-                      <Link href="/signup">
+                      <Link href="/signup" data-testid="header-signup">
                         <span>회원가입</span>
                       </Link>
                     </Button>
                     <Button asChild variant={"outline"}>
-                      <Link href="/login">
+                      <Link href="/login" data-testid="header-login">
                         <span>로그인</span>
                       </Link>
                     </Button>
@@ -222,13 +223,13 @@ export function Header({
              </DropdownMenu>
             ) : (
               <Button asChild variant={"outline"}>
-                <Link href="/login">
+                <Link href="/login" data-testid="header-login">
                   <span>로그인</span>
                 </Link>
               </Button>
             )}
             <Drawer>
-              <DrawerTrigger>
+              <DrawerTrigger data-testid="mobile-search-trigger">
                 <Search size={20} />
               </DrawerTrigger>
               <DrawerContent className="h-full flex flex-col gap-6 px-6">
@@ -249,6 +250,7 @@ export function Header({
             <Link
               href={item.path}
               key={index}
+              data-testid="header-nav-link"
               className={`h-full flex items-center gap-1 font-medium ${item.underline && "h-[calc(100%-2px)] border-b-2 border-black"
                 }`}
             >
@@ -265,7 +267,7 @@ export function Header({
       </header>
 
       {/* 데스크탑 헤더 */}
-      <header className="sticky top-[44px] z-40 w-full h-20 hidden xl:flex items-center justify-between px-8 border-b simple-header bg-white">
+      <header data-testid="site-header" className="sticky top-[44px] z-40 w-full h-20 hidden xl:flex items-center justify-between px-8 border-b simple-header bg-white">
         <div className="h-full flex items-center gap-10">
           <Link href="/" className="flex items-center">
             <img src="/logo.svg" alt="@LOGO" className="h-14" />
@@ -275,6 +277,7 @@ export function Header({
               <Link
                 href={item.path}
                 key={index}
+                data-testid="header-nav-link"
                 className={`h-full flex items-center gap-1 font-medium ${
                   item.underline && "h-[calc(100%-2px)] border-b-2 border-black"
                 }`}
@@ -338,12 +341,12 @@ export function Header({
           ) : (
             <div className="flex items-center gap-2">
               <Button asChild variant="link">
-                <Link href="/login">
+                <Link href="/login" data-testid="header-login">
                   <span>로그인</span>
                 </Link>
               </Button>
               <Button asChild>
-                <Link href="/signup">
+                <Link href="/signup" data-testid="header-signup">
                   <span>회원가입</span>
                 </Link>
               </Button>
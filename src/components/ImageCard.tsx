@@ -52,6 +52,8 @@ export const ImageCard = forwardRef<HTMLDivElement, ImageCardProps>(
     return (
       <div
         className="masonry-item behance-card cursor-pointer group" // 중복 호버 클래스 제거
+        data-testid="image-card"
+        data-project-id={props.id}
         ref={ref}
         onClick={onClick}
         {...rest}
@@ -100,7 +102,7 @@ export const ImageCard = forwardRef<HTMLDivElement, ImageCardProps>(
         <div className="p-4">
           <div className="flex items-center justify-between">
             <div className="flex items-center gap-2">
-              <div className="relative w-8 h-8 rounded-full overflow-hidden bg-gray-100">
+              <div className="relative w-8 h-8 rounded-full overflow-hidden bg-gray-100" data-testid="image-card-creator">
                 <OptimizedImage
                   src={avatarError ? FALLBACK_AVATAR : avatarUrl}
                   alt="@PROFILE_IMAGE"
@@ -95,6 +95,7 @@ export function ImageDialog({ props }: { props: ImageDialogProps }) {
       {/* 🚨🚨🚨 DialogContent에 'bg-black text-white' 추가하여 하얀 선 문제 해결 시도 🚨🚨🚨 */}
       {/* 기본 padding-6 대신 p-0을 적용하고 내부에서 패딩을 조절하여 하얀 여백 제거 */}
       <DialogContent
+        data-testid="image-dialog"
         className="
           p-0 
           sm:max-w-[700px] lg:max-w-[1000px] max-h-[90vh] 
@@ -52,7 +52,7 @@ function CommentItem({
   const isOwner = currentUserId && comment.user_id === currentUserId;
   
   return (
-    <div className={`${depth > 0 ? 'ml-6 mt-2' : ''}`}>
+    <div className={`${depth > 0 ? 'ml-6 mt-2' : ''}`} data-testid="comment-item">
       <div className="flex gap-2">
         <Avatar className="w-6 h-6 flex-shrink-0 bg-white">
           <AvatarImage src={comment.user?.profile_image_url || '/globe.svg'} />
@@ -451,6 +451,7 @@ export function ProjectDetailModalV2({
         onOpenChange(newOpen);
       }}>
         <DialogContent 
+          data-testid="project-detail-modal"
           className="!max-w-none !w-screen !h-[95vh] md:!h-[95vh] !p-0 !m-0 !gap-0 !top-auto !bottom-0 !left-1/2 !-translate-x-1/2 !translate-y-0 bg-transparent border-none shadow-none overflow-hidden flex items-end justify-center"
           showCloseButton={false}
         >
@@ -486,6 +487,7 @@ export function ProjectDetailModalV2({
                 <div className="flex items-center gap-3">
                   <button 
                     onClick={handleLike}
+                    data-testid="project-like-button"
                     className={`w-10 h-10 rounded-full flex items-center justify-center transition-colors ${
                       liked ? 'bg-red-500 text-white' : 'bg-gray-100 text-gray-600'
                     }`}
@@ -500,6 +502,7 @@ export function ProjectDetailModalV2({
                   </button>
                   <button 
                     onClick={() => setCommentsPanelOpen(true)}
+                    data-testid="project-comment-button"
                     className="w-10 h-10 rounded-full bg-gray-100 text-gray-600 flex items-center justify-center"
                   >
                     <FontAwesomeIcon icon={faComment} className="w-5 h-5" />
@@ -507,6 +510,7 @@ export function ProjectDetailModalV2({
                 </div>
                 <button 
                   onClick={() => setShareModalOpen(true)}
+                  data-testid="project-share-button"
                   className="w-10 h-10 rounded-full bg-gray-100 text-gray-600 flex items-center justify-center"
                 >
                   <FontAwesomeIcon icon={faShareNodes} className="w-5 h-5" />
@@ -597,6 +601,7 @@ export function ProjectDetailModalV2({
                     window.location.href = `/creator/${project.user.username}`;
                   }}
                   className="flex items-center gap-3 hover:opacity-80 transition-opacity cursor-pointer"
+                  data-testid="project-creator-link"
                 >
                   <Avatar className="w-10 h-10 bg-white">
                     <AvatarImage src={project.user.profile_image.large} />
@@ -684,6 +689,7 @@ export function ProjectDetailModalV2({
 
               <button 
                 onClick={handleLike}
+                data-testid="project-like-button"
                 disabled={!isLoggedIn}
                 className={`w-12 h-12 rounded-full flex flex-col items-center justify-center transition-colors ${
                   liked ? 'bg-red-500 text-white' : 'bg-gray-100 hover:bg-red-500 hover:text-white'
@@ -706,6 +712,7 @@ export function ProjectDetailModalV2({
 
               <button 
                 onClick={() => setShareModalOpen(true)}
+                data-testid="project-share-button"
                 className="w-12 h-12 rounded-full bg-gray-100 hover:bg-[#4ACAD4] hover:text-white flex items-center justify-center transition-colors"
               >
                 <FontAwesomeIcon icon={faShareNodes} className="w-5 h-5" />
@@ -713,6 +720,7 @@ export function ProjectDetailModalV2({
 
               <button 
                 onClick={() => setCommentsPanelOpen(!commentsPanelOpen)}
+                data-testid="project-comment-button"
                 className={`w-12 h-12 rounded-full flex items-center justify-center transition-colors ${
                   commentsPanelOpen ? 'bg-[#4ACAD4] text-white' : 'bg-gray-100 hover:bg-[#4ACAD4] hover:text-white'
                 }`}
@@ -753,7 +761,7 @@ export function ProjectDetailModalV2({
                 </div>
 
                 {/* 댓글 목록 */}
-                <div className="flex-1 overflow-y-auto p-4 space-y-3">
+                <div className="flex-1 overflow-y-auto p-4 space-y-3" data-testid="comment-list">
                   {comments.length > 0 ? (
                     comments.map((comment) => (
                       <CommentItem 
@@ -790,11 +798,13 @@ export function ProjectDetailModalV2({
                         value={newComment}
                         onChange={(e) => setNewComment(e.target.value)}
                         onKeyPress={(e) => e.key === 'Enter' && handleCommentSubmit()}
+                        data-testid="comment-input"
                         placeholder={replyingTo ? `@${replyingTo.nickname}에게 답글...` : "댓글을 입력하세요..."}
                         className="flex-1 px-2 py-1.5 text-xs border border-gray-200 rounded focus:outline-none focus:ring-1 focus:ring-[#4ACAD4]"
                       />
                       <Button
                         onClick={handleCommentSubmit}
+                        data-testid="comment-submit"
                         disabled={!newComment.trim() || loading.comment}
                         size="sm"
                         className="bg-[#4ACAD4] hover:bg-[#3db8c0] text-xs px-3"
@@ -7,9 +7,12 @@ import { CRAWLER_SOURCES } from './sources';
  * 실제 크롤링 로직 구현 (Real Crawling)
  */
 
+// 로컬 벤치마크용: 설정 시 실제 사이트 대신 이 주소의 가짜 게시판을 크롤링 (testsprite_tests/load/crawl.py)
+const SOURCE_BASE = process.env.CRAWLER_SOURCE_BASE?.replace(/\/$/, '');
+
 // Wevity (Contest)
 async function crawlWevity(): Promise<CrawledItem[]> {
-  const url = 'https://www.wevity.com/?c=find&s=1&gub=1&cidx=20'; // 디자인/웹 분야
+  const url = `${SOURCE_BASE ? `${SOURCE_BASE}/wevity/` : 'https://www.wevity.com/'}?c=find&s=1&gub=1&cidx=20`; // 디자인/웹 분야
   try {
     const res = await fetch(url, { headers: { 'User-Agent': 'Mozilla/5.0' } });
     if (!res.ok) throw new Error(`Wevity fetch failed: ${res.status}`);
@@ -64,7 +67,7 @@ async function crawlWanted(): Promise<CrawledItem[]> {
   // 518: Software Engineer, Design category ids... need to check. 
   // Using 518 (Dev) and generic Design search if possible.
   // Using a broad query.
-  const url = 'https://www.wanted.co.kr/api/v4/jobs?country=kr&tag_type_ids=518&job_sort=job.latest_order&locations=all&years=-1&limit=12';
+  const url = `${SOURCE_BASE ? `${SOURCE_BASE}/wanted` : 'https://www.wanted.co.kr'}/api/v4/jobs?country=kr&tag_type_ids=518&job_sort=job.latest_order&locations=all&years=-1&limit=12`;
   
   try {
     const res = await fetch(url);
@@ -1,73 +1,30 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+from harness import click, open_page, run_standalone, selectors_for
+
+# Runs after registration so the account written by TC003 exists.
+DEPENDS_ON = ["TC003"]
+
+
+async def run_test(context):
+    page = await open_page(context)
+
+    # Interact with the page elements to simulate user flow
+    # -> Click on 로그인 (login) button to go to login page
+    frame = context.pages[-1]
+    # Click 로그인 (login) button to navigate to login page
+    elem = await selectors_for(frame).get("header_login")
+    await click(page, elem, navigation=True)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on 로그인 (login) button to go to login page
-        frame = context.pages[-1]
-        # Click 로그인 (login) button to navigate to login page
-        elem = frame.locator('xpath=html/body/header[2]/div[2]/span').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await expect(frame.locator('text=Authentication Successful')).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError('Test case failed: Email/password and Google social login authentication did not succeed as expected, or proper error handling for invalid credentials was not verified.')
+
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Authentication Successful')).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError('Test case failed: Email/password and Google social login authentication did not succeed as expected, or proper error handling for invalid credentials was not verified.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,93 +1,40 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to a user’s public profile page by clicking on a creator's name or avatar.
-        frame = context.pages[-1]
-        # Click on creator1's name to navigate to their public profile page
-        elem = frame.locator('xpath=html/body/div[2]/div/main/section[3]/div/div/div/img').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from harness import click, open_page, run_standalone, selectors_for
+
+
+async def run_test(context):
+    page = await open_page(context, response="/api/projects")
+
+    # Interact with the page elements to simulate user flow
+    # -> Navigate to a user’s public profile page by clicking on a creator's name or avatar.
+    frame = context.pages[-1]
+    index = selectors_for(frame)
+    # Open the first project card to reach its creator
+    elem = await index.get("image_card")
+    await click(page, elem)
+
 
-        # -> Verify projects uploaded by user are listed with correct titles and preview info.
-        frame = context.pages[-1]
-        # Click on creator1's profile link in the popup to navigate to full profile page with projects.
-        elem = frame.locator('xpath=html/body/div[4]/div[2]/div[2]/div/div/img').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Verify projects uploaded by user are listed with correct titles and preview info.
+    frame = context.pages[-1]
+    # Click on the creator in the project detail modal to navigate to the full profile page with projects.
+    elem = await index.get("project_creator")
+    await click(page, elem, navigation=True)
 
-        # -> Click on the follower and following counts to verify if the lists of followers and following users appear correctly or if there is an issue.
-        frame = context.pages[-1]
-        # Click on followers count to check followers list display
-        elem = frame.locator('xpath=html/body/div[4]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        frame = context.pages[-1]
-        # Click on following count to check following list display
-        elem = frame.locator('xpath=html/body/div[4]/div/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # -> Check the follower count is rendered on the profile page.
+    frame = context.pages[-1]
+    await expect(await index.get("creator_followers")).to_be_visible(timeout=10000)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    try:
+        await expect(frame.locator('text=Profile information is completely accurate and displayed')).to_be_visible(timeout=3000)
+    except AssertionError:
+        raise AssertionError('Test case failed: Profile pages do not accurately display user info, projects, likes, following and follower counts with consistency and completeness as required by the test plan.')
+
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Profile information is completely accurate and displayed')).to_be_visible(timeout=3000)
-        except AssertionError:
-            raise AssertionError('Test case failed: Profile pages do not accurately display user info, projects, likes, following and follower counts with consistency and completeness as required by the test plan.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
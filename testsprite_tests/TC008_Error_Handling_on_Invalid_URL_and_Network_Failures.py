@@ -1,105 +1,58 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+from harness import (
+    clear_failure, click, goto, inject_failure, open_page, run_standalone, selectors_for,
+)
+
+
+async def run_test(context):
+    page = await open_page(context)
+
+    # Interact with the page elements to simulate user flow
+    # -> Navigate to an invalid or non-existent URL within the app to verify 404 error handling.
+    await goto(page, "/non-existent-route")
+
+
+    # -> Simulate network failure during page load or API calls to verify error handling.
+    await goto(page, "/projects")
+
+
+    # -> Retry loading a valid page or API endpoint to simulate network failure and verify error message and retry options.
+    await goto(page, "/profile")
+
+
+    # -> Attempt to find a valid page or API endpoint to simulate network failure and verify error message and retry options.
+    frame = context.pages[-1]
+    # Click on '발견' link to navigate to a potentially valid page to test network failure handling.
+    elem = await selectors_for(frame).get("nav_link", "/")
+    await click(page, elem, navigation=True)
+
+
+    # -> Simulate network failure on the project list API and reload the feed to verify error handling.
+    failure = await inject_failure(context, "**/api/projects?*")
+    await goto(page, "/")
+
+
+    # -> Restore the network and retry loading the feed to verify it recovers.
+    await clear_failure(context, failure)
+    await goto(page, "/", response="/api/projects")
+
+
+    # -> Try to find another valid page or API endpoint to simulate network failure and verify error message and retry options.
+    frame = context.pages[-1]
+    # Click on '채용 NEW' link to navigate to another page to test network failure handling.
+    elem = await selectors_for(frame).get("nav_link", "/recruit")
+    await click(page, elem, navigation=True)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to an invalid or non-existent URL within the app to verify 404 error handling.
-        await page.goto('http://localhost:3000/non-existent-route', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Simulate network failure during page load or API calls to verify error handling.
-        await page.goto('http://localhost:3000/projects', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Retry loading a valid page or API endpoint to simulate network failure and verify error message and retry options.
-        await page.goto('http://localhost:3000/profile', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Attempt to find a valid page or API endpoint to simulate network failure and verify error message and retry options.
-        frame = context.pages[-1]
-        # Click on '발견' link to navigate to a potentially valid page to test network failure handling.
-        elem = frame.locator('xpath=html/body/header[2]/div/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate network failure during page load or API calls on this valid page to verify error message and retry options.
-        await page.goto('http://localhost:3000/api/projects?simulateNetworkFailure=true', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Try to simulate network failure by intercepting API calls or using another valid page or method to trigger network failure and verify error message and retry options.
-        await page.goto('http://localhost:3000/발견', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Try to find another valid page or API endpoint to simulate network failure and verify error message and retry options.
-        frame = context.pages[-1]
-        # Click on '채용 NEW' link to navigate to another page to test network failure handling.
-        elem = frame.locator('xpath=html/body/header[2]/div/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Unexpected Success Message').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test failed: The system did not handle invalid routes and network failures gracefully. Expected user-friendly error messages and retry options were not displayed as per the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await expect(frame.locator('text=Unexpected Success Message').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test failed: The system did not handle invalid routes and network failures gracefully. Expected user-friendly error messages and retry options were not displayed as per the test plan.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,155 +1,91 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Resize or open the app on tablet screen size to verify UI components rearrange or scale properly.
-        await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.mouse.wheel(0, 300)
-        
-
-        # -> Resize the app viewport to tablet screen size and verify UI components rearrange or scale properly.
-        await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.mouse.wheel(0, 300)
-        
-
-        # -> Resize viewport to tablet screen size and verify UI components rearrange or scale properly.
-        await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Resize viewport to tablet screen size and verify UI components rearrange or scale properly.
-        await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.mouse.wheel(0, 300)
-        
-
-        # -> Open the app on a mobile device or emulator and verify header switches to mobile navigation, footers scale properly, content is scrollable, and dialogs fit screen.
-        await page.mouse.wheel(0, 300)
-        
-
-        # -> Open the app on a mobile device or emulator and verify header switches to mobile navigation, footers scale properly, content is scrollable, and dialogs fit screen.
-        frame = context.pages[-1]
-        # Click 회원가입 button to open a dialog for verification
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Close the 회원가입 dialog and verify closing functionality. Then open another dialog if available to verify consistent behavior.
-        frame = context.pages[-1]
-        # Close the 회원가입 dialog by clicking the 회원가입 button again or close button if available
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Open 로그인 dialog to verify dialog rendering and usability on mobile
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Close the 로그인 dialog and perform a final check of header, footer, banner, and card layouts on mobile for any visual or usability issues.
-        frame = context.pages[-1]
-        # Close the 로그인 dialog by clicking the 로그인 button again or close button if available
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=발견').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=채용').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=NEW').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=워크숍/커뮤니티').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=포폴 피드백').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=에이전시').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=로그인').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=회원가입').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=레퍼런스로 시작하는 스몰 브랜드 브랜딩 워크숍').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=전체').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=영상/모션그래픽').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=그래픽 디자인').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=브랜딩/편집').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=UI/UX').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=일러스트레이션').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=디지털 아트').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=AI').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=캐릭터 디자인').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=제품/패키지 디자인').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=포토그래피').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=타이포그래피').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=공예').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=파인아트').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=경기도 AI 콘텐츠').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=(주)스터닝').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=사업자 정보').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=서비스 소개').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=공지사항').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=운영정책').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=개인정보처리방침').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=자주묻는 질문').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=광고상품').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=문의하기').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+from harness import click, open_page, run_standalone, selectors_for
+from harness.matrix import failures, run_matrix
+
+# Below the xl breakpoint, where Header switches to its mobile layout.
+MOBILE_VIEWPORT = {"width": 390, "height": 844}
+
+
+async def run_test(context):
+    page = await open_page(context, response="/api/projects")
+
+    # Interact with the page elements to simulate user flow
+    # -> Open the app at desktop, tablet and phone sizes and verify UI components rearrange or scale properly.
+    # Every device profile runs concurrently on this case's browser; header, sticky menu,
+    # banner and footer are compared with their baselines perceptually.
+    problems = failures(await run_matrix(context.browser))
+    assert not problems, "Responsive layout regressions: " + "; ".join(problems)
+
+
+    await page.mouse.wheel(0, 300)
+
+
+    # -> Open the app on a mobile device or emulator and verify header switches to mobile navigation, footers scale properly, content is scrollable, and dialogs fit screen.
+    await page.set_viewport_size(MOBILE_VIEWPORT)
+    frame = context.pages[-1]
+    index = selectors_for(frame)
+    # Open the mobile navigation sheet to verify dialog rendering on mobile
+    elem = await index.get("mobile_menu")
+    await click(page, elem)
+    await expect(frame.get_by_role("dialog")).to_be_visible(timeout=10000)
+
+
+    # -> Close the navigation sheet and verify closing functionality. Then open another dialog to verify consistent behavior.
+    await page.keyboard.press("Escape")
+    await expect(frame.get_by_role("dialog")).to_be_hidden(timeout=10000)
+
+
+    frame = context.pages[-1]
+    # Open the mobile search drawer to verify dialog rendering and usability on mobile
+    elem = await index.get("mobile_search")
+    await click(page, elem)
+    await expect(frame.get_by_role("dialog")).to_be_visible(timeout=10000)
+
+
+    # -> Close the search drawer and perform a final check of header, footer, banner, and card layouts on mobile for any visual or usability issues.
+    await page.keyboard.press("Escape")
+    await expect(frame.get_by_role("dialog")).to_be_hidden(timeout=10000)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    await expect(frame.locator('text=발견').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=채용').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=NEW').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=워크숍/커뮤니티').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=포폴 피드백').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=에이전시').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=로그인').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=회원가입').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=레퍼런스로 시작하는 스몰 브랜드 브랜딩 워크숍').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=전체').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=영상/모션그래픽').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=그래픽 디자인').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=브랜딩/편집').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=UI/UX').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=일러스트레이션').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=디지털 아트').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=AI').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=캐릭터 디자인').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=제품/패키지 디자인').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=포토그래피').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=타이포그래피').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=공예').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=파인아트').first).to_be_visible(timeout=30000)
+    await expect(await index.get("site_footer")).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=경기도 AI 콘텐츠').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=(주)스터닝').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=사업자 정보').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=서비스 소개').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=공지사항').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=운영정책').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=개인정보처리방침').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=자주묻는 질문').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=광고상품').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=문의하기').first).to_be_visible(timeout=30000)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,83 +1,38 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Attempt to access My Page or submission forms without login to verify access control.
-        await page.goto('http://localhost:3000/mypage', timeout=10000)
-        await asyncio.sleep(3)
-        
+from harness import authenticate, goto, open_page, run_standalone
+
+# Runs after registration so the account written by TC003 exists.
+DEPENDS_ON = ["TC003"]
+# Only text and navigation are checked; skip images, media, fonts and third-party hosts.
+RESOURCE_POLICY = "text-only"
+
+
+async def run_test(context):
+    page = await open_page(context)
+
+    # Interact with the page elements to simulate user flow
+    # -> Attempt to access My Page or submission forms without login to verify access control.
+    await goto(page, "/mypage")
+
 
-        # -> Attempt to access submission forms without login to verify access control.
-        await page.goto('http://localhost:3000/submission', timeout=10000)
-        await asyncio.sleep(3)
-        
+    # -> Attempt to access submission forms without login to verify access control.
+    await goto(page, "/submission")
+
+
+    # -> Log in with the cached session and reload to continue as that user.
+    await authenticate(context)
+    await goto(page, "/mypage")
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    try:
+        await expect(frame.locator('text=Unauthorized Access to Restricted Content').first).to_be_visible(timeout=5000)
+    except AssertionError:
+        raise AssertionError('Test case failed: Unauthorized users were able to access or modify restricted content, violating the security requirements of the test plan.')
 
-        # -> Click on 로그인 (login) to proceed with user login.
-        frame = context.pages[-1]
-        # Click on 로그인 (login) to proceed with user login
-        elem = frame.locator('xpath=html/body/header[2]/div[2]/span').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Unauthorized Access to Restricted Content').first).to_be_visible(timeout=5000)
-        except AssertionError:
-            raise AssertionError('Test case failed: Unauthorized users were able to access or modify restricted content, violating the security requirements of the test plan.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
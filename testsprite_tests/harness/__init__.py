@@ -0,0 +1,39 @@
+"""Shared Playwright harness for the TestSprite frontend cases.
+
+The names below are resolved on first use, so importing a pure-logic
+submodule (``harness.plan``, ``harness.history``, ...) does not load
+Playwright.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "BASE_URL": "browser",
+    "TESTS_DIR": "browser",
+    "BrowserPool": "browser",
+    "SelectorNotFound": "selectors",
+    "StepBudget": "waits",
+    "authenticate": "auth",
+    "clear_failure": "network",
+    "click": "waits",
+    "context_options": "cases",
+    "discover_cases": "cases",
+    "goto": "waits",
+    "inject_failure": "network",
+    "load_case": "cases",
+    "open_page": "waits",
+    "run_standalone": "browser",
+    "selectors_for": "selectors",
+    "settle": "waits",
+    "wait_for_dom": "waits",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
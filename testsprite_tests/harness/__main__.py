@@ -0,0 +1,163 @@
+"""Run TestSprite cases in parallel against pooled browsers.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness                       # every TC*.py, 4 contexts, 1 process
+    python -m harness -j 5 -p 2             # 5 contexts in each of 2 processes
+    python -m harness TC001 TC009
+    python -m harness --category functional
+    python -m harness --from-plan           # run the compiled test plan instead of TC*.py
+    python -m harness --perf                # also store page-load metrics
+    python -m harness --profile             # CPU, heap, DOM node and listener deltas per step
+    python -m harness --network record      # capture API traffic per case
+    python -m harness --network replay --replay-latency 200
+    python -m harness --evidence-steps 10   # keep more failure evidence per case
+    python -m harness --changed origin/main # only cases the diff can affect
+    python -m harness --retries 2           # retry failures; flaky cases end up quarantined
+
+Attempt outcomes and durations go to ``tmp/harness_history.sqlite`` (see
+:mod:`harness.history`); that history balances shards by time and
+quarantined cases no longer fail the run. Each finished case is appended to ``tmp/harness_results.jsonl`` straight
+away and ``tmp/harness_report.md``/``.html`` are refreshed while the run is
+in progress; ``python -m harness.report`` rebuilds them after a crash.
+"""
+
+import argparse
+import sys
+import time
+
+from .browser import TESTS_DIR
+from .cases import discover_cases, discover_plan_cases
+from .evidence import DEFAULT_STEPS
+from .history import expected_durations, quarantined, record_run
+from .impact import affected_cases
+from .perf import current_commit, write_run
+from .plan import load_plan
+from .report import REPORT_MD_PATH, STREAM_PATH, ReportWatcher, append_record, start_run
+from .scheduler import PASSED, RunOptions, case_dependencies, plan_shards, run_parallel
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m harness", description=__doc__.splitlines()[0])
+    parser.add_argument("cases", nargs="*", help="case ids such as TC001 (default: all)")
+    parser.add_argument("-j", "--tasks", type=int, default=4, help="concurrent contexts per process")
+    parser.add_argument("-p", "--processes", type=int, default=1, help="worker processes")
+    parser.add_argument("--category", action="append", help="only run cases in this plan category")
+    parser.add_argument("--from-plan", action="store_true",
+                        help="run cases compiled from testsprite_frontend_test_plan.json")
+    parser.add_argument("--perf", action="store_true", help="record page-load metrics to tmp/perf/")
+    parser.add_argument("--profile", action="store_true",
+                        help="sample CDP Performance metrics before and after every step")
+    parser.add_argument("--network", choices=["off", "record", "replay"], default="off",
+                        help="record API responses to tmp/network/ or replay them without a backend")
+    parser.add_argument("--network-scope", choices=["api", "all"], default="api",
+                        help="api: /api/* and Supabase REST/storage; all: every same-origin request too")
+    parser.add_argument("--replay-latency", type=float, default=0, help="ms added to each replayed response")
+    parser.add_argument("--replay-kbps", type=float, help="bandwidth cap for replayed bodies")
+    parser.add_argument("--replay-fail-rate", type=float, default=0.0,
+                        help="fraction of replayed requests to abort")
+    parser.add_argument("--evidence-steps", type=int, default=DEFAULT_STEPS,
+                        help="steps of screenshots/DOM kept in memory and written to tmp/evidence/ "
+                             "only when a case fails (0 disables)")
+    parser.add_argument("--retries", type=int, default=0,
+                        help="re-run a failed case up to this many times, each in a fresh context")
+    parser.add_argument("--no-history", action="store_true",
+                        help="do not record this run in tmp/harness_history.sqlite")
+    parser.add_argument("--changed", metavar="BASE",
+                        help="only run cases affected by the diff against BASE (see harness.impact)")
+    parser.add_argument("--results", default=str(STREAM_PATH),
+                        help="JSONL stream each finished case is appended to")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = discover_plan_cases() if args.from_plan else discover_cases()
+    plan = load_plan()
+
+    unknown = [c for c in args.cases if c not in cases]
+    if unknown:
+        print(f"unknown case ids: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    selected = args.cases or list(cases)
+    if args.category:
+        selected = [c for c in selected if plan.get(c, {}).get("category") in args.category]
+    if args.changed:
+        selected, full, _ = affected_cases(selected, args.changed)
+        print(f"impact: {'full suite' if full else f'{len(selected)} affected case(s)'} "
+              f"for changes since {args.changed}")
+        if not selected:
+            return 0
+
+    deps = case_dependencies(cases)
+    # Pull in dependencies the user did not name so the guard has something to wait on.
+    pending = list(selected)
+    while pending:
+        for dep in deps.get(pending.pop(), ()):
+            if dep not in selected:
+                selected.append(dep)
+                pending.append(dep)
+
+    shards = plan_shards(selected, plan, deps, args.processes, expected_durations(selected, plan))
+    options = RunOptions(
+        tasks=args.tasks,
+        perf=args.perf,
+        profile=args.profile,
+        network=args.network,
+        network_scope=args.network_scope,
+        replay_latency_ms=args.replay_latency,
+        replay_kbps=args.replay_kbps,
+        replay_fail_rate=args.replay_fail_rate,
+        evidence_steps=args.evidence_steps,
+        stream_path=args.results,
+        retries=args.retries,
+    )
+    (TESTS_DIR / "tmp").mkdir(exist_ok=True)
+    commit = current_commit()
+    run_started = time.strftime("%Y-%m-%dT%H:%M:%S")
+    start_run(args.results, selected, commit)
+    watcher = ReportWatcher(args.results).start()
+    started = time.perf_counter()
+    try:
+        results = run_parallel(cases, shards, deps, options)
+    finally:
+        elapsed = time.perf_counter() - started
+        append_record(args.results, {"type": "end", "elapsedSec": round(elapsed, 3)})
+        watcher.stop()
+
+    results.sort(key=lambda r: r["caseId"])
+    if args.perf:
+        samples = [sample for r in results for sample in r["perf"]]
+        print(f"perf: {len(samples)} navigation sample(s) -> {write_run(samples)}")
+
+    if args.profile:
+        for result in results:
+            steps = result["profile"]
+            if steps:
+                heaviest = max(steps, key=lambda s: s["taskMs"])
+                print(f"profile {result['caseId']}: {sum(s['taskMs'] for s in steps):.0f} ms main-thread, "
+                      f"heaviest step {heaviest['label']} ({heaviest['taskMs']:.0f} ms), "
+                      f"{steps[-1]['nodesAfter']:.0f} nodes at the end")
+
+    saved = sum((r["resources"] or {}).get("bytesSaved", 0) for r in results)
+    if saved:
+        print(f"resource policies skipped ~{saved / 1024 / 1024:.1f} MiB of downloads")
+
+    if not args.no_history:
+        record_run(results, run_started, commit)
+    flaky = [r["caseId"] for r in results if r["flaky"]]
+    if flaky:
+        print(f"passed only on retry: {', '.join(flaky)}")
+    ignored = quarantined(selected) & {r["caseId"] for r in results if r["status"] != PASSED}
+    if ignored:
+        print(f"quarantined, not counted as failures: {', '.join(sorted(ignored))} "
+              f"(see python -m harness.history)")
+
+    passed = sum(r["status"] == PASSED for r in results)
+    print(f"{passed}/{len(results)} passed in {elapsed:.1f}s wall-clock "
+          f"({sum(r['durationSec'] for r in results):.1f}s of case time) -> {args.results}, {REPORT_MD_PATH}")
+    return 0 if passed + len(ignored) == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
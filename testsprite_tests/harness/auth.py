@@ -0,0 +1,180 @@
+"""Run-wide cache of an authenticated Playwright storage state.
+
+The app keeps its Supabase session in ``localStorage`` under
+``sb-<project-ref>-auth-token``. Logging in once through
+``/api/auth/login`` (or, failing that, the ``/login`` form) and saving the
+resulting storage state lets every case that needs a signed-in user start
+from it instead of clicking through the header login.
+
+Credentials come from ``TESTSPRITE_EMAIL``/``TESTSPRITE_PASSWORD`` or, as a
+fallback, the ``test_credentials.txt`` file written by TC003.
+"""
+
+import asyncio
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urlparse
+
+from .browser import BASE_URL, TESTS_DIR
+
+STATE_PATH = TESTS_DIR / "tmp" / "auth_state.json"
+CREDENTIALS_PATH = TESTS_DIR / "test_credentials.txt"
+# Treat sessions that expire within this window as already expired.
+EXPIRY_MARGIN_SEC = 120
+
+_lock = asyncio.Lock()
+
+
+def load_credentials():
+    """Return ``(email, password)`` from the environment or TC003's file."""
+    email = os.environ.get("TESTSPRITE_EMAIL")
+    password = os.environ.get("TESTSPRITE_PASSWORD")
+    if email and password:
+        return email, password
+    try:
+        with open(CREDENTIALS_PATH, encoding="utf-8") as f:
+            email, password = f.read().split("\n")[:2]
+    except (OSError, ValueError):
+        raise RuntimeError(
+            "no test credentials: set TESTSPRITE_EMAIL/TESTSPRITE_PASSWORD or run TC003 first"
+        ) from None
+    return email.strip(), password.strip()
+
+
+def session_storage_key():
+    """``localStorage`` key supabase-js uses for the session, if derivable."""
+    supabase_url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
+    if not supabase_url:
+        return None
+    return f"sb-{urlparse(supabase_url).hostname.split('.')[0]}-auth-token"
+
+
+def state_expires_at(state):
+    """Earliest expiry (epoch seconds) among the session entry and cookies."""
+    expiries = [
+        cookie["expires"] for cookie in state.get("cookies", [])
+        if cookie.get("expires", -1) > 0
+    ]
+    for origin in state.get("origins", []):
+        for item in origin.get("localStorage", []):
+            if item["name"].startswith("sb-") and item["name"].endswith("-auth-token"):
+                try:
+                    expires_at = json.loads(item["value"]).get("expires_at")
+                except (ValueError, AttributeError):
+                    expires_at = None
+                if expires_at:
+                    expiries.append(expires_at)
+    return min(expiries) if expiries else None
+
+
+def is_fresh(state, now=None):
+    expires_at = state_expires_at(state)
+    if expires_at is None:
+        return False
+    return expires_at - EXPIRY_MARGIN_SEC > (now or time.time())
+
+
+def _read_state():
+    try:
+        with open(STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_state(state):
+    """Atomically replace the cached state via a private (0600) per-process temp file."""
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = STATE_PATH.with_name(f"{STATE_PATH.stem}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, STATE_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _login_via_api(email, password):
+    """Build a storage state from ``POST /api/auth/login``; ``None`` if unusable."""
+    storage_key = session_storage_key()
+    if storage_key is None:
+        return None
+    request = urllib.request.Request(
+        f"{BASE_URL}/api/auth/login",
+        data=json.dumps({"email": email, "password": password}).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            session = json.load(response).get("session")
+    except (urllib.error.URLError, ValueError):
+        return None
+    if not session:
+        return None
+    return {
+        "cookies": [],
+        "origins": [{
+            "origin": BASE_URL,
+            "localStorage": [{"name": storage_key, "value": json.dumps(session)}],
+        }],
+    }
+
+
+async def _login_via_ui(browser, email, password):
+    """Sign in through the ``/login`` form and capture the context's state."""
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        await page.goto(f"{BASE_URL}/login", wait_until="domcontentloaded")
+        await page.locator("#email-address").fill(email)
+        await page.locator("#password").fill(password)
+        await page.locator("form button[type=submit]").click()
+        await page.wait_for_url(f"{BASE_URL}/", timeout=15000)
+        return await context.storage_state()
+    finally:
+        await context.close()
+
+
+async def storage_state(browser):
+    """Return a fresh authenticated storage state, logging in at most once.
+
+    The state is cached on disk at ``STATE_PATH`` so further workers and
+    later runs reuse it until it is about to expire.
+    """
+    async with _lock:
+        state = _read_state()
+        if state is not None and is_fresh(state):
+            return state
+        email, password = load_credentials()
+        state = await asyncio.to_thread(_login_via_api, email, password)
+        if state is None:
+            state = await _login_via_ui(browser, email, password)
+        _write_state(state)
+        return state
+
+
+async def authenticate(context):
+    """Inject the cached session into an already open ``context``.
+
+    For cases that first check anonymous behaviour and then continue as a
+    signed-in user; pages loaded afterwards see the session.
+    """
+    state = await storage_state(context.browser)
+    if state.get("cookies"):
+        await context.add_cookies(state["cookies"])
+    for origin in state.get("origins", []):
+        items = {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+        await context.add_init_script(
+            "if (location.origin === %s) {"
+            " for (const [k, v] of Object.entries(%s)) localStorage.setItem(k, v); }"
+            % (json.dumps(origin["origin"]), json.dumps(items))
+        )
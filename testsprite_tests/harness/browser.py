@@ -0,0 +1,98 @@
+"""Session-scoped Chromium pool shared by every TestSprite case.
+
+Launching Chromium is the largest fixed cost of a case, so one browser is
+started per run and each case receives its own fresh ``BrowserContext``
+(an isolated incognito profile) from it.
+"""
+
+import os
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+BASE_URL = os.environ.get("TESTSPRITE_BASE_URL", "http://localhost:3000").rstrip("/")
+
+LAUNCH_ARGS = [
+    "--window-size=1280,720",   # Match the viewport the cases were recorded at
+    "--disable-dev-shm-usage",  # Avoid using /dev/shm which can cause issues in containers
+]
+DEFAULT_TIMEOUT_MS = 5000
+
+
+class BrowserPool:
+    """One Playwright driver and one Chromium process for a whole run.
+
+    Use it as an async context manager and call :meth:`context` for every
+    case; contexts are cheap to create and fully isolated from each other.
+    """
+
+    def __init__(self, headless=True, launch_args=None):
+        self.headless = headless
+        self.launch_args = list(launch_args or LAUNCH_ARGS)
+        self._pw = None
+        self._browser = None
+
+    async def start(self):
+        if self._browser is None:
+            # Imported here so the pure-logic modules (plan, history, report...)
+            # import without Playwright installed.
+            from playwright import async_api
+
+            self._pw = await async_api.async_playwright().start()
+            self._browser = await self._pw.chromium.launch(
+                headless=self.headless, args=self.launch_args
+            )
+        return self
+
+    async def close(self):
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            await self._pw.stop()
+            self._pw = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def browser(self):
+        if self._browser is None:
+            raise RuntimeError("BrowserPool.start() has not been awaited")
+        return self._browser
+
+    @asynccontextmanager
+    async def context(self, **options):
+        """Yield a fresh ``BrowserContext`` and close it afterwards."""
+        context = await self.browser.new_context(**options)
+        context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        try:
+            yield context
+        finally:
+            await context.close()
+
+
+async def run_standalone(run_test):
+    """Run a single case's ``run_test(context)`` with a private pool."""
+    from .cases import context_options
+    from .evidence import attach
+    from .resources import SizeCache, apply_policy
+
+    module = sys.modules[run_test.__module__]
+    case_id = Path(module.__file__).stem.split("_", 1)[0]
+    size_cache = SizeCache()
+    async with BrowserPool() as pool:
+        options = await context_options(module, pool.browser)
+        async with pool.context(**options) as context:
+            await apply_policy(context, module, size_cache)
+            buffer = attach(context, case_id)
+            try:
+                await run_test(context)
+            except Exception as exc:
+                print(f"evidence -> {await buffer.dump(context, repr(exc))}", file=sys.stderr)
+                raise
+    size_cache.save()
@@ -0,0 +1,48 @@
+"""Discovery and loading of the ``TC*.py`` case modules."""
+
+import importlib
+import sys
+
+from .auth import storage_state
+from .browser import TESTS_DIR
+from .compiler import PLAN_PREFIX, compile_plan, load_compiled
+
+
+def discover_cases():
+    """Return ``{case_id: module_name}`` for every ``TCxxx_*.py`` file, sorted."""
+    cases = {}
+    for path in sorted(TESTS_DIR.glob("TC[0-9][0-9][0-9]_*.py")):
+        cases[path.stem.split("_", 1)[0]] = path.stem
+    return cases
+
+
+def discover_plan_cases():
+    """Return ``{case_id: "plan:<case_id>"}`` for every entry of the test plan."""
+    return {case_id: f"{PLAN_PREFIX}{case_id}" for case_id in compile_plan()}
+
+
+def load_case(module_name):
+    """Import a case module; it must define ``async def run_test(context)``.
+
+    ``plan:<case_id>`` names load the compiled plan entry instead.
+    """
+    if module_name.startswith(PLAN_PREFIX):
+        return load_compiled(module_name.split(":", 1)[1])
+    if str(TESTS_DIR) not in sys.path:
+        sys.path.insert(0, str(TESTS_DIR))
+    module = importlib.import_module(module_name)
+    if not hasattr(module, "run_test"):
+        raise AttributeError(f"{module_name} does not define run_test(context)")
+    return module
+
+
+async def context_options(module, browser):
+    """``new_context`` keyword arguments implied by a case's declarations.
+
+    ``REQUIRES_AUTH = True`` starts the case from the cached signed-in
+    storage state (see :mod:`harness.auth`).
+    """
+    options = {}
+    if getattr(module, "REQUIRES_AUTH", False):
+        options["storage_state"] = await storage_state(browser)
+    return options
@@ -0,0 +1,165 @@
+"""Compile ``testsprite_frontend_test_plan.json`` into runnable cases.
+
+Each plan entry becomes a :class:`CompiledCase` that quacks like a ``TC*.py``
+module (``run_test``, ``DEPENDS_ON``, ``REQUIRES_AUTH``,
+``RESOURCE_POLICY``), so the scheduler runs it unchanged. Steps with a
+``run`` entry execute through :mod:`harness.steps` on one shared page;
+steps without one are reported as pending rather than silently passing.
+
+The validated step graph is cached in ``tmp/compiled_plan.json`` keyed by
+a hash of the plan, the step vocabulary and the selector names, so
+unchanged plans are not recompiled by every worker process.
+``python -m harness.compiler`` prints how much of each case is executable.
+"""
+
+import hashlib
+import json
+import sys
+import time
+
+from .browser import TESTS_DIR
+from .plan import PLAN_PATH
+from .selectors import SELECTORS, candidates
+from .steps import MODIFIERS, OPS, StepContext
+
+CACHE_PATH = TESTS_DIR / "tmp" / "compiled_plan.json"
+PLAN_PREFIX = "plan:"
+
+
+class CompileError(ValueError):
+    pass
+
+
+def _compile_op(case_id, index, spec):
+    if not isinstance(spec, dict):
+        raise CompileError(f"{case_id} step {index}: run entries must be objects, got {spec!r}")
+    ops = [key for key in spec if key in OPS]
+    unknown = set(spec) - set(OPS) - MODIFIERS
+    if len(ops) != 1 or unknown:
+        raise CompileError(
+            f"{case_id} step {index}: expected exactly one of {sorted(OPS)}"
+            + (f", unknown keys {sorted(unknown)}" if unknown else "")
+        )
+    targets = spec[ops[0]]
+    if isinstance(targets, str):
+        targets = [targets]
+    for target in targets if isinstance(targets, list) else []:
+        if target.startswith("sel:"):
+            name, _, arg = target[len("sel:"):].partition(":")
+            try:
+                candidates(name, arg or None)
+            except (KeyError, ValueError) as e:
+                raise CompileError(f"{case_id} step {index}: {e.args[0]}") from None
+    return [ops[0], spec]
+
+
+def compile_entry(entry):
+    """Validate one plan entry and return its JSON-serialisable step graph."""
+    steps = []
+    for index, step in enumerate(entry.get("steps", []), start=1):
+        run = step.get("run")
+        specs = [] if run is None else run if isinstance(run, list) else [run]
+        steps.append({
+            "index": index,
+            "type": step.get("type", "action"),
+            "description": step.get("description", ""),
+            "ops": [_compile_op(entry["id"], index, spec) for spec in specs],
+        })
+    return {
+        "id": entry["id"],
+        "title": entry.get("title", ""),
+        "dependsOn": list(entry.get("dependsOn", [])),
+        "requiresAuth": bool(entry.get("requiresAuth", False)),
+        "resourcePolicy": entry.get("resourcePolicy", "full"),
+        "steps": steps,
+    }
+
+
+def _cache_key(plan_bytes):
+    digest = hashlib.sha256(plan_bytes)
+    digest.update(",".join(sorted(OPS) + sorted(MODIFIERS) + sorted(SELECTORS)).encode())
+    return digest.hexdigest()
+
+
+def compile_plan(path=PLAN_PATH, cache_path=CACHE_PATH):
+    """Return ``{case_id: step graph}``, reusing the on-disk cache when valid."""
+    plan_bytes = path.read_bytes()
+    key = _cache_key(plan_bytes)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached["cases"]
+    except (OSError, ValueError):
+        pass
+    compiled = {entry["id"]: compile_entry(entry) for entry in json.loads(plan_bytes)}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "cases": compiled}, f, ensure_ascii=False)
+    tmp_path.replace(cache_path)
+    return compiled
+
+
+class CompiledCase:
+    """A plan entry exposed with the same interface as a ``TC*.py`` module."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.__name__ = f"{PLAN_PREFIX}{graph['id']}"
+        self.DEPENDS_ON = graph["dependsOn"]
+        self.REQUIRES_AUTH = graph["requiresAuth"]
+        self.RESOURCE_POLICY = graph["resourcePolicy"]
+        self.step_results = []
+
+    @property
+    def pending_steps(self):
+        return [step for step in self.graph["steps"] if not step["ops"]]
+
+    async def run_test(self, context):
+        ctx = StepContext(context)
+        self.step_results = []
+        for step in self.graph["steps"]:
+            if not step["ops"]:
+                self.step_results.append(
+                    {"index": step["index"], "description": step["description"], "status": "PENDING", "ms": 0}
+                )
+                continue
+            started = time.perf_counter()
+            try:
+                for name, spec in step["ops"]:
+                    await OPS[name](ctx, spec)
+            except Exception as exc:
+                self.step_results.append({
+                    "index": step["index"], "description": step["description"], "status": "FAILED",
+                    "ms": round((time.perf_counter() - started) * 1000, 1),
+                })
+                raise AssertionError(
+                    f"{self.graph['id']} step {step['index']} ({step['description']}): {exc}"
+                ) from exc
+            self.step_results.append({
+                "index": step["index"], "description": step["description"], "status": "PASSED",
+                "ms": round((time.perf_counter() - started) * 1000, 1),
+            })
+
+
+_loaded = {}
+
+
+def load_compiled(case_id):
+    """Return the :class:`CompiledCase` for ``case_id`` (memoised per process)."""
+    if not _loaded:
+        _loaded.update({cid: CompiledCase(graph) for cid, graph in compile_plan().items()})
+    return _loaded[case_id]
+
+
+def main():
+    compiled = compile_plan()
+    for case_id, graph in compiled.items():
+        runnable = sum(1 for step in graph["steps"] if step["ops"])
+        print(f"{case_id}: {runnable}/{len(graph['steps'])} steps executable  {graph['title']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
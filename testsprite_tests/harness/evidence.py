@@ -0,0 +1,183 @@
+"""Failure-only evidence from a bounded in-memory ring buffer.
+
+Playwright tracing on every run costs seconds and megabytes per case. This
+keeps just the last few steps instead: after every :func:`harness.waits.goto`
+and :func:`harness.waits.click` a low-quality JPEG and the DOM are pushed
+into a fixed-size deque, next to bounded deques of console messages and
+network events. Nothing touches the disk unless the case fails; then the
+buffer plus a final snapshot is written as::
+
+    tmp/evidence/<case>-<timestamp>.zip   summary.json, steps/NN-*.jpg|html, console.jsonl
+    tmp/evidence/<case>-<timestamp>.har   the buffered network events (HAR 1.2)
+
+Credentials in headers are redacted before anything is written.
+"""
+
+import io
+import json
+import re
+import time
+import weakref
+import zipfile
+from collections import deque
+from datetime import datetime, timezone
+
+from .browser import TESTS_DIR
+
+EVIDENCE_DIR = TESTS_DIR / "tmp" / "evidence"
+DEFAULT_STEPS = 5
+CONSOLE_LIMIT = 200
+NETWORK_LIMIT = 500
+SCREENSHOT_QUALITY = 40
+REDACTED_HEADERS = {"authorization", "cookie", "set-cookie", "apikey", "x-supabase-auth"}
+
+_buffers = weakref.WeakKeyDictionary()
+
+
+def _headers(headers):
+    return [
+        {"name": name, "value": "[redacted]" if name.lower() in REDACTED_HEADERS else value}
+        for name, value in headers.items()
+    ]
+
+
+def _iso(epoch_ms):
+    return datetime.fromtimestamp(epoch_ms / 1000, timezone.utc).isoformat()
+
+
+class EvidenceBuffer:
+    """The last ``steps`` snapshots plus recent console and network events of one context."""
+
+    def __init__(self, case_id, steps=DEFAULT_STEPS):
+        self.case_id = case_id
+        self.snapshots = deque(maxlen=steps)
+        self.console = deque(maxlen=CONSOLE_LIMIT)
+        self.network = deque(maxlen=NETWORK_LIMIT)
+        self.step_count = 0
+        self._responses = weakref.WeakKeyDictionary()
+
+    def watch_page(self, page):
+        page.on("console", lambda msg: self.console.append({
+            "t": time.time(), "type": msg.type, "text": msg.text, "page": page.url,
+        }))
+        page.on("pageerror", lambda error: self.console.append({
+            "t": time.time(), "type": "pageerror", "text": str(error), "page": page.url,
+        }))
+
+    def on_response(self, response):
+        self._responses[response.request] = response
+
+    def on_request_done(self, request):
+        response = self._responses.pop(request, None)
+        self.network.append({
+            "method": request.method,
+            "url": request.url,
+            "resourceType": request.resource_type,
+            "requestHeaders": request.headers,
+            "status": response.status if response else 0,
+            "statusText": response.status_text if response else "",
+            "responseHeaders": response.headers if response else {},
+            "timing": request.timing,
+            "failure": request.failure,
+        })
+
+    async def checkpoint(self, page, label):
+        """Push a screenshot and DOM snapshot of ``page`` after a step."""
+        from playwright import async_api
+
+        self.step_count += 1
+        try:
+            image = await page.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY, scale="css")
+            html = await page.content()
+        except async_api.Error:
+            # The page may be mid-navigation or already closed.
+            return
+        self.snapshots.append({
+            "index": self.step_count, "label": label, "url": page.url,
+            "t": time.time(), "image": image, "html": html,
+        })
+
+    def har(self):
+        entries = []
+        for event in self.network:
+            timing = event["timing"] or {}
+            start = timing.get("startTime", 0)
+            request_start = timing.get("requestStart", -1)
+            response_start = timing.get("responseStart", -1)
+            response_end = timing.get("responseEnd", -1)
+            entries.append({
+                "startedDateTime": _iso(start) if start else _iso(time.time() * 1000),
+                "time": max(response_end, 0),
+                "request": {
+                    "method": event["method"], "url": event["url"], "httpVersion": "HTTP/1.1",
+                    "headers": _headers(event["requestHeaders"]), "cookies": [],
+                    "queryString": [], "headersSize": -1, "bodySize": -1,
+                },
+                "response": {
+                    "status": event["status"], "statusText": event["statusText"],
+                    "httpVersion": "HTTP/1.1", "headers": _headers(event["responseHeaders"]),
+                    "cookies": [], "redirectURL": "", "headersSize": -1, "bodySize": -1,
+                    "content": {"size": -1, "mimeType": event["responseHeaders"].get("content-type", "")},
+                },
+                "cache": {},
+                "timings": {
+                    "send": 0,
+                    "wait": max(response_start - request_start, 0) if request_start >= 0 else -1,
+                    "receive": max(response_end - response_start, 0) if response_start >= 0 else -1,
+                },
+                "_resourceType": event["resourceType"],
+                "_failure": event["failure"],
+            })
+        return {"log": {
+            "version": "1.2",
+            "creator": {"name": "testsprite-harness", "version": "1"},
+            "pages": [],
+            "entries": entries,
+        }}
+
+    async def dump(self, context, error):
+        """Write the zip and HAR for a failed case and return the zip path."""
+        pages = [page for page in context.pages if not page.is_closed()]
+        if pages:
+            await self.checkpoint(pages[-1], "failure")
+        EVIDENCE_DIR.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.case_id}-{time.strftime('%Y%m%dT%H%M%S')}"
+        zip_path = EVIDENCE_DIR / f"{stem}.zip"
+        har_path = EVIDENCE_DIR / f"{stem}.har"
+        summary = {
+            "caseId": self.case_id,
+            "error": error,
+            "har": har_path.name,
+            "steps": [{k: s[k] for k in ("index", "label", "url", "t")} for s in self.snapshots],
+        }
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("summary.json", json.dumps(summary, ensure_ascii=False, indent=2))
+            for snap in self.snapshots:
+                name = f"steps/{snap['index']:02d}-{re.sub(r'[^A-Za-z0-9]+', '-', snap['label']).strip('-')}"
+                archive.writestr(f"{name}.jpg", snap["image"])
+                archive.writestr(f"{name}.html", snap["html"])
+            archive.writestr("console.jsonl", "".join(
+                json.dumps(entry, ensure_ascii=False) + "\n" for entry in self.console
+            ))
+        zip_path.write_bytes(buffer.getvalue())
+        with open(har_path, "w", encoding="utf-8") as f:
+            json.dump(self.har(), f, ensure_ascii=False)
+        return zip_path
+
+
+def attach(context, case_id, steps=DEFAULT_STEPS):
+    """Start buffering for ``context``; the buffer dies with it unless dumped."""
+    buffer = EvidenceBuffer(case_id, steps)
+    for page in context.pages:
+        buffer.watch_page(page)
+    context.on("page", buffer.watch_page)
+    context.on("response", buffer.on_response)
+    context.on("requestfinished", buffer.on_request_done)
+    context.on("requestfailed", buffer.on_request_done)
+    _buffers[context] = buffer
+    return buffer
+
+
+def buffer_for(page):
+    return _buffers.get(page.context)
@@ -0,0 +1,161 @@
+"""Per-case outcome and duration history in a local SQLite store.
+
+Every attempt of every case (retries included) is stored in
+``tmp/harness_history.sqlite`` after a run. From the last
+:data:`WINDOW` attempts of a case this derives:
+
+* a **flake score**: the share of consecutive attempts whose outcome
+  flipped. A case that always fails scores 0 (a real failure); one that
+  alternates scores close to 1.
+* **quarantine**: cases scoring at least :data:`QUARANTINE_SCORE` over at
+  least :data:`MIN_ATTEMPTS` attempts still run, but their failures no
+  longer fail the run.
+* **expected durations**: the median of recent passing attempts, used by
+  :func:`harness.scheduler.plan_shards` to balance shards by time.
+
+::
+
+    python -m harness.history               # table of every case with history
+    python -m harness.history TC006 --last 10
+"""
+
+import argparse
+import sqlite3
+import statistics
+import sys
+from contextlib import closing
+
+from .browser import TESTS_DIR
+from .plan import estimated_cost
+
+HISTORY_PATH = TESTS_DIR / "tmp" / "harness_history.sqlite"
+WINDOW = 20
+MIN_ATTEMPTS = 5
+QUARANTINE_SCORE = 0.3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    run_started TEXT NOT NULL,
+    commit_sha TEXT,
+    case_id TEXT NOT NULL,
+    attempt INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    duration_sec REAL NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS attempts_case ON attempts (case_id, id);
+"""
+
+
+def connect(path=HISTORY_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def record_run(results, run_started, commit, path=HISTORY_PATH):
+    """Store every attempt of ``results``; blocked cases never ran and are skipped."""
+    rows = [
+        (run_started, commit, result["caseId"], index, a["status"], a["durationSec"], a["error"] or None)
+        for result in results
+        for index, a in enumerate(result.get("attempts", []), start=1)
+    ]
+    with closing(connect(path)) as conn, conn:
+        conn.executemany(
+            "INSERT INTO attempts (run_started, commit_sha, case_id, attempt, status, duration_sec, error) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    return len(rows)
+
+
+def recent(conn, case_id, limit=WINDOW):
+    """The last ``limit`` attempts of ``case_id`` as ``(status, duration_sec)``, oldest first."""
+    rows = conn.execute(
+        "SELECT status, duration_sec FROM attempts WHERE case_id = ? ORDER BY id DESC LIMIT ?",
+        (case_id, limit),
+    ).fetchall()
+    return rows[::-1]
+
+
+def flake_score(statuses):
+    if len(statuses) < 2:
+        return 0.0
+    flips = sum(a != b for a, b in zip(statuses, statuses[1:]))
+    return flips / (len(statuses) - 1)
+
+
+def case_stats(case_ids, path=HISTORY_PATH):
+    """``{case_id: {attempts, passRate, flakeScore, quarantined, medianSec}}`` for cases with history."""
+    if not path.exists():
+        return {}
+    stats = {}
+    with closing(connect(path)) as conn:
+        for case_id in case_ids:
+            rows = recent(conn, case_id)
+            if not rows:
+                continue
+            statuses = [status for status, _ in rows]
+            passing = [duration for status, duration in rows if status == "PASSED"]
+            score = flake_score(statuses)
+            stats[case_id] = {
+                "attempts": len(rows),
+                "passRate": statuses.count("PASSED") / len(rows),
+                "flakeScore": score,
+                "quarantined": len(rows) >= MIN_ATTEMPTS and score >= QUARANTINE_SCORE,
+                "medianSec": statistics.median(passing or [d for _, d in rows]),
+            }
+    return stats
+
+
+def quarantined(case_ids, path=HISTORY_PATH):
+    return {case_id for case_id, s in case_stats(case_ids, path).items() if s["quarantined"]}
+
+
+def expected_durations(case_ids, plan, path=HISTORY_PATH):
+    """Seconds each case is expected to take, or ``None`` without any history.
+
+    Cases with no history of their own are estimated from their step count
+    at the median seconds-per-step of the cases that have one.
+    """
+    stats = case_stats(case_ids, path)
+    if not stats:
+        return None
+    per_step = statistics.median(
+        s["medianSec"] / estimated_cost(plan.get(case_id, {})) for case_id, s in stats.items()
+    )
+    return {
+        case_id: stats[case_id]["medianSec"] if case_id in stats
+        else per_step * estimated_cost(plan.get(case_id, {}))
+        for case_id in case_ids
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.history",
+                                     description="Show per-case flake scores and durations.")
+    parser.add_argument("cases", nargs="*", help="case ids (default: every case with history)")
+    parser.add_argument("--last", type=int, help="also list this many recent attempts per case")
+    args = parser.parse_args(argv)
+    if not HISTORY_PATH.exists():
+        print(f"no history yet at {HISTORY_PATH}", file=sys.stderr)
+        return 2
+    with closing(connect()) as conn:
+        case_ids = args.cases or [row[0] for row in conn.execute(
+            "SELECT DISTINCT case_id FROM attempts ORDER BY case_id")]
+        stats = case_stats(case_ids)
+        print(f"{'case':<8} {'attempts':>8} {'pass':>6} {'flake':>6} {'median':>8}")
+        for case_id, s in stats.items():
+            flag = "  QUARANTINED" if s["quarantined"] else ""
+            print(f"{case_id:<8} {s['attempts']:>8} {s['passRate']:>6.0%} {s['flakeScore']:>6.2f} "
+                  f"{s['medianSec']:>7.1f}s{flag}")
+            if args.last:
+                for status, duration in recent(conn, case_id, args.last):
+                    print(f"    {status:<7} {duration:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+"""Image payload audit across the main routes.
+
+Visits :data:`ROUTES` concurrently (one context each, default desktop
+viewport), scrolls each page to the bottom so lazy images load, and joins
+every image response (status, transfer bytes, MIME type) with the ``<img>``
+elements that displayed it (natural size, rendered box, ``next/image`` or
+not). Per route it reports:
+
+* **broken** images: HTTP errors, failed requests and images that
+  completed without decoding;
+* **oversized** images: more than :data:`OVERSIZE_AREA` times the pixels
+  the rendered box needs at the device pixel ratio;
+* **unoptimized** images: served around ``next/image`` as JPEG/PNG/GIF
+  above :data:`UNOPTIMIZED_MIN_BYTES`;
+* **potential savings**: oversized bytes scaled by the pixels that are not
+  needed, plus :data:`FORMAT_SAVINGS` of unoptimized bytes (an estimate of
+  what WebP/AVIF would save).
+
+The audit is written to ``tmp/image_audit.json``. ``tmp/image_budget.json``
+holds per-route limits (today's weight plus :data:`BUDGET_HEADROOM`); a run
+exceeding them exits non-zero. Each route also gets a target of today's weight
+minus the potential savings, which is reported but not enforced::
+
+    python -m harness.images                      # audit and check the budget
+    python -m harness.images --update-budget      # accept the current weight as the budget
+    python -m harness.images --route / --route /recruit
+"""
+
+import argparse
+import asyncio
+import json
+import string
+import sys
+import time
+from urllib.parse import quote, urlparse
+
+from playwright import async_api
+
+from .browser import BASE_URL, TESTS_DIR, BrowserPool
+from .perf import current_commit
+from .waits import goto, settle
+
+AUDIT_PATH = TESTS_DIR / "tmp" / "image_audit.json"
+BUDGET_PATH = TESTS_DIR / "tmp" / "image_budget.json"
+
+# ``{project}``/``{creator}`` are filled from the first project of ``GET /api/projects``.
+ROUTES = ["/", "/project/{project}", "/creator/{creator}", "/recruit", "/category/{category}"]
+DEFAULT_CATEGORY = "graphic-design"
+OVERSIZE_AREA = 2.0
+UNOPTIMIZED_MIN_BYTES = 10 * 1024
+FORMAT_SAVINGS = 0.3
+LEGACY_FORMATS = {"image/jpeg", "image/png", "image/gif"}
+BUDGET_HEADROOM = 1.1
+SCROLL_STEP_PX = 800
+SCROLL_LIMIT = 40
+
+_IMAGES_SCRIPT = """
+() => [...document.images].map(img => {
+  const box = img.getBoundingClientRect();
+  return {
+    src: img.currentSrc || img.src,
+    naturalWidth: img.naturalWidth,
+    naturalHeight: img.naturalHeight,
+    width: box.width,
+    height: box.height,
+    complete: img.complete,
+    nextImage: img.hasAttribute('data-nimg'),
+    loading: img.loading,
+  };
+})
+"""
+
+
+async def route_params(context):
+    """Values for the ``{}`` slots of :data:`ROUTES` from the live API."""
+    params = {"category": DEFAULT_CATEGORY, "project": None, "creator": None}
+    response = await context.request.get(f"{BASE_URL}/api/projects?page=1&limit=1")
+    if response.ok:
+        projects = (await response.json()).get("projects") or []
+        if projects:
+            params["project"] = projects[0]["project_id"]
+            username = (projects[0].get("User") or {}).get("username")
+            params["creator"] = quote(username) if username else None
+    return params
+
+
+async def _scroll_to_bottom(page):
+    last = -1
+    for _ in range(SCROLL_LIMIT):
+        height = await page.evaluate("() => document.documentElement.scrollHeight")
+        position = await page.evaluate(f"() => (window.scrollBy(0, {SCROLL_STEP_PX}), window.scrollY)")
+        if position == last or position + SCROLL_STEP_PX >= height:
+            break
+        last = position
+        await settle(page, 500)
+    await settle(page, 2000)
+
+
+def _is_unoptimized(entry):
+    return (not entry["nextImage"] and entry["mime"] in LEGACY_FORMATS
+            and entry["bytes"] >= UNOPTIMIZED_MIN_BYTES)
+
+
+def analyse(responses, elements, dpr):
+    """Join responses with ``<img>`` elements and classify them; returns the route summary."""
+    by_url = {}
+    for element in elements:
+        by_url.setdefault(element["src"], []).append(element)
+    images, broken, oversized, unoptimized = [], [], [], []
+    savings = 0
+    for url, response in responses.items():
+        shown = by_url.get(url, [])
+        rendered = max(((e["width"] * dpr) * (e["height"] * dpr) for e in shown), default=0)
+        natural = max((e["naturalWidth"] * e["naturalHeight"] for e in shown), default=0)
+        entry = {
+            "url": url,
+            "status": response["status"],
+            "mime": response["mime"],
+            "bytes": response["bytes"],
+            "failure": response["failure"],
+            "natural": [max((e["naturalWidth"] for e in shown), default=0),
+                        max((e["naturalHeight"] for e in shown), default=0)],
+            "rendered": [round(max((e["width"] for e in shown), default=0)),
+                         round(max((e["height"] for e in shown), default=0))],
+            "decodedBytes": natural * 4,
+            "nextImage": any(e["nextImage"] for e in shown),
+        }
+        images.append(entry)
+        if response["failure"] or (response["status"] or 0) >= 400 or any(
+            e["complete"] and not e["naturalWidth"] for e in shown
+        ):
+            broken.append(url)
+            continue
+        if rendered and natural > OVERSIZE_AREA * rendered:
+            waste = int(entry["bytes"] * (1 - rendered / natural))
+            oversized.append({"url": url, "savingsBytes": waste})
+            savings += waste
+        elif _is_unoptimized(entry):
+            waste = int(entry["bytes"] * FORMAT_SAVINGS)
+            unoptimized.append({"url": url, "savingsBytes": waste})
+            savings += waste
+    # Elements whose request never produced a response (blocked, data: URLs are skipped).
+    for url, shown in by_url.items():
+        if url and url not in responses and not url.startswith("data:") and any(
+            e["complete"] and not e["naturalWidth"] for e in shown
+        ):
+            broken.append(url)
+    return {
+        "requests": len(responses),
+        "bytes": sum(r["bytes"] for r in responses.values()),
+        "decodedBytes": sum(i["decodedBytes"] for i in images),
+        "potentialSavingsBytes": savings,
+        "broken": sorted(set(broken)),
+        "oversized": sorted(oversized, key=lambda o: -o["savingsBytes"]),
+        "unoptimized": sorted(unoptimized, key=lambda o: -o["savingsBytes"]),
+        "images": images,
+    }
+
+
+async def audit_route(pool, route):
+    """Load ``route`` in a fresh context and return its summary."""
+    responses = {}
+    pending = []
+
+    async def record(request):
+        if request.resource_type != "image":
+            return
+        response = await request.response()
+        try:
+            size = (await request.sizes())["responseBodySize"]
+        except async_api.Error:
+            size = 0
+        responses[request.url] = {
+            "status": response.status if response else None,
+            "mime": (response.headers.get("content-type", "").split(";")[0] if response else ""),
+            "bytes": size,
+            "failure": request.failure,
+        }
+
+    async with pool.context() as context:
+        context.on("requestfinished", lambda request: pending.append(asyncio.ensure_future(record(request))))
+        context.on("requestfailed", lambda request: pending.append(asyncio.ensure_future(record(request))))
+        page = await context.new_page()
+        try:
+            await goto(page, route)
+        except async_api.Error as exc:
+            return {"error": str(exc).splitlines()[0]}
+        await _scroll_to_bottom(page)
+        elements = await page.evaluate(_IMAGES_SCRIPT)
+        dpr = await page.evaluate("() => window.devicePixelRatio")
+        await asyncio.gather(*pending, return_exceptions=True)
+    return analyse(responses, elements, dpr)
+
+
+async def run_audit(routes=None):
+    """``{route: summary}`` for every route, audited concurrently on one browser."""
+    async with BrowserPool() as pool:
+        async with pool.context() as context:
+            params = await route_params(context)
+        concrete = []
+        for route in routes or ROUTES:
+            fields = {name for _, name, _, _ in string.Formatter().parse(route) if name}
+            if any(params.get(name) is None for name in fields):
+                print(f"skipping {route}: no project data to fill it", file=sys.stderr)
+                continue
+            concrete.append((route, route.format(**params)))
+        summaries = await asyncio.gather(*(audit_route(pool, path) for _, path in concrete))
+    return {route: {"path": path, **summary} for (route, path), summary in zip(concrete, summaries)}
+
+
+def budget_from(audit):
+    """Per-route limits: today's weight plus headroom.
+
+    Images broken today are allowed so that only new breakage fails the check.
+    ``targetImageBytes`` (today's weight minus the known savings) is only
+    reported, never enforced.
+    """
+    return {
+        route: {
+            "maxImageBytes": int(summary["bytes"] * BUDGET_HEADROOM),
+            "targetImageBytes": summary["bytes"] - summary["potentialSavingsBytes"],
+            "maxRequests": int(summary["requests"] * BUDGET_HEADROOM) + 1,
+            "maxBroken": len(summary["broken"]),
+        }
+        for route, summary in audit.items() if "error" not in summary
+    }
+
+
+def check_budget(audit, budget):
+    problems = []
+    for route, limits in budget.items():
+        summary = audit.get(route)
+        if summary is None or "error" in summary:
+            continue
+        if summary["bytes"] > limits["maxImageBytes"]:
+            problems.append(f"{route}: {summary['bytes'] / 1024:.0f} KiB of images > "
+                            f"{limits['maxImageBytes'] / 1024:.0f} KiB")
+        if summary["requests"] > limits["maxRequests"]:
+            problems.append(f"{route}: {summary['requests']} image requests > {limits['maxRequests']}")
+        if len(summary["broken"]) > limits["maxBroken"]:
+            problems.append(f"{route}: {len(summary['broken'])} broken image(s)")
+    return problems
+
+
+def missed_targets(audit, budget):
+    """Routes still heavier than their ``targetImageBytes``; informational only."""
+    missed = []
+    for route, limits in budget.items():
+        summary = audit.get(route)
+        target = limits.get("targetImageBytes")
+        if summary is None or "error" in summary or target is None:
+            continue
+        if summary["bytes"] > target:
+            missed.append(f"{route}: {summary['bytes'] / 1024:.0f} KiB of images, "
+                          f"{(summary['bytes'] - target) / 1024:.0f} KiB above the {target / 1024:.0f} KiB target")
+    return missed
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.images",
+                                     description="Audit image bytes, formats and sizes per route.")
+    parser.add_argument("--route", action="append", dest="routes", help="route template to audit (repeatable)")
+    parser.add_argument("--update-budget", action="store_true", help="write the budget from this audit")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    audit = asyncio.run(run_audit(args.routes))
+    _write_json(AUDIT_PATH, {"commit": current_commit(), "startedAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                             "baseUrl": BASE_URL, "routes": audit})
+    print(f"{'route':<24} {'images':>6} {'KiB':>8} {'decoded MiB':>11} {'save KiB':>9} "
+          f"{'broken':>6} {'oversize':>8} {'legacy':>6}")
+    for route, summary in audit.items():
+        if "error" in summary:
+            print(f"{route:<24} error: {summary['error']}")
+            continue
+        print(f"{route:<24} {summary['requests']:>6} {summary['bytes'] / 1024:>8.0f} "
+              f"{summary['decodedBytes'] / 1024 / 1024:>11.1f} "
+              f"{summary['potentialSavingsBytes'] / 1024:>9.0f} {len(summary['broken']):>6} "
+              f"{len(summary['oversized']):>8} {len(summary['unoptimized']):>6}")
+        for url in summary["broken"][:5]:
+            print(f"    broken: {urlparse(url).path or url}")
+    print(f"audit -> {AUDIT_PATH} ({time.perf_counter() - started:.1f}s)")
+
+    if args.update_budget or not BUDGET_PATH.exists():
+        _write_json(BUDGET_PATH, budget_from(audit))
+        print(f"budget -> {BUDGET_PATH}")
+        return 0
+    with open(BUDGET_PATH, encoding="utf-8") as f:
+        budget = json.load(f)
+    for missed in missed_targets(audit, budget):
+        print(f"above target {missed}")
+    problems = check_budget(audit, budget)
+    for problem in problems:
+        print(f"OVER BUDGET {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""Pick the cases a change can affect instead of running all of them.
+
+``tmp/code_summary.json`` maps features to the source files that implement
+them, and each plan entry lists the ``features`` its case exercises. A diff
+is mapped to cases in three steps:
+
+1. every changed file under ``src/`` is expanded to the files that import
+   it, transitively (``@/`` aliases and relative specifiers are resolved;
+   an App Router ``layout``/``template``/``loading``/``error`` file counts
+   as imported by every page below it);
+2. the expanded set is intersected with the feature index, extended by
+   :data:`EXTRA_FEATURES` for routes the summary does not cover;
+3. the features select the plan entries that declare them.
+
+A change to a shared file (:data:`SHARED_PATTERNS`, or anything the root
+layout imports) or to a ``src/`` file no feature reaches selects the full
+suite, so a miss in the index costs time rather than coverage::
+
+    python -m harness.impact                  # diff against origin/main, print the cases
+    python -m harness.impact main --explain
+    python -m harness --changed origin/main   # run only the affected cases
+"""
+
+import argparse
+import fnmatch
+import json
+import re
+import subprocess
+import sys
+from pathlib import PurePosixPath
+
+from .browser import TESTS_DIR
+from .plan import load_plan
+
+REPO_DIR = TESTS_DIR.parent
+CODE_SUMMARY_PATH = TESTS_DIR / "tmp" / "code_summary.json"
+DEFAULT_BASE = "origin/main"
+
+SOURCE_SUFFIXES = (".ts", ".tsx", ".js", ".jsx", ".mts")
+# Route segment files that wrap every page below their directory.
+SEGMENT_FILES = {"layout", "template", "loading", "error"}
+ROOT_LAYOUT = "src/app/layout.tsx"
+
+# Changes here can break any page: run everything.
+SHARED_PATTERNS = [
+    "src/app/layout.tsx", "src/app/template.tsx", "src/app/globals.css", "src/middleware.ts",
+    "src/providers/*", "package.json", "package-lock.json", "next.config.*", "tailwind.config.*",
+    "postcss.config.*", "tsconfig.json", ".env*", "supabase/*",
+    "testsprite_tests/harness/*", "testsprite_tests/testsprite_frontend_test_plan.json",
+]
+# Changes here cannot affect a browser run.
+IGNORED_PATTERNS = [
+    "*.md", "docs/*", "scripts/*", "session-logs/*", "requests.jsonl", "eslint.config.*",
+    "vercel.json", "testsprite_tests/load/*", "testsprite_tests/tests/*", "testsprite_tests/tmp/*",
+    "testsprite_tests/*.html", "testsprite_tests/*.json", "testsprite_tests/*.txt",
+]
+# Files and directories (trailing ``/``) that code_summary.json leaves out,
+# mostly API routes, which pages reach via fetch rather than import.
+EXTRA_FEATURES = {
+    "Main Landing Page": ["src/app/api/banners/"],
+    "Authentication": ["src/app/auth/", "src/app/api/auth/"],
+    "Dashboard": ["src/app/mypage/"],
+    "Marketplace": ["src/app/recruit/", "src/app/api/recruit-items/", "src/app/api/proposals/"],
+    "Submission": ["src/app/submission/"],
+    "Project Detail": [
+        "src/components/ProjectDetailModal.tsx", "src/components/ProjectDetailModalV2.tsx",
+        "src/app/project/", "src/app/api/projects/", "src/app/api/likes/", "src/app/api/comments/",
+    ],
+    "Creator Profile": ["src/app/creator/", "src/app/api/follows/", "src/app/api/users/"],
+    "Error Pages": ["src/app/not-found.tsx", "src/app/error.tsx", "src/components/ErrorBoundary.tsx"],
+}
+
+_IMPORT_RE = re.compile(
+    r"""(?:\bimport\s+(?:type\s+)?(?:[\w*{}\s,]+\s+from\s+)?|\bexport\s+[\w*{}\s,]+\s+from\s+"""
+    r"""|\bimport\s*\(\s*|\brequire\s*\(\s*)["']([^"']+)["']"""
+)
+
+
+def _matches(path, patterns):
+    return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+
+
+def changed_files(base=DEFAULT_BASE):
+    """Repo-relative paths changed since the merge base with ``base``, plus uncommitted work."""
+    commands = [
+        ["git", "diff", "--name-only", f"{base}...HEAD"],
+        ["git", "diff", "--name-only", "HEAD"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]
+    files = set()
+    for command in commands:
+        out = subprocess.run(command, cwd=REPO_DIR, capture_output=True, text=True, check=True).stdout
+        files.update(line.strip() for line in out.splitlines() if line.strip())
+    return sorted(files)
+
+
+def load_features(path=CODE_SUMMARY_PATH):
+    """``{feature: [file or directory/]}`` from the code summary plus :data:`EXTRA_FEATURES`."""
+    with open(path, encoding="utf-8") as f:
+        summary = json.load(f)
+    features = {entry["name"]: list(entry["files"]) for entry in summary["features"]}
+    for name, files in EXTRA_FEATURES.items():
+        features.setdefault(name, []).extend(files)
+    return features
+
+
+def _resolve(importer, specifier, known):
+    if specifier.startswith("@/"):
+        base = PurePosixPath("src") / specifier[2:]
+    elif specifier.startswith("."):
+        base = PurePosixPath(importer).parent / specifier
+    else:
+        return None
+    # Normalise "a/../b" without touching the filesystem.
+    parts = []
+    for part in base.parts:
+        if part == "..":
+            if parts:
+                parts.pop()
+        elif part != ".":
+            parts.append(part)
+    stem = "/".join(parts)
+    candidates = [stem] + [stem + s for s in SOURCE_SUFFIXES] + [f"{stem}/index{s}" for s in SOURCE_SUFFIXES]
+    return next((c for c in candidates if c in known), None)
+
+
+def import_graph(root=REPO_DIR):
+    """``{file: {files that import it}}`` over ``src/``, paths relative to ``root``."""
+    files = {
+        path.relative_to(root).as_posix(): path
+        for path in (root / "src").rglob("*")
+        if path.is_file() and (path.suffix in SOURCE_SUFFIXES or path.suffix == ".css")
+    }
+    importers = {name: set() for name in files}
+    for name, path in files.items():
+        if path.suffix == ".css":
+            continue
+        text = path.read_text(encoding="utf-8", errors="replace")
+        for specifier in _IMPORT_RE.findall(text):
+            target = _resolve(name, specifier, files)
+            if target is not None and target != name:
+                importers[target].add(name)
+    pages = [name for name in files if PurePosixPath(name).stem == "page"]
+    for name in files:
+        segment = PurePosixPath(name)
+        if segment.stem in SEGMENT_FILES and segment.suffix in SOURCE_SUFFIXES:
+            directory = f"{segment.parent.as_posix()}/"
+            importers[name].update(page for page in pages if page.startswith(directory))
+    return importers
+
+
+def dependents(files, importers):
+    """``files`` plus everything that imports them, transitively."""
+    seen = set(files)
+    pending = list(files)
+    while pending:
+        for importer in importers.get(pending.pop(), ()):
+            if importer not in seen:
+                seen.add(importer)
+                pending.append(importer)
+    return seen
+
+
+def _feature_hits(files, features):
+    hits = set()
+    for name, entries in features.items():
+        for entry in entries:
+            if any(f.startswith(entry) if entry.endswith("/") else f == entry for f in files):
+                hits.add(name)
+                break
+    return hits
+
+
+def select_cases(changed, plan, features, importers, case_ids):
+    """Return ``(selected case ids, full suite?, reasons)`` for a list of changed files.
+
+    ``reasons`` maps each changed file to a short explanation, for ``--explain``.
+    """
+    selected, reasons, full = set(), {}, False
+    by_feature = {}
+    for case_id, entry in plan.items():
+        for name in entry.get("features", []):
+            by_feature.setdefault(name, set()).add(case_id)
+    tc_files = {f"testsprite_tests/{path.name}": path.stem.split("_", 1)[0]
+                for path in TESTS_DIR.glob("TC[0-9][0-9][0-9]_*.py")}
+    for path in changed:
+        if _matches(path, SHARED_PATTERNS):
+            full, reasons[path] = True, "shared file: full suite"
+        elif path in tc_files:
+            selected.add(tc_files[path])
+            reasons[path] = f"case module {tc_files[path]}"
+        elif _matches(path, IGNORED_PATTERNS):
+            reasons[path] = "ignored"
+        elif path.startswith("src/"):
+            affected = dependents([path], importers)
+            if ROOT_LAYOUT in affected:
+                full, reasons[path] = True, f"imported by {ROOT_LAYOUT}: full suite"
+                continue
+            hits = _feature_hits(affected, features)
+            cases = set().union(*(by_feature.get(name, set()) for name in hits))
+            if not cases:
+                full, reasons[path] = True, "no feature covers it: full suite"
+                continue
+            selected |= cases
+            reasons[path] = f"{', '.join(sorted(hits))} -> {', '.join(sorted(cases))}"
+        else:
+            full, reasons[path] = True, "outside src/: full suite"
+    if full:
+        return sorted(case_ids), True, reasons
+    return sorted(c for c in selected if c in case_ids), False, reasons
+
+
+def affected_cases(case_ids, base=DEFAULT_BASE):
+    """Shortcut used by ``python -m harness --changed``: ``(case ids, full suite?, reasons)``."""
+    return select_cases(changed_files(base), load_plan(), load_features(), import_graph(), case_ids)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.impact",
+                                     description="List the cases affected by a diff.")
+    parser.add_argument("base", nargs="?", default=DEFAULT_BASE, help="ref to diff against")
+    parser.add_argument("--explain", action="store_true", help="show why each changed file selects what")
+    args = parser.parse_args(argv)
+    plan = load_plan()
+    selected, full, reasons = affected_cases(list(plan), args.base)
+    if args.explain:
+        for path, reason in reasons.items():
+            print(f"{path}: {reason}")
+    label = "full suite" if full else f"{len(selected)}/{len(plan)} case(s)"
+    print(f"{label}: {' '.join(selected) or '(none)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
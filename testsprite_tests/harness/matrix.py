@@ -0,0 +1,282 @@
+"""Responsive layout matrix with perceptual screenshot diffing.
+
+Opens one context per entry of :data:`DEVICES` on a single browser, loads
+``/`` in all of them concurrently and screenshots the :data:`REGIONS`
+(header, StickyMenu, MainBanner, footer) of each. Screenshots are reduced
+to grayscale thumbnails and compared with the stored baseline by two
+vectorised NumPy measures:
+
+* a 63-bit DCT perceptual hash (Hamming distance, tolerant of antialiasing
+  and small shifts), and
+* mean SSIM over 7x7 windows (catches local changes the hash averages away).
+
+A region fails when either measure crosses its threshold, when it changes
+height by more than :data:`HEIGHT_TOLERANCE`, or when it disappears. A
+region without a baseline is stored as the new baseline. Needs numpy::
+
+    python -m harness.matrix                        # all devices, compare to baseline
+    python -m harness.matrix --device iphone-13 --device tablet
+    python -m harness.matrix --update               # accept the current layout
+
+Results and screenshots go to ``tmp/responsive/<timestamp>/``, baselines
+to ``tmp/responsive/baseline/<device>/``.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import sys
+import time
+
+import numpy as np
+from playwright import async_api
+
+from .browser import DEFAULT_TIMEOUT_MS, TESTS_DIR, BrowserPool
+from .selectors import SelectorNotFound, selectors_for
+from .waits import goto
+
+MATRIX_DIR = TESTS_DIR / "tmp" / "responsive"
+BASELINE_DIR = MATRIX_DIR / "baseline"
+
+_MOBILE_UA = ("Mozilla/5.0 (Linux; Android 14; Pixel 7) AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/124.0.0.0 Mobile Safari/537.36")
+_IOS_UA = ("Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 "
+           "(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1")
+_IPAD_UA = ("Mozilla/5.0 (iPad; CPU OS 17_0 like Mac OS X) AppleWebKit/605.1.15 "
+            "(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1")
+
+# Kept here rather than taken from ``playwright.devices`` so that baselines
+# do not shift when Playwright updates its descriptors.
+DEVICES = {
+    "desktop": {"viewport": {"width": 1280, "height": 720}},
+    "desktop-xl": {"viewport": {"width": 1920, "height": 1080}},
+    "tablet": {"viewport": {"width": 810, "height": 1080}, "device_scale_factor": 2,
+               "is_mobile": True, "has_touch": True, "user_agent": _IPAD_UA},
+    "iphone-13": {"viewport": {"width": 390, "height": 844}, "device_scale_factor": 3,
+                  "is_mobile": True, "has_touch": True, "user_agent": _IOS_UA},
+    "iphone-se": {"viewport": {"width": 320, "height": 568}, "device_scale_factor": 2,
+                  "is_mobile": True, "has_touch": True, "user_agent": _IOS_UA},
+    "pixel-7": {"viewport": {"width": 412, "height": 915}, "device_scale_factor": 2.625,
+                "is_mobile": True, "has_touch": True, "user_agent": _MOBILE_UA},
+}
+REGIONS = ("site_header", "sticky_menu", "main_banner", "site_footer")
+
+THUMB_WIDTH = 256
+HASH_SIZE = 32
+HASH_BITS = 8
+HASH_MAX_DISTANCE = 10
+SSIM_MIN = 0.90
+HEIGHT_TOLERANCE = 0.05
+SSIM_WINDOW = 7
+
+# Decodes a PNG with the browser's own decoder and returns grayscale
+# thumbnails, so no imaging library is needed on the Python side.
+_GRAY_SCRIPT = """
+async ([src, sizes]) => {
+  const img = new Image();
+  img.src = src;
+  await img.decode();
+  return sizes.map(([w, h]) => {
+    const canvas = new OffscreenCanvas(w, h);
+    const g = canvas.getContext('2d');
+    g.drawImage(img, 0, 0, w, h);
+    const d = g.getImageData(0, 0, w, h).data;
+    const out = new Array(w * h);
+    for (let i = 0; i < out.length; i++) {
+      out[i] = 0.299 * d[4 * i] + 0.587 * d[4 * i + 1] + 0.114 * d[4 * i + 2];
+    }
+    return out;
+  });
+}
+"""
+
+
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    m = np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m
+
+
+_DCT = _dct_matrix(HASH_SIZE)
+
+
+def phash(grid):
+    """63-bit perceptual hash of a ``HASH_SIZE`` square grayscale grid.
+
+    The top-left 8x8 DCT coefficients without the DC term, which only tracks
+    overall brightness, each compared with their median.
+    """
+    coeffs = (_DCT @ grid @ _DCT.T)[:HASH_BITS, :HASH_BITS].ravel()[1:]
+    return coeffs > np.median(coeffs)
+
+
+def _box_mean(x, k):
+    """Mean over every ``k`` x ``k`` window ("valid" mode) via a summed-area table."""
+    s = np.pad(x, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+    return (s[k:, k:] - s[:-k, k:] - s[k:, :-k] + s[:-k, :-k]) / (k * k)
+
+
+def ssim(a, b, k=SSIM_WINDOW):
+    """Mean structural similarity of two equally sized grayscale images (0-255)."""
+    if min(a.shape) < k:
+        return float(np.allclose(a, b, atol=8))
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    mu_a, mu_b = _box_mean(a, k), _box_mean(b, k)
+    var_a = _box_mean(a * a, k) - mu_a ** 2
+    var_b = _box_mean(b * b, k) - mu_b ** 2
+    cov = _box_mean(a * b, k) - mu_a * mu_b
+    score = ((2 * mu_a * mu_b + c1) * (2 * cov + c2)) / ((mu_a ** 2 + mu_b ** 2 + c1) * (var_a + var_b + c2))
+    return float(score.mean())
+
+
+def _resize(x, shape):
+    """Nearest-neighbour resize, enough to line up thumbnails that changed height slightly."""
+    rows = (np.arange(shape[0]) * x.shape[0] / shape[0]).astype(int)
+    cols = (np.arange(shape[1]) * x.shape[1] / shape[1]).astype(int)
+    return x[np.ix_(rows, cols)]
+
+
+async def _grayscale(decoder, png, size):
+    """``(thumbnail, hash grid)`` arrays for a PNG of CSS ``size`` (width, height)."""
+    width, height = size
+    thumb = (THUMB_WIDTH, max(SSIM_WINDOW, round(THUMB_WIDTH * height / max(width, 1))))
+    src = "data:image/png;base64," + base64.b64encode(png).decode("ascii")
+    thumb_px, grid_px = await decoder.evaluate(_GRAY_SCRIPT, [src, [thumb, (HASH_SIZE, HASH_SIZE)]])
+    return (np.asarray(thumb_px, dtype=np.float64).reshape(thumb[1], thumb[0]),
+            np.asarray(grid_px, dtype=np.float64).reshape(HASH_SIZE, HASH_SIZE))
+
+
+def compare(current, baseline):
+    """Diff one region against its baseline; returns a dict with ``ok`` and the measures."""
+    if baseline is None:
+        return {"ok": True, "new": True}
+    if current is None:
+        return {"ok": False, "reason": "region missing"}
+    height_change = current["size"][1] / max(baseline["size"][1], 1) - 1
+    distance = int(np.count_nonzero(phash(current["grid"]) != phash(baseline["grid"])))
+    score = ssim(_resize(current["thumb"], baseline["thumb"].shape), baseline["thumb"])
+    reasons = []
+    if abs(height_change) > HEIGHT_TOLERANCE:
+        reasons.append(f"height {height_change:+.0%}")
+    if distance > HASH_MAX_DISTANCE:
+        reasons.append(f"phash distance {distance}")
+    if score < SSIM_MIN:
+        reasons.append(f"SSIM {score:.3f}")
+    return {"ok": not reasons, "reason": ", ".join(reasons), "hashDistance": distance,
+            "ssim": round(score, 4), "heightChange": round(height_change, 4)}
+
+
+def _load_baseline(device, region):
+    path = BASELINE_DIR / device / f"{region}.npz"
+    if not path.exists():
+        return None
+    with np.load(path) as data:
+        return {"thumb": data["thumb"], "grid": data["grid"], "size": tuple(data["size"])}
+
+
+def _save(directory, region, capture):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{region}.png").write_bytes(capture["png"])
+    np.savez_compressed(directory / f"{region}.npz", thumb=capture["thumb"],
+                        grid=capture["grid"], size=np.asarray(capture["size"]))
+
+
+async def capture_device(browser, device, regions=REGIONS):
+    """Load ``/`` with ``device`` and return ``{region: capture or None}``."""
+    context = await browser.new_context(**DEVICES[device])
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    try:
+        page = await context.new_page()
+        decoder = await context.new_page()
+        await goto(page, "/", response="/api/projects")
+        index = selectors_for(page)
+        await index.prime(*regions)
+        captures = {}
+        for region in regions:
+            try:
+                locator = await index.get(region)
+            except SelectorNotFound:
+                captures[region] = None
+                continue
+            box = await locator.bounding_box()
+            png = await locator.screenshot(animations="disabled", scale="css", caret="hide")
+            size = (box["width"], box["height"]) if box else (THUMB_WIDTH, THUMB_WIDTH)
+            thumb, grid = await _grayscale(decoder, png, size)
+            captures[region] = {"png": png, "size": size, "thumb": thumb, "grid": grid}
+        return captures
+    finally:
+        await context.close()
+
+
+async def run_matrix(browser, devices=None, regions=REGIONS, update=False):
+    """Capture every device concurrently, diff against baselines and store the run.
+
+    Returns ``{device: {region: comparison}}``; ``update`` replaces the
+    baselines with this run instead of comparing.
+    """
+    devices = list(devices or DEVICES)
+    run_dir = MATRIX_DIR / time.strftime("%Y%m%dT%H%M%S")
+    captured = await asyncio.gather(*(capture_device(browser, d, regions) for d in devices))
+    results = {}
+    for device, captures in zip(devices, captured):
+        results[device] = {}
+        for region, capture in captures.items():
+            baseline = None if update else _load_baseline(device, region)
+            if capture is not None:
+                _save(run_dir / device, region, capture)
+                if baseline is None:
+                    _save(BASELINE_DIR / device, region, capture)
+            results[device][region] = compare(capture, baseline)
+    run_dir.mkdir(parents=True, exist_ok=True)
+    with open(run_dir / "results.json", "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    return results
+
+
+def failures(results):
+    return [
+        f"{device}/{region}: {outcome['reason']}"
+        for device, regions in results.items()
+        for region, outcome in regions.items()
+        if not outcome["ok"]
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.matrix",
+                                     description="Diff responsive layouts against baselines.")
+    parser.add_argument("--device", action="append", choices=list(DEVICES), dest="devices")
+    parser.add_argument("--update", action="store_true", help="store this run as the baseline")
+    args = parser.parse_args(argv)
+
+    async def run():
+        async with BrowserPool() as pool:
+            return await run_matrix(pool.browser, args.devices, update=args.update)
+
+    started = time.perf_counter()
+    try:
+        results = asyncio.run(run())
+    except async_api.Error as exc:
+        print(f"matrix run failed: {exc}", file=sys.stderr)
+        return 2
+    for device, regions in results.items():
+        cells = []
+        for region, outcome in regions.items():
+            if outcome.get("new"):
+                cells.append(f"{region}=new")
+            elif outcome["ok"]:
+                cells.append(f"{region}=ok({outcome['ssim']:.3f})")
+            else:
+                cells.append(f"{region}=FAIL")
+        print(f"{device:<12} {' '.join(cells)}")
+    problems = failures(results)
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    print(f"{len(results)} device(s) in {time.perf_counter() - started:.1f}s")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
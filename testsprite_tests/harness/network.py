@@ -0,0 +1,187 @@
+"""``page.route``-based record/replay of API traffic and failure injection.
+
+Record mode captures ``/api/*`` and Supabase REST/storage responses of a
+case into ``tmp/network/<case>.json.gz``; replay mode serves them back
+from that archive, optionally with added latency, a bandwidth cap or
+randomly injected failures, so a case runs without Supabase and with
+repeatable timings. Bodies are stored once per content hash, which keeps
+archives of repetitive feeds small.
+
+Cases can also inject failures explicitly with :func:`inject_failure`.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import random
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from .browser import BASE_URL, TESTS_DIR
+
+ARCHIVE_DIR = TESTS_DIR / "tmp" / "network"
+OFF, RECORD, REPLAY = "off", "record", "replay"
+# Hop-by-hop or encoding headers that no longer describe the decoded body we store.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def in_api_scope(url):
+    """The app's own ``/api/*`` routes and Supabase REST/storage endpoints."""
+    if url.startswith(f"{BASE_URL}/api/"):
+        return True
+    path = urlparse(url).path
+    return path.startswith("/rest/v1/") or path.startswith("/storage/v1/")
+
+
+def in_full_scope(url):
+    """Everything in API scope plus all same-origin documents and assets."""
+    return in_api_scope(url) or url.startswith(BASE_URL)
+
+
+SCOPES = {"api": in_api_scope, "all": in_full_scope}
+
+
+def request_key(request):
+    """Stable key: method, URL with sorted query, and a hash of any body."""
+    parsed = urlparse(request.url)
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    key = f"{request.method} {urlunparse(parsed._replace(query=query, fragment=''))}"
+    body = request.post_data_buffer
+    if body:
+        key += f" #{hashlib.sha1(body).hexdigest()[:12]}"
+    return key
+
+
+def archive_path(case_id):
+    return ARCHIVE_DIR / f"{case_id}.json.gz"
+
+
+class NetworkArchive:
+    """Recorded responses keyed by :func:`request_key`, replayed in order."""
+
+    def __init__(self, entries=None, bodies=None):
+        self.entries = entries or {}
+        self.bodies = bodies or {}
+        self._cursor = {}
+
+    def add(self, key, status, headers, body):
+        digest = hashlib.sha1(body).hexdigest()
+        self.bodies.setdefault(digest, base64.b64encode(body).decode("ascii"))
+        headers = {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS}
+        self.entries.setdefault(key, []).append({"status": status, "headers": headers, "body": digest})
+
+    def next(self, key):
+        """Next recorded response for ``key``; the last one repeats. ``None`` if unseen."""
+        responses = self.entries.get(key)
+        if not responses:
+            return None
+        index = self._cursor.get(key, 0)
+        self._cursor[key] = index + 1
+        entry = responses[min(index, len(responses) - 1)]
+        return entry["status"], entry["headers"], base64.b64decode(self.bodies[entry["body"]])
+
+    def save(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({"entries": self.entries, "bodies": self.bodies}, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["entries"], data["bodies"])
+
+
+async def record(context, archive, scope="api"):
+    """Pass matching requests through to the network and store the responses."""
+
+    async def handler(route):
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception:
+            await route.abort("failed")
+            return
+        archive.add(request_key(route.request), response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    await context.route(SCOPES[scope], handler)
+
+
+async def replay(context, archive, scope="api", *, latency_ms=0, kbps=None,
+                 fail_rate=0.0, strict=True, seed=0):
+    """Serve matching requests from ``archive``.
+
+    ``latency_ms`` delays every response, ``kbps`` adds transfer time at that
+    bandwidth, ``fail_rate`` aborts that fraction of requests. Requests the
+    archive has never seen are aborted when ``strict`` (keeping the run
+    hermetic) and sent to the network otherwise.
+    """
+    rng = random.Random(seed)
+
+    async def handler(route):
+        if fail_rate and rng.random() < fail_rate:
+            await route.abort("failed")
+            return
+        recorded = archive.next(request_key(route.request))
+        if recorded is None:
+            if strict:
+                await route.abort("blockedbyclient")
+            else:
+                await route.continue_()
+            return
+        status, headers, body = recorded
+        delay = latency_ms / 1000
+        if kbps:
+            delay += len(body) * 8 / (kbps * 1000)
+        if delay:
+            await asyncio.sleep(delay)
+        await route.fulfill(status=status, headers=headers, body=body)
+
+    await context.route(SCOPES[scope], handler)
+
+
+async def inject_failure(context, pattern, *, status=None, abort_reason="failed"):
+    """Fail requests matching ``pattern`` until :func:`clear_failure` is called.
+
+    With ``status`` the request is answered with that HTTP status and an
+    empty JSON error; otherwise it is aborted like a dropped connection.
+    Returns a handle for :func:`clear_failure`.
+    """
+
+    async def handler(route):
+        if status is None:
+            await route.abort(abort_reason)
+        else:
+            await route.fulfill(status=status, json={"error": "injected failure"})
+
+    await context.route(pattern, handler)
+    return pattern, handler
+
+
+async def clear_failure(context, handle):
+    pattern, handler = handle
+    await context.unroute(pattern, handler)
+
+
+async def install(context, case_id, options):
+    """Apply ``options.network`` to a case context; returns a finalizer coroutine."""
+    if options.network == RECORD:
+        archive = NetworkArchive()
+        await record(context, archive, options.network_scope)
+
+        async def finalize():
+            archive.save(archive_path(case_id))
+
+        return finalize
+    if options.network == REPLAY:
+        path = archive_path(case_id)
+        if not path.exists():
+            raise FileNotFoundError(f"no recording for {case_id} at {path}; run with --network record first")
+        await replay(
+            context, NetworkArchive.load(path), options.network_scope,
+            latency_ms=options.replay_latency_ms, kbps=options.replay_kbps,
+            fail_rate=options.replay_fail_rate,
+        )
+    return None
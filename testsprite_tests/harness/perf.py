@@ -0,0 +1,221 @@
+"""Page-load performance capture and a JSON trend store.
+
+Every :func:`harness.waits.goto` on a context with a recorder attached
+samples Navigation Timing, paint timings, LCP, CLS and long-task totals.
+Runs are stored as ``tmp/perf/<timestamp>-<commit>.json`` and can be
+compared against a stored baseline::
+
+    python -m harness.perf compare            # latest run vs baseline.json
+    python -m harness.perf baseline           # promote the latest run
+    python -m harness.perf history /project/[id]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+import weakref
+from pathlib import Path
+from urllib.parse import urlparse
+
+from .browser import TESTS_DIR
+
+PERF_DIR = TESTS_DIR / "tmp" / "perf"
+BASELINE_PATH = PERF_DIR / "baseline.json"
+
+# Installed before any page script runs so buffered entries are not missed.
+OBSERVER_SCRIPT = """
+(() => {
+  const m = window.__harnessPerf = { lcp: null, cls: 0, longTasks: 0, longTaskMs: 0 };
+  const observe = (type, fn) => {
+    try { new PerformanceObserver((list) => list.getEntries().forEach(fn)).observe({ type, buffered: true }); }
+    catch (e) {}
+  };
+  observe('largest-contentful-paint', (e) => { m.lcp = e.renderTime || e.loadTime || e.startTime; });
+  observe('layout-shift', (e) => { if (!e.hadRecentInput) m.cls += e.value; });
+  observe('longtask', (e) => { m.longTasks += 1; m.longTaskMs += e.duration; });
+})();
+"""
+
+COLLECT_SCRIPT = """
+() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const paint = {};
+  performance.getEntriesByType('paint').forEach((p) => { paint[p.name] = p.startTime; });
+  const m = window.__harnessPerf || {};
+  return {
+    url: location.href,
+    ttfb: nav ? nav.responseStart : null,
+    domContentLoaded: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+    transferSize: nav ? nav.transferSize : null,
+    firstPaint: paint['first-paint'] ?? null,
+    fcp: paint['first-contentful-paint'] ?? null,
+    lcp: m.lcp ?? null,
+    cls: m.cls ?? null,
+    longTasks: m.longTasks ?? null,
+    longTaskMs: m.longTaskMs ?? null,
+  };
+}
+"""
+
+# metric -> (relative tolerance, absolute tolerance); a regression must exceed both.
+THRESHOLDS = {
+    "ttfb": (0.25, 100),
+    "domContentLoaded": (0.2, 150),
+    "load": (0.2, 200),
+    "fcp": (0.2, 150),
+    "lcp": (0.2, 200),
+    "cls": (0.5, 0.05),
+    "longTaskMs": (0.3, 100),
+}
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.I)
+_recorders = weakref.WeakKeyDictionary()
+
+
+def route_key(url):
+    """Collapse numeric and UUID path segments so ``/project/42`` -> ``/project/[id]``."""
+    path = urlparse(url).path or "/"
+    segments = ["[id]" if _ID_SEGMENT.match(s) else s for s in path.split("/")]
+    return "/".join(segments) or "/"
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=TESTS_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class PerfRecorder:
+    """Collects one sample per harness navigation for a single case."""
+
+    def __init__(self, case_id):
+        self.case_id = case_id
+        self.samples = []
+
+    async def capture(self, page):
+        try:
+            metrics = await page.evaluate(COLLECT_SCRIPT)
+        except Exception:
+            # The page may already be navigating away or closed.
+            return
+        metrics["route"] = route_key(metrics.pop("url"))
+        metrics["case"] = self.case_id
+        self.samples.append(metrics)
+
+
+async def attach(context, case_id):
+    """Install the observers on ``context`` and return its recorder."""
+    recorder = PerfRecorder(case_id)
+    await context.add_init_script(OBSERVER_SCRIPT)
+    _recorders[context] = recorder
+    return recorder
+
+
+def recorder_for(page):
+    return _recorders.get(page.context)
+
+
+def write_run(samples, commit=None):
+    """Store one run's samples and return the file path."""
+    commit = commit or current_commit()
+    PERF_DIR.mkdir(parents=True, exist_ok=True)
+    started = time.strftime("%Y%m%dT%H%M%S")
+    path = PERF_DIR / f"{started}-{commit}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"commit": commit, "startedAt": started, "samples": samples}, f, indent=1)
+    return path
+
+
+def summarize(run):
+    """``{route: {metric: median}}`` over all samples of a run."""
+    by_route = {}
+    for sample in run["samples"]:
+        by_route.setdefault(sample["route"], []).append(sample)
+    summary = {}
+    for route, samples in by_route.items():
+        summary[route] = {}
+        for metric in THRESHOLDS:
+            values = [s[metric] for s in samples if s.get(metric) is not None]
+            if values:
+                summary[route][metric] = statistics.median(values)
+        summary[route]["samples"] = len(samples)
+    return summary
+
+
+def compare(run, baseline):
+    """Return a list of ``(route, metric, baseline, current)`` regressions."""
+    current, reference = summarize(run), summarize(baseline)
+    regressions = []
+    for route, metrics in sorted(current.items()):
+        for metric, (rel, abs_) in THRESHOLDS.items():
+            before = reference.get(route, {}).get(metric)
+            after = metrics.get(metric)
+            if before is None or after is None:
+                continue
+            if after - before > abs_ and after > before * (1 + rel):
+                regressions.append((route, metric, before, after))
+    return regressions
+
+
+def _runs():
+    return sorted(p for p in PERF_DIR.glob("*.json") if p != BASELINE_PATH)
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.perf")
+    sub = parser.add_subparsers(dest="command", required=True)
+    cmp_parser = sub.add_parser("compare", help="flag regressions against the baseline")
+    cmp_parser.add_argument("run", nargs="?", help="run file (default: latest)")
+    cmp_parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    base_parser = sub.add_parser("baseline", help="store a run as the new baseline")
+    base_parser.add_argument("run", nargs="?", help="run file (default: latest)")
+    hist_parser = sub.add_parser("history", help="median metrics of a route across runs")
+    hist_parser.add_argument("route")
+    hist_parser.add_argument("--metric", default="lcp", choices=sorted(THRESHOLDS))
+    args = parser.parse_args(argv)
+
+    runs = _runs()
+    if args.command == "history":
+        for path in runs:
+            run = _load(path)
+            value = summarize(run).get(args.route, {}).get(args.metric)
+            if value is not None:
+                print(f"{run['startedAt']}  {run['commit']:<10} {args.metric}={value:.3f}")
+        return 0
+
+    if args.run is None and not runs:
+        print(f"no runs in {PERF_DIR}; run the suite with --perf first", file=sys.stderr)
+        return 2
+    run_path = Path(args.run) if args.run else runs[-1]
+
+    if args.command == "baseline":
+        BASELINE_PATH.write_text(run_path.read_text(encoding="utf-8"), encoding="utf-8")
+        print(f"baseline <- {run_path.name}")
+        return 0
+
+    if not Path(args.baseline).exists():
+        print(f"no baseline at {args.baseline}; run `baseline` first", file=sys.stderr)
+        return 2
+    regressions = compare(_load(run_path), _load(args.baseline))
+    for route, metric, before, after in regressions:
+        print(f"REGRESSION {route} {metric}: {before:.3f} -> {after:.3f}")
+    print(f"{len(regressions)} regression(s) in {run_path.name} vs {Path(args.baseline).name}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+"""Access to ``testsprite_frontend_test_plan.json``."""
+
+import json
+
+from .browser import TESTS_DIR
+
+PLAN_PATH = TESTS_DIR / "testsprite_frontend_test_plan.json"
+PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+
+
+def load_plan(path=PLAN_PATH):
+    """Return the plan as ``{case_id: entry}`` preserving file order."""
+    with open(path, encoding="utf-8") as f:
+        return {entry["id"]: entry for entry in json.load(f)}
+
+
+def estimated_cost(entry):
+    """Relative cost of a case; the plan's step count is the only signal we have."""
+    return max(len(entry.get("steps", [])), 1)
+
+
+def schedule_key(entry):
+    """Sort key that puts high-priority, long cases first."""
+    return (
+        PRIORITY_RANK.get(entry.get("priority"), len(PRIORITY_RANK)),
+        -estimated_cost(entry),
+        entry["id"],
+    )
@@ -0,0 +1,83 @@
+"""Client-side cost per step from the Chrome DevTools Protocol.
+
+With profiling attached, every :func:`harness.waits.goto` and
+:func:`harness.waits.click` samples ``Performance.getMetrics`` before and
+after the step and records the difference: main-thread task, script,
+layout and style time, JS heap, DOM node and event-listener counts::
+
+    profiler = await profiling.attach(context)
+    ...
+    profiler.steps   # [{"label": "click", "taskMs": 41.2, "heapBytes": 180224, ...}]
+
+``python -m harness --profile`` attaches it to every case. Chromium only;
+:mod:`harness.soak` builds leak detection on top of :meth:`Profiler.sample`.
+"""
+
+import weakref
+
+# Performance.getMetrics names -> (result key, scale). Durations arrive in seconds.
+METRICS = {
+    "TaskDuration": ("taskMs", 1000),
+    "ScriptDuration": ("scriptMs", 1000),
+    "LayoutDuration": ("layoutMs", 1000),
+    "RecalcStyleDuration": ("styleMs", 1000),
+    "JSHeapUsedSize": ("heapBytes", 1),
+    "Nodes": ("nodes", 1),
+    "JSEventListeners": ("listeners", 1),
+}
+
+_profilers = weakref.WeakKeyDictionary()
+
+
+class Profiler:
+    """CDP sessions for the pages of one context and the per-step deltas."""
+
+    def __init__(self, context):
+        self.context = context
+        self.steps = []
+        self._sessions = weakref.WeakKeyDictionary()
+
+    async def _session(self, page):
+        session = self._sessions.get(page)
+        if session is None:
+            session = await self.context.new_cdp_session(page)
+            await session.send("Performance.enable")
+            self._sessions[page] = session
+        return session
+
+    async def sample(self, page, collect_garbage=False):
+        """Current metrics of ``page`` keyed as in :data:`METRICS`, or ``None`` if it is gone.
+
+        ``collect_garbage`` forces a full GC first so heap numbers reflect
+        live objects only.
+        """
+        from playwright import async_api
+
+        try:
+            session = await self._session(page)
+            if collect_garbage:
+                await session.send("HeapProfiler.collectGarbage")
+            metrics = (await session.send("Performance.getMetrics"))["metrics"]
+        except async_api.Error:
+            # Navigation may have swapped the renderer or closed the page.
+            self._sessions.pop(page, None)
+            return None
+        values = {m["name"]: m["value"] for m in metrics}
+        return {key: values.get(name, 0) * scale for name, (key, scale) in METRICS.items()}
+
+    def record(self, label, before, after):
+        if before is None or after is None:
+            return
+        self.steps.append({"label": label, **{
+            key: round(after[key] - before[key], 1) for key in before
+        }, "heapAfterBytes": after["heapBytes"], "nodesAfter": after["nodes"]})
+
+
+async def attach(context):
+    profiler = Profiler(context)
+    _profilers[context] = profiler
+    return profiler
+
+
+def profiler_for(page):
+    return _profilers.get(page.context)
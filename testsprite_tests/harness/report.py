@@ -0,0 +1,296 @@
+"""Append-only JSONL results and the report built from them.
+
+Workers append one line per finished case to ``tmp/harness_results.jsonl``
+as soon as it finishes (a single ``O_APPEND`` write, so lines from
+parallel processes never interleave). A run starts with a ``run`` record
+and ends with an ``end`` record; a crashed run simply has no ``end``.
+
+:class:`ReportBuilder` consumes the stream incrementally, reading only the
+bytes added since its last look, and renders the Markdown/HTML report in
+the layout of ``testsprite-mcp-test-report.md`` including the section 3
+coverage table. During a run :class:`ReportWatcher` keeps the report
+current; afterwards (or after a crash) it can be rebuilt with::
+
+    python -m harness.report                       # latest run in the default stream
+    python -m harness.report tmp/other.jsonl --md out.md --html out.html
+"""
+
+import argparse
+import html
+import json
+import os
+import sys
+import threading
+import time
+
+from .browser import TESTS_DIR
+from .plan import load_plan
+
+STREAM_PATH = TESTS_DIR / "tmp" / "harness_results.jsonl"
+REPORT_MD_PATH = TESTS_DIR / "tmp" / "harness_report.md"
+REPORT_HTML_PATH = TESTS_DIR / "tmp" / "harness_report.html"
+REFRESH_SEC = 2.0
+PROJECT_NAME = "vivefolio-nextjs"
+
+STATUS_LABELS = {"PASSED": "✅ Passed", "FAILED": "❌ Failed", "BLOCKED": "⚠️ Blocked"}
+
+
+def append_record(path, record):
+    """Append one JSON line with a single write so concurrent writers never interleave."""
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+class ReportBuilder:
+    """Aggregates the latest run of a results stream into report sections."""
+
+    def __init__(self, plan=None):
+        self.plan = load_plan() if plan is None else plan
+        self.offset = 0
+        self.reset({})
+
+    def reset(self, header):
+        self.header = header
+        self.cases = {}
+        self.elapsed_sec = None
+
+    def feed(self, record):
+        kind = record.get("type")
+        if kind == "run":
+            self.reset(record)
+        elif kind == "case":
+            self.cases[record["caseId"]] = record
+        elif kind == "end":
+            self.elapsed_sec = record.get("elapsedSec")
+
+    def follow(self, path):
+        """Feed the complete lines appended since the last call; True if any arrived."""
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < self.offset:
+                    # The stream was truncated or replaced; start over.
+                    self.offset = 0
+                    self.reset({})
+                f.seek(self.offset)
+                chunk = f.read()
+        except OSError:
+            return False
+        end = chunk.rfind(b"\n") + 1
+        if not end:
+            return False
+        for line in chunk[:end].splitlines():
+            if line.strip():
+                self.feed(json.loads(line))
+        self.offset += end
+        return True
+
+    def requirement(self, case_id):
+        entry = self.plan.get(case_id, {})
+        return entry.get("requirement") or (entry.get("category") or "uncategorized").title()
+
+    def groups(self):
+        """``{requirement: [case records]}``, both ordered by case id."""
+        grouped = {}
+        for case_id in sorted(self.cases):
+            grouped.setdefault(self.requirement(case_id), []).append(self.cases[case_id])
+        return grouped
+
+    def coverage(self):
+        rows = []
+        for requirement, records in self.groups().items():
+            counts = {status: sum(r["status"] == status for r in records) for status in STATUS_LABELS}
+            rows.append((requirement, len(records), counts))
+        return rows
+
+    def pass_rate(self):
+        if not self.cases:
+            return 0.0
+        return 100 * sum(r["status"] == "PASSED" for r in self.cases.values()) / len(self.cases)
+
+    def _state(self):
+        expected = len(self.header.get("cases", [])) or len(self.cases)
+        if self.elapsed_sec is not None:
+            return f"complete in {self.elapsed_sec:.1f}s"
+        return f"in progress: {len(self.cases)}/{expected} case(s) reported"
+
+    def _finding(self, record):
+        if record["status"] == "PASSED":
+            return "All executed steps passed."
+        return record.get("error") or "No error message recorded."
+
+    def _step_summary(self, record):
+        steps = record.get("steps") or []
+        if not steps:
+            return None
+        timed = [s for s in steps if s.get("status") != "PENDING"]
+        slowest = max(timed, key=lambda s: s.get("ms", 0), default=None)
+        text = f"{len(timed)}/{len(steps)} step(s) executed"
+        if slowest is not None:
+            text += f", slowest: {slowest['description']} ({slowest['ms']:.0f} ms)"
+        return text
+
+    def _attempt_summary(self, record):
+        attempts = record.get("attempts") or []
+        if len(attempts) < 2:
+            return None
+        outcomes = ", ".join(f"{a['status'].lower()} ({a['durationSec']:.1f}s)" for a in attempts)
+        return f"{len(attempts)} attempts: {outcomes}" + (" (flaky)" if record.get("flaky") else "")
+
+    def render_markdown(self):
+        lines = [
+            "# Harness Test Report", "", "---", "",
+            "## 1️⃣ Document Metadata",
+            f"- **Project Name:** {PROJECT_NAME}",
+            f"- **Run:** {self.header.get('startedAt', 'unknown')} "
+            f"(commit {self.header.get('commit', 'unknown')})",
+            f"- **Status:** {self._state()}",
+            "", "---", "",
+            "## 2️⃣ Requirement Validation Summary", "",
+        ]
+        for requirement, records in self.groups().items():
+            lines.append(f"### {requirement}")
+            for record in records:
+                lines += [
+                    f"#### Test {record['caseId']}",
+                    f"- **Test Name:** {record.get('title') or self.plan.get(record['caseId'], {}).get('title', '')}",
+                    f"- **Status:** {STATUS_LABELS.get(record['status'], record['status'])} "
+                    f"({record.get('durationSec', 0):.1f}s)",
+                    f"- **Analysis / Findings:** {self._finding(record)}",
+                ]
+                steps = self._step_summary(record)
+                if steps:
+                    lines.append(f"- **Steps:** {steps}")
+                retries = self._attempt_summary(record)
+                if retries:
+                    lines.append(f"- **Retries:** {retries}")
+                for name, path in (record.get("artifacts") or {}).items():
+                    if path:
+                        lines.append(f"- **{name}:** `{path}`")
+                lines.append("")
+        lines += [
+            "---", "",
+            "## 3️⃣ Coverage & Matching Metrics", "",
+            f"- **{self.pass_rate():.2f}%** of tests passed", "",
+            "| Requirement | Total Tests | ✅ Passed | ❌ Failed | ⚠️ Blocked |",
+            "|---|---|---|---|---|",
+        ]
+        for requirement, total, counts in self.coverage():
+            lines.append(f"| {requirement} | {total} | {counts['PASSED']} | {counts['FAILED']} | "
+                         f"{counts['BLOCKED']} |")
+        lines.append("")
+        return "\n".join(lines)
+
+    def render_html(self):
+        esc = html.escape
+        parts = [
+            "<!DOCTYPE html>", '<html lang="en">', "<head>", '<meta charset="UTF-8" />',
+            "<title>Harness Test Report</title>",
+            "<style>body{font-family:sans-serif;max-width:960px;margin:2rem auto;color:#111}"
+            "table{border-collapse:collapse}td,th{border:1px solid #ddd;padding:4px 8px}"
+            ".PASSED{color:#15803d}.FAILED{color:#b91c1c}.BLOCKED{color:#b45309}"
+            "pre{white-space:pre-wrap;background:#f6f6f6;padding:6px}</style>",
+            "</head>", "<body>", "<h1>Harness Test Report</h1>",
+            f"<p>{esc(PROJECT_NAME)} &middot; {esc(str(self.header.get('startedAt', 'unknown')))} "
+            f"&middot; commit {esc(str(self.header.get('commit', 'unknown')))} &middot; "
+            f"{esc(self._state())}</p>",
+            "<h2>Requirement Validation Summary</h2>",
+        ]
+        for requirement, records in self.groups().items():
+            parts.append(f"<h3>{esc(requirement)}</h3>")
+            for record in records:
+                status = record["status"]
+                parts.append(
+                    f"<h4>{esc(record['caseId'])} {esc(record.get('title') or '')}</h4>"
+                    f'<p class="{esc(status)}">{esc(STATUS_LABELS.get(status, status))} '
+                    f"({record.get('durationSec', 0):.1f}s)</p>"
+                    f"<pre>{esc(self._finding(record))}</pre>"
+                )
+                for summary in (self._step_summary(record), self._attempt_summary(record)):
+                    if summary:
+                        parts.append(f"<p>{esc(summary)}</p>")
+                for name, path in (record.get("artifacts") or {}).items():
+                    if path:
+                        parts.append(f"<p>{esc(name)}: <code>{esc(path)}</code></p>")
+        parts += [
+            "<h2>Coverage &amp; Matching Metrics</h2>",
+            f"<p><strong>{self.pass_rate():.2f}%</strong> of tests passed</p>",
+            "<table><tr><th>Requirement</th><th>Total Tests</th><th>✅ Passed</th>"
+            "<th>❌ Failed</th><th>⚠️ Blocked</th></tr>",
+        ]
+        for requirement, total, counts in self.coverage():
+            parts.append(f"<tr><td>{esc(requirement)}</td><td>{total}</td><td>{counts['PASSED']}</td>"
+                         f"<td>{counts['FAILED']}</td><td>{counts['BLOCKED']}</td></tr>")
+        parts += ["</table>", "</body>", "</html>", ""]
+        return "\n".join(parts)
+
+    def write(self, md_path=REPORT_MD_PATH, html_path=REPORT_HTML_PATH):
+        """Replace both reports atomically so readers never see half a file."""
+        for path, text in ((md_path, self.render_markdown()), (html_path, self.render_html())):
+            if path is None:
+                continue
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+
+
+class ReportWatcher:
+    """Background thread that rewrites the report whenever the stream grows."""
+
+    def __init__(self, stream_path, builder=None, interval_sec=REFRESH_SEC, **paths):
+        self.stream_path = stream_path
+        self.builder = builder or ReportBuilder()
+        self.interval_sec = interval_sec
+        self.paths = paths
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="report-watcher", daemon=True)
+
+    def _refresh(self):
+        if self.builder.follow(self.stream_path):
+            self.builder.write(**self.paths)
+
+    def _run(self):
+        while not self._stop.wait(self.interval_sec):
+            self._refresh()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop polling and render whatever arrived last."""
+        self._stop.set()
+        self._thread.join()
+        self._refresh()
+
+
+def start_run(path, case_ids, commit):
+    """Write the ``run`` header that opens a new run in the stream."""
+    append_record(path, {
+        "type": "run", "startedAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit, "cases": list(case_ids),
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.report",
+                                     description="Rebuild the report from a results stream.")
+    parser.add_argument("stream", nargs="?", default=str(STREAM_PATH))
+    parser.add_argument("--md", default=str(REPORT_MD_PATH))
+    parser.add_argument("--html", default=str(REPORT_HTML_PATH))
+    args = parser.parse_args(argv)
+    builder = ReportBuilder()
+    if not builder.follow(args.stream):
+        print(f"no results in {args.stream}", file=sys.stderr)
+        return 2
+    builder.write(args.md, args.html)
+    print(f"{len(builder.cases)} case(s), {builder.pass_rate():.1f}% passed -> {args.md}, {args.html}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Per-case resource policies that skip downloads a case does not look at.
+
+A case declares ``RESOURCE_POLICY = "text-only"`` (or another key of
+:data:`POLICIES`) when it only checks text and navigation. Images are then
+answered with a 1x1 placeholder so layout and ``onerror`` handlers behave,
+while media, fonts and third-party hosts are aborted outright.
+
+Bytes saved are estimated from the file under ``public/`` for same-origin
+assets (``/_next/image`` URLs resolve to their source file) and from a
+size cache filled by unrestricted runs for everything else.
+"""
+
+import base64
+import json
+import os
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+from .browser import BASE_URL, TESTS_DIR
+
+PUBLIC_DIR = TESTS_DIR.parent / "public"
+SIZE_CACHE_PATH = TESTS_DIR / "tmp" / "resource_sizes.json"
+
+POLICIES = {
+    "full": frozenset(),
+    "no-media": frozenset({"image", "media"}),
+    "text-only": frozenset({"image", "media", "font", "third-party"}),
+}
+# Aborted rather than stubbed; everything else gets PLACEHOLDER_PNG.
+_ABORTED = {"media", "font", "third-party"}
+PLACEHOLDER_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+
+def _first_party_hosts():
+    hosts = {urlparse(BASE_URL).hostname}
+    supabase_url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
+    if supabase_url:
+        hosts.add(urlparse(supabase_url).hostname)
+    return hosts
+
+
+def classify(request, first_party_hosts):
+    """Every policy category ``request`` falls into (possibly none)."""
+    categories = set()
+    if request.resource_type in ("image", "media", "font"):
+        categories.add(request.resource_type)
+    host = urlparse(request.url).hostname or ""
+    if host not in first_party_hosts and not host.endswith(".supabase.co"):
+        categories.add("third-party")
+    return categories
+
+
+def _public_file(url):
+    """Map a same-origin static or ``/_next/image`` URL to its ``public/`` file."""
+    parsed = urlparse(url)
+    path = parsed.path
+    if path == "/_next/image":
+        source = parse_qs(parsed.query).get("url", [""])[0]
+        if not source.startswith("/"):
+            return None
+        path = source
+    candidate = (PUBLIC_DIR / unquote(path).lstrip("/")).resolve()
+    if PUBLIC_DIR in candidate.parents and candidate.is_file():
+        return candidate
+    return None
+
+
+class SizeCache:
+    """URL -> byte size observed in runs that did not block anything."""
+
+    def __init__(self, path=SIZE_CACHE_PATH):
+        self.path = Path(path)
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.sizes = json.load(f)
+        except (OSError, ValueError):
+            self.sizes = {}
+        self.dirty = False
+
+    def estimate(self, url):
+        if url in self.sizes:
+            return self.sizes[url]
+        if url.startswith(BASE_URL):
+            public_file = _public_file(url)
+            if public_file is not None:
+                return public_file.stat().st_size
+        return None
+
+    def observe(self, response):
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.sizes[response.url] = int(length)
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Merge with whatever other workers wrote meanwhile.
+        merged = SizeCache(self.path).sizes
+        merged.update(self.sizes)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(merged, f)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+class ResourceReport:
+    """What a policy blocked in one case and roughly how many bytes it saved."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.blocked = {}
+        self.bytes_saved = 0
+        self.unknown_size = 0
+
+    def add(self, category, size):
+        self.blocked[category] = self.blocked.get(category, 0) + 1
+        if size is None:
+            self.unknown_size += 1
+        else:
+            self.bytes_saved += size
+
+    def as_dict(self):
+        return {
+            "policy": self.policy,
+            "blocked": dict(sorted(self.blocked.items())),
+            "bytesSaved": self.bytes_saved,
+            "unknownSize": self.unknown_size,
+        }
+
+
+async def apply_policy(context, module, size_cache):
+    """Install the case's ``RESOURCE_POLICY`` on ``context``.
+
+    Returns a :class:`ResourceReport`. With the ``full`` policy nothing is
+    routed; responses only feed ``size_cache`` for later estimates.
+    """
+    policy = getattr(module, "RESOURCE_POLICY", "full")
+    if policy not in POLICIES:
+        raise ValueError(f"unknown RESOURCE_POLICY {policy!r}; choose from {', '.join(POLICIES)}")
+    report = ResourceReport(policy)
+    blocked = POLICIES[policy]
+    if not blocked:
+        context.on("response", size_cache.observe)
+        return report
+
+    first_party = _first_party_hosts()
+
+    async def handler(route):
+        matched = classify(route.request, first_party) & blocked
+        if not matched:
+            await route.fallback()
+            return
+        aborted = matched & _ABORTED
+        category = min(aborted or matched)
+        report.add(category, size_cache.estimate(route.request.url))
+        if aborted:
+            await route.abort("blockedbyclient")
+        else:
+            await route.fulfill(status=200, content_type="image/png", body=PLACEHOLDER_PNG)
+
+    await context.route("**/*", handler)
+    return report
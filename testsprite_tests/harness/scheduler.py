@@ -0,0 +1,254 @@
+"""Parallel scheduling of cases over asyncio tasks and worker processes.
+
+Each worker process owns one :class:`BrowserPool` and runs up to ``tasks``
+cases at once in separate contexts. Cases declare ordering constraints with
+a module-level ``DEPENDS_ON`` list; a case and everything that depends on it
+are always placed in the same worker so the guard can be a plain
+``asyncio.Event`` rather than cross-process signalling.
+"""
+
+import asyncio
+import multiprocessing
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from . import evidence, network, perf, profiling, report, resources, waits
+from .browser import BrowserPool
+from .cases import context_options, load_case
+from .plan import estimated_cost, load_plan, schedule_key
+
+PASSED = "PASSED"
+FAILED = "FAILED"
+BLOCKED = "BLOCKED"
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    """Per-run switches shipped to every worker process."""
+
+    tasks: int = 4
+    perf: bool = False
+    profile: bool = False
+    network: str = "off"
+    network_scope: str = "api"
+    replay_latency_ms: float = 0
+    replay_kbps: float = None
+    replay_fail_rate: float = 0.0
+    evidence_steps: int = evidence.DEFAULT_STEPS
+    stream_path: str = None
+    retries: int = 0
+
+
+def case_dependencies(cases):
+    """Return ``{case_id: [dependency ids]}`` from each module's ``DEPENDS_ON``."""
+    deps = {}
+    for case_id, module_name in cases.items():
+        module = load_case(module_name)
+        deps[case_id] = [d for d in getattr(module, "DEPENDS_ON", ()) if d in cases]
+    return deps
+
+
+def _dependency_groups(case_ids, deps):
+    """Union-find over the dependency edges; returns lists of connected cases."""
+    parent = {case_id: case_id for case_id in case_ids}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for case_id in case_ids:
+        for dep in deps.get(case_id, ()):
+            if dep in parent:
+                parent[find(case_id)] = find(dep)
+
+    groups = {}
+    for case_id in case_ids:
+        groups.setdefault(find(case_id), []).append(case_id)
+    return list(groups.values())
+
+
+def plan_shards(case_ids, plan, deps, processes, durations=None):
+    """Split cases into ``processes`` shards, each ordered longest/highest first.
+
+    Dependency groups are kept whole and assigned greedily to the currently
+    lightest shard, largest group first. ``durations`` (seconds per case,
+    see :func:`harness.history.expected_durations`) replaces the step-count
+    estimate when there is history to go on.
+    """
+    cost = durations or {case_id: estimated_cost(plan.get(case_id, {})) for case_id in case_ids}
+    groups = sorted(
+        _dependency_groups(case_ids, deps),
+        key=lambda group: -sum(cost[c] for c in group),
+    )
+    shards = [[] for _ in range(max(1, min(processes, len(groups))))]
+    loads = [0] * len(shards)
+    for group in groups:
+        target = loads.index(min(loads))
+        shards[target].extend(group)
+        loads[target] += sum(cost[c] for c in group)
+    fallback = {"id": "", "priority": None, "steps": []}
+    for shard in shards:
+        shard.sort(key=lambda c: schedule_key(plan.get(c, {**fallback, "id": c})))
+    return [shard for shard in shards if shard]
+
+
+def _describe(exc):
+    return "".join(traceback.format_exception_only(type(exc), exc)).strip()
+
+
+async def run_shard(cases, case_ids, deps, options, worker=0):
+    """Run ``case_ids`` in one process with at most ``options.tasks`` concurrent contexts."""
+    done = {case_id: asyncio.Event() for case_id in case_ids}
+    results = {}
+    plan = load_plan()
+
+    def finish(result):
+        entry = plan.get(result["caseId"], {})
+        result.update(title=entry.get("title", ""), category=entry.get("category"),
+                      priority=entry.get("priority"))
+        results[result["caseId"]] = result
+        if options.stream_path:
+            report.append_record(options.stream_path, {"type": "case", **result})
+
+    size_cache = resources.SizeCache()
+    slots = asyncio.Semaphore(max(1, options.tasks))
+
+    async def attempt(pool, case_id, module):
+        """One execution of ``module`` in a fresh context."""
+        started = time.perf_counter()
+        status, error = PASSED, ""
+        recorder = profiler = policy_report = evidence_path = None
+        steps = []
+        try:
+            context_kwargs = await context_options(module, pool.browser)
+            async with pool.context(**context_kwargs) as context:
+                if options.perf:
+                    recorder = await perf.attach(context, case_id)
+                if options.profile:
+                    profiler = await profiling.attach(context)
+                policy_report = await resources.apply_policy(context, module, size_cache)
+                steps = waits.step_log(context)
+                finalize = await network.install(context, case_id, options)
+                buffer = None
+                if options.evidence_steps:
+                    buffer = evidence.attach(context, case_id, options.evidence_steps)
+                try:
+                    await module.run_test(context)
+                except Exception as exc:
+                    if buffer is not None:
+                        evidence_path = str(await buffer.dump(context, _describe(exc)))
+                    raise
+                finally:
+                    if finalize is not None:
+                        await finalize()
+        except Exception as exc:
+            status = FAILED
+            error = _describe(exc)
+        return {
+            "status": status,
+            "error": error,
+            "durationSec": round(time.perf_counter() - started, 3),
+            "perf": recorder.samples if recorder else [],
+            "profile": profiler.steps if profiler else [],
+            "resources": policy_report.as_dict() if policy_report else None,
+            "bytesSaved": policy_report.bytes_saved if policy_report and policy_report.blocked else 0,
+            "steps": list(getattr(module, "step_results", steps)),
+            "evidence": evidence_path,
+        }
+
+    async def run_one(pool, case_id):
+        try:
+            for dep in deps.get(case_id, ()):
+                if dep in done:
+                    await done[dep].wait()
+            blocked = [
+                dep for dep in deps.get(case_id, ())
+                if dep in results and results[dep]["status"] != PASSED
+            ]
+            if blocked:
+                finish({
+                    "caseId": case_id,
+                    "status": BLOCKED,
+                    "error": f"dependency failed: {', '.join(blocked)}",
+                    "durationSec": 0.0,
+                    "worker": worker,
+                    "perf": [],
+                    "profile": [],
+                    "resources": None,
+                    "steps": [],
+                    "attempts": [],
+                    "flaky": False,
+                    "artifacts": {},
+                })
+                return
+            async with slots:
+                module = load_case(cases[case_id])
+                started = time.perf_counter()
+                attempts, evidence_path = [], None
+                while True:
+                    outcome = await attempt(pool, case_id, module)
+                    attempts.append(outcome)
+                    evidence_path = outcome["evidence"] or evidence_path
+                    if outcome["status"] == PASSED or len(attempts) > options.retries:
+                        break
+                    print(f"[w{worker}] {case_id}: failed attempt {len(attempts)}, retrying in a fresh context",
+                          flush=True)
+                last = attempts[-1]
+                artifacts = {"evidence": evidence_path}
+                if options.network != "off":
+                    artifacts["network"] = str(network.archive_path(case_id))
+                finish({
+                    "caseId": case_id,
+                    "status": last["status"],
+                    "error": last["error"],
+                    "durationSec": round(time.perf_counter() - started, 3),
+                    "worker": worker,
+                    "perf": last["perf"],
+                    "profile": last["profile"],
+                    "resources": last["resources"],
+                    "steps": last["steps"],
+                    "attempts": [
+                        {"status": a["status"], "durationSec": a["durationSec"], "error": a["error"]}
+                        for a in attempts
+                    ],
+                    "flaky": last["status"] == PASSED and len(attempts) > 1,
+                    "artifacts": artifacts,
+                })
+                saved = last["bytesSaved"]
+                saved = f", {saved / 1024:.0f} KiB skipped" if saved else ""
+                retried = f", passed on attempt {len(attempts)}" if results[case_id]["flaky"] else ""
+                print(f"[w{worker}] {case_id}: {last['status']} "
+                      f"({results[case_id]['durationSec']:.1f}s{saved}{retried})", flush=True)
+                if evidence_path:
+                    print(f"[w{worker}] {case_id}: evidence -> {evidence_path}", flush=True)
+        finally:
+            done[case_id].set()
+
+    async with BrowserPool() as pool:
+        await asyncio.gather(*(run_one(pool, case_id) for case_id in case_ids))
+    size_cache.save()
+    return [results[case_id] for case_id in case_ids]
+
+
+def _run_shard_in_process(cases, case_ids, deps, options, worker):
+    return asyncio.run(run_shard(cases, case_ids, deps, options, worker))
+
+
+def run_parallel(cases, shards, deps, options):
+    """Run every shard in its own process (or inline when there is only one)."""
+    if len(shards) == 1:
+        return _run_shard_in_process(cases, shards[0], deps, options, 0)
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=ctx) as executor:
+        futures = [
+            executor.submit(_run_shard_in_process, cases, shard, deps, options, worker)
+            for worker, shard in enumerate(shards)
+        ]
+        for future in futures:
+            results.extend(future.result())
+    return results
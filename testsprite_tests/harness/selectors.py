@@ -0,0 +1,159 @@
+"""Named, stable locators for the components the cases touch.
+
+Cases used to address elements by absolute XPath
+(``html/body/div[2]/div/main/section[2]/div[3]/div[11]``), which breaks
+whenever a wrapper ``div`` is added and is slow for Playwright to
+evaluate. Here every element has a name and a list of CSS candidates,
+``data-testid`` first and role/attribute fallbacks after it::
+
+    index = selectors_for(page)
+    await click(page, await index.get("category_filter", "photo"))
+
+Candidates are plain CSS so that a single ``evaluate`` can check all of
+them in the page. The winner for each (route, name, argument) is cached
+for the rest of the process, so later lookups on the same route cost
+nothing. When nothing matches within ``FAIL_FAST_MS`` the lookup raises
+:class:`SelectorNotFound` listing what was tried and which test ids the
+page does have, instead of waiting out a 30 second ``expect`` timeout.
+"""
+
+import weakref
+
+from .perf import route_key
+
+FAIL_FAST_MS = 3000
+
+# name -> CSS candidates in preference order. ``{}`` takes the lookup argument.
+SELECTORS = {
+    "main_banner": ("[data-testid=main-banner]", "[aria-roledescription=carousel]"),
+    "sticky_menu": ("[data-testid=sticky-menu]",),
+    "category_filter": ('[data-testid="category-filter-{}"]',),
+    "image_card": ("[data-testid=image-card]", ".masonry-item"),
+    "image_card_creator": ("[data-testid=image-card-creator]", ".masonry-item .rounded-full"),
+    "image_dialog": ("[data-testid=image-dialog]",),
+    "project_modal": ("[data-testid=project-detail-modal]", "[role=dialog]"),
+    "project_like": (
+        "[data-testid=project-like-button]",
+        "[role=dialog] button:has(svg[data-icon=heart])",
+    ),
+    "project_comment": (
+        "[data-testid=project-comment-button]",
+        "[role=dialog] button:has(svg[data-icon=comment])",
+    ),
+    "project_share": (
+        "[data-testid=project-share-button]",
+        "[role=dialog] button:has(svg[data-icon=share-nodes])",
+    ),
+    "project_creator": ("[data-testid=project-creator-link]",),
+    "comment_input": ("[data-testid=comment-input]", "[role=dialog] textarea"),
+    "comment_submit": ("[data-testid=comment-submit]",),
+    "site_header": ("[data-testid=site-header]", "header"),
+    "header_login": ("[data-testid=header-login]", 'header a[href="/login"]'),
+    "header_signup": ("[data-testid=header-signup]", 'header a[href="/signup"]'),
+    "mobile_menu": ("[data-testid=mobile-menu-trigger]",),
+    "mobile_search": ("[data-testid=mobile-search-trigger]",),
+    "nav_link": ('[data-testid=header-nav-link][href="{}"]', 'header nav a[href="{}"]'),
+    "site_footer": ("[data-testid=site-footer]", "footer"),
+    "creator_followers": ("[data-testid=creator-followers-count]",),
+}
+
+# Returns the first candidate with a rendered match, or null.
+_FIRST_MATCH_SCRIPT = """
+(candidates) => {
+  for (const candidate of candidates) {
+    for (const el of document.querySelectorAll(candidate)) {
+      if (el.getClientRects().length) return candidate;
+    }
+  }
+  return null;
+}
+"""
+
+_TEST_IDS_SCRIPT = """
+() => [...new Set([...document.querySelectorAll('[data-testid]')].map(e => e.dataset.testid))]
+"""
+
+# (route, name, arg) -> winning candidate, shared by every page in the process.
+_choices = {}
+_indexes = weakref.WeakKeyDictionary()
+
+
+class SelectorNotFound(AssertionError):
+    """No candidate for a registry name matched on the current page."""
+
+
+def candidates(name, arg=None):
+    try:
+        templates = SELECTORS[name]
+    except KeyError:
+        raise KeyError(f"unknown selector {name!r}; known: {', '.join(sorted(SELECTORS))}") from None
+    if any("{}" in t for t in templates) != (arg is not None):
+        raise ValueError(f"selector {name!r} {'needs' if arg is None else 'takes no'} argument")
+    return [t.replace("{}", str(arg)) for t in templates] if arg is not None else list(templates)
+
+
+class SelectorIndex:
+    """Resolves registry names to ``Locator`` objects on one page."""
+
+    def __init__(self, page):
+        self.page = page
+
+    def _key(self, name, arg):
+        return (route_key(self.page.url), name, arg)
+
+    async def prime(self, *names):
+        """Resolve several argument-free names with one round trip.
+
+        Names with nothing rendered yet are left for :meth:`get` to wait on.
+        """
+        pending = [n for n in names if self._key(n, None) not in _choices]
+        if not pending:
+            return
+        found = await self.page.evaluate(
+            "(groups) => groups.map(" + _FIRST_MATCH_SCRIPT.strip() + ")",
+            [candidates(n) for n in pending],
+        )
+        for name, choice in zip(pending, found):
+            if choice is not None:
+                _choices[self._key(name, None)] = choice
+
+    async def get(self, name, arg=None, *, timeout_ms=FAIL_FAST_MS):
+        """The visible locator for ``name``, or :class:`SelectorNotFound`."""
+        from playwright import async_api
+
+        key = self._key(name, arg)
+        options = candidates(name, arg)
+        choice = _choices.get(key)
+        if choice is None:
+            try:
+                handle = await self.page.wait_for_function(
+                    _FIRST_MATCH_SCRIPT, arg=options, timeout=timeout_ms
+                )
+            except async_api.TimeoutError:
+                raise SelectorNotFound(
+                    await self._diagnose(name, arg, options, timeout_ms)
+                ) from None
+            choice = _choices[key] = await handle.json_value()
+        return self.page.locator(f"{choice} >> visible=true").first
+
+    async def _diagnose(self, name, arg, options, timeout_ms):
+        from playwright import async_api
+
+        try:
+            test_ids = await self.page.evaluate(_TEST_IDS_SCRIPT)
+        except async_api.Error:
+            test_ids = []
+        label = name if arg is None else f"{name}({arg})"
+        return (
+            f"selector {label} not found on {self.page.url} within {timeout_ms} ms\n"
+            f"  tried: {', '.join(options)}\n"
+            f"  data-testids on page: {', '.join(sorted(test_ids)) or '(none)'}"
+        )
+
+
+def selectors_for(page):
+    """The page's :class:`SelectorIndex`, created on first use."""
+    index = _indexes.get(page)
+    if index is None:
+        index = _indexes[page] = SelectorIndex(page)
+    return index
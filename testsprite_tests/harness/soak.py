@@ -0,0 +1,140 @@
+"""Soak runs that repeat one UI flow and fail on unbounded growth.
+
+Users keep the feed open for a long time, so a few kilobytes or listeners
+leaked per modal open add up to jank. Each :data:`FLOWS` entry is repeated
+``--iterations`` times on one page; after every iteration a full GC is
+forced and the JS heap, DOM node and event-listener counts are sampled
+over CDP (see :mod:`harness.profiling`). After ``--warmup`` iterations a
+least-squares line is fitted to each series, and the run fails when a
+metric keeps climbing: slope above :data:`LEAK_SLOPES` with a good fit
+(r² of at least :data:`MIN_R2`) and total growth above :data:`MIN_GROWTH`::
+
+    python -m harness.soak project-modal --iterations 100
+    python -m harness.soak category-filters --iterations 30 --warmup 3
+
+Samples go to ``tmp/soak/<flow>-<timestamp>.json``.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from playwright import async_api
+
+from . import profiling
+from .browser import TESTS_DIR, BrowserPool
+from .selectors import selectors_for
+from .waits import click, open_page
+
+SOAK_DIR = TESTS_DIR / "tmp" / "soak"
+# Growth per iteration that counts as a leak once the fit is good.
+LEAK_SLOPES = {"heapBytes": 32 * 1024, "nodes": 5, "listeners": 1}
+# Ignore runs too short for a steady slope to add up to anything.
+MIN_GROWTH = {"heapBytes": 1024 * 1024, "nodes": 200, "listeners": 20}
+MIN_R2 = 0.6
+REPORT_EVERY = 10
+
+_CATEGORY_VALUES_SCRIPT = """
+() => [...document.querySelectorAll('[data-testid^="category-filter-"]')]
+  .map(el => el.dataset.testid.slice('category-filter-'.length))
+"""
+
+
+async def project_modal(page, index):
+    """TC002: open the project detail modal from a card and close it again."""
+    await click(page, await index.get("image_card"), response="/api/likes")
+    modal = await index.get("project_modal")
+    await page.keyboard.press("Escape")
+    await modal.wait_for(state="hidden")
+
+
+async def category_filters(page, index):
+    """TC001: switch through every StickyMenu category filter once."""
+    for value in await page.evaluate(_CATEGORY_VALUES_SCRIPT):
+        await click(page, await index.get("category_filter", value))
+
+
+FLOWS = {"project-modal": project_modal, "category-filters": category_filters}
+
+
+def fit(series):
+    """``(slope, r2)`` of the least-squares line through ``series``."""
+    n = len(series)
+    if n < 3:
+        return 0.0, 0.0
+    mean_x, mean_y = (n - 1) / 2, sum(series) / n
+    sxx = sum((x - mean_x) ** 2 for x in range(n))
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(series))
+    syy = sum((y - mean_y) ** 2 for y in series)
+    slope = sxy / sxx
+    r2 = (sxy * sxy) / (sxx * syy) if syy else 0.0
+    return slope, r2
+
+
+def leaks(samples, warmup):
+    """Metrics that grow without bound, with their slope, r² and total growth."""
+    steady = samples[warmup:]
+    found = {}
+    for metric, limit in LEAK_SLOPES.items():
+        series = [s[metric] for s in steady]
+        slope, r2 = fit(series)
+        growth = series[-1] - series[0] if series else 0
+        if slope > limit and r2 >= MIN_R2 and growth > MIN_GROWTH[metric]:
+            found[metric] = {"slopePerIteration": round(slope, 1), "r2": round(r2, 3), "growth": growth}
+    return found
+
+
+async def soak(flow, iterations, warmup):
+    """Run ``flow`` repeatedly and return the per-iteration samples."""
+    samples = []
+    async with BrowserPool() as pool:
+        async with pool.context() as context:
+            profiler = profiling.Profiler(context)
+            page = await open_page(context, response="/api/projects")
+            index = selectors_for(page)
+            baseline = await profiler.sample(page, collect_garbage=True)
+            started = time.perf_counter()
+            for iteration in range(1, iterations + 1):
+                await FLOWS[flow](page, index)
+                sample = await profiler.sample(page, collect_garbage=True)
+                samples.append({"iteration": iteration, "sec": round(time.perf_counter() - started, 2), **sample})
+                if iteration % REPORT_EVERY == 0 or iteration == iterations:
+                    print(f"{iteration:>5}  heap {sample['heapBytes'] / 1024 / 1024:7.2f} MiB "
+                          f"({(sample['heapBytes'] - baseline['heapBytes']) / 1024:+.0f} KiB)  "
+                          f"nodes {sample['nodes']:6.0f}  listeners {sample['listeners']:5.0f}  "
+                          f"main thread {sample['taskMs'] - baseline['taskMs']:8.0f} ms", flush=True)
+    return baseline, samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.soak",
+                                     description="Repeat a UI flow and detect heap, DOM or listener leaks.")
+    parser.add_argument("flow", choices=list(FLOWS))
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5, help="iterations ignored by the leak fit")
+    args = parser.parse_args(argv)
+
+    try:
+        baseline, samples = asyncio.run(soak(args.flow, args.iterations, args.warmup))
+    except async_api.Error as exc:
+        print(f"soak run failed: {exc}", file=sys.stderr)
+        return 2
+    found = leaks(samples, args.warmup)
+    SOAK_DIR.mkdir(parents=True, exist_ok=True)
+    path = SOAK_DIR / f"{args.flow}-{time.strftime('%Y%m%dT%H%M%S')}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"flow": args.flow, "warmup": args.warmup, "baseline": baseline,
+                   "samples": samples, "leaks": found}, f, indent=1)
+    for metric, detail in found.items():
+        print(f"LEAK {metric}: +{detail['slopePerIteration']} per iteration "
+              f"(r2 {detail['r2']}, +{detail['growth']:.0f} over the run)")
+    if not found:
+        print(f"no unbounded growth over {len(samples)} iteration(s)")
+    print(f"samples -> {path}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""Executable step vocabulary for plan-driven cases.
+
+A step in ``testsprite_frontend_test_plan.json`` becomes executable by
+giving it a ``run`` entry: one operation object or a list of them, e.g.::
+
+    {"goto": "/", "response": "/api/projects"}
+    {"click": "role:button:작성", "response": "/api/comments"}
+    {"fill": "#email", "value": "{email}"}
+    {"click": "sel:category_filter:photo"}
+    {"expect_visible": ["text=발견", "text=채용"]}
+
+Targets are Playwright selectors, ``sel:<name>[:<arg>]`` for an entry of
+:data:`harness.selectors.SELECTORS`, or ``role:<role>:<name>``,
+``label:<text>``, ``placeholder:<text>``, ``testid:<id>`` and
+``alt:<text>`` for the matching ``get_by_*`` locators. String values are
+formatted with the run's variables (``{email}``, ``{password}``,
+``{nickname}``, ``{comment}``, ``{account_email}``, ``{account_password}``).
+"""
+
+import asyncio
+import fnmatch
+import random
+import string
+
+from .auth import CREDENTIALS_PATH, authenticate, load_credentials
+from .selectors import selectors_for
+from .waits import click, goto
+
+# Keys an operation object may carry besides its operation name.
+MODIFIERS = {"response", "navigation", "value", "timeout"}
+EXPECT_TIMEOUT_MS = 10000
+
+
+async def resolve(page, target):
+    """Turn a plan target string into a ``Locator`` on ``page``."""
+    kind, sep, rest = target.partition(":")
+    if sep:
+        if kind == "sel":
+            name, _, arg = rest.partition(":")
+            return await selectors_for(page).get(name, arg or None)
+        if kind == "role":
+            role, _, name = rest.partition(":")
+            return page.get_by_role(role, name=name) if name else page.get_by_role(role)
+        if kind == "label":
+            return page.get_by_label(rest)
+        if kind == "placeholder":
+            return page.get_by_placeholder(rest)
+        if kind == "testid":
+            return page.get_by_test_id(rest)
+        if kind == "alt":
+            return page.get_by_alt_text(rest)
+    return page.locator(target)
+
+
+def new_variables():
+    """Fresh per-run values so repeated runs never collide on unique fields.
+
+    ``account_email``/``account_password`` hold the existing test account
+    when one is configured (see :func:`harness.auth.load_credentials`).
+    """
+    suffix = "".join(random.choice(string.ascii_lowercase) for _ in range(8))
+    variables = {
+        "nickname": f"testuser_{suffix}",
+        "email": f"testuser_{suffix}@example.com",
+        "password": "password123!",
+        "comment": f"harness comment {suffix}",
+    }
+    try:
+        variables["account_email"], variables["account_password"] = load_credentials()
+    except RuntimeError:
+        pass
+    return variables
+
+
+class StepContext:
+    """State shared by the steps of one case: its context, page and variables."""
+
+    def __init__(self, context):
+        self.context = context
+        self.page = None
+        self.vars = new_variables()
+
+    def render(self, value):
+        return value.format_map(self.vars) if isinstance(value, str) else value
+
+    async def ensure_page(self):
+        if self.page is None:
+            self.page = await self.context.new_page()
+        return self.page
+
+
+async def op_goto(ctx, spec):
+    page = await ctx.ensure_page()
+    await goto(page, ctx.render(spec["goto"]), response=spec.get("response"))
+
+
+async def op_click(ctx, spec):
+    page = await ctx.ensure_page()
+    await click(
+        page, (await resolve(page, ctx.render(spec["click"]))).first,
+        response=spec.get("response"), navigation=spec.get("navigation", False),
+    )
+
+
+async def op_fill(ctx, spec):
+    page = await ctx.ensure_page()
+    locator = await resolve(page, ctx.render(spec["fill"]))
+    await locator.first.fill(ctx.render(spec["value"]))
+
+
+async def op_expect_visible(ctx, spec):
+    from playwright.async_api import expect
+
+    page = await ctx.ensure_page()
+    targets = spec["expect_visible"]
+    for target in [targets] if isinstance(targets, str) else targets:
+        locator = await resolve(page, ctx.render(target))
+        await expect(locator.first).to_be_visible(
+            timeout=spec.get("timeout", EXPECT_TIMEOUT_MS)
+        )
+
+
+async def op_expect_url(ctx, spec):
+    """Wait until the URL matches any of the given globs (``*`` spans ``/``)."""
+    page = await ctx.ensure_page()
+    patterns = spec["expect_url"]
+    patterns = [patterns] if isinstance(patterns, str) else patterns
+    await page.wait_for_url(
+        lambda url: any(fnmatch.fnmatchcase(url, ctx.render(p)) for p in patterns),
+        timeout=spec.get("timeout", EXPECT_TIMEOUT_MS),
+    )
+
+
+async def op_accept_dialogs(ctx, spec):
+    page = await ctx.ensure_page()
+    page.on("dialog", lambda dialog: asyncio.ensure_future(dialog.accept()))
+
+
+async def op_authenticate(ctx, spec):
+    await authenticate(ctx.context)
+
+
+async def op_save_credentials(ctx, spec):
+    """Persist the generated account for the auth cache (as TC003 always did)."""
+    with open(CREDENTIALS_PATH, "w", encoding="utf-8") as f:
+        f.write(f"{ctx.vars['email']}\n{ctx.vars['password']}")
+
+
+OPS = {
+    "goto": op_goto,
+    "click": op_click,
+    "fill": op_fill,
+    "expect_visible": op_expect_visible,
+    "expect_url": op_expect_url,
+    "accept_dialogs": op_accept_dialogs,
+    "authenticate": op_authenticate,
+    "save_credentials": op_save_credentials,
+}
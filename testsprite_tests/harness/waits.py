@@ -0,0 +1,154 @@
+"""Event-driven waits that replace the fixed sleeps of the generated cases.
+
+Every helper takes a per-step budget in milliseconds. The budget is a
+deadline shared by all the waits of that step, so a slow navigation eats
+into the time left for the response it triggered instead of stacking
+independent timeouts on top of each other.
+"""
+
+import time
+import weakref
+from contextlib import asynccontextmanager
+
+from . import evidence, perf, profiling
+from .browser import BASE_URL
+
+NAVIGATION_BUDGET_MS = 10000
+STEP_BUDGET_MS = 5000
+# Upper bound for the optional "let the page settle" wait after a step.
+SETTLE_MS = 2000
+
+_step_logs = weakref.WeakKeyDictionary()
+
+
+class StepBudget:
+    """Deadline for one step; :meth:`remaining` is what the next wait may use."""
+
+    def __init__(self, budget_ms):
+        self.budget_ms = budget_ms
+        self._deadline = time.monotonic() + budget_ms / 1000
+
+    def remaining(self, floor_ms=100):
+        left = int((self._deadline - time.monotonic()) * 1000)
+        return max(left, floor_ms)
+
+
+def _response_matcher(pattern):
+    """Match responses whose URL contains ``pattern`` (a callable is used as-is)."""
+    if callable(pattern):
+        return pattern
+    return lambda response: pattern in response.url
+
+
+def step_log(context):
+    """Timed :func:`goto`/:func:`click` steps run in ``context`` so far.
+
+    Entries have the shape of compiled plan ``step_results`` so reports can
+    treat both kinds of case alike.
+    """
+    return _step_logs.setdefault(context, [])
+
+
+@asynccontextmanager
+async def _timed_step(page, label):
+    log = step_log(page.context)
+    profiler = profiling.profiler_for(page)
+    before = await profiler.sample(page) if profiler is not None else None
+    started = time.perf_counter()
+    status = "FAILED"
+    try:
+        yield
+        status = "PASSED"
+    finally:
+        log.append({
+            "index": len(log) + 1, "description": label, "status": status,
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+        })
+        if profiler is not None:
+            profiler.record(label, before, await profiler.sample(page))
+
+
+async def _checkpoint(page, label):
+    buffer = evidence.buffer_for(page)
+    if buffer is not None:
+        await buffer.checkpoint(page, label)
+
+
+async def settle(page, timeout_ms=SETTLE_MS):
+    """Wait briefly for network idle; pages with long polling never get there."""
+    from playwright import async_api
+
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    except async_api.Error:
+        pass
+
+
+async def wait_for_dom(page, timeout_ms=STEP_BUDGET_MS):
+    """Wait for ``DOMContentLoaded`` on the page and its frames, non-fatally."""
+    from playwright import async_api
+
+    budget = StepBudget(timeout_ms)
+    for frame in page.frames:
+        try:
+            await frame.wait_for_load_state("domcontentloaded", timeout=budget.remaining())
+        except async_api.Error:
+            pass
+
+
+async def goto(page, path, *, response=None, budget_ms=NAVIGATION_BUDGET_MS):
+    """Navigate to ``BASE_URL + path`` and wait for the DOM instead of sleeping.
+
+    With ``response`` (a URL substring such as ``"/api/projects"`` or a
+    predicate) the navigation also waits for the first matching response,
+    which is how client-rendered lists signal that their data has arrived.
+    Returns the navigation response.
+    """
+    budget = StepBudget(budget_ms)
+    url = path if path.startswith("http") else f"{BASE_URL}{path}"
+    async with _timed_step(page, f"goto {path}"):
+        if response is None:
+            result = await page.goto(url, wait_until="commit", timeout=budget.remaining())
+        else:
+            async with page.expect_response(_response_matcher(response), timeout=budget.remaining()):
+                result = await page.goto(url, wait_until="commit", timeout=budget.remaining())
+        await wait_for_dom(page, budget.remaining())
+        await settle(page, min(SETTLE_MS, budget.remaining()))
+    recorder = perf.recorder_for(page)
+    if recorder is not None:
+        await recorder.capture(page)
+    await _checkpoint(page, f"goto {path}")
+    return result
+
+
+async def click(page, locator, *, response=None, navigation=False, budget_ms=STEP_BUDGET_MS):
+    """Click once the element is actionable and wait for what the click causes.
+
+    ``response`` waits for a matching network response, ``navigation``
+    waits for the URL to change: a new document must reach
+    ``DOMContentLoaded``, a client-side (Next ``<Link>``) transition only
+    has to update the URL. Playwright's own actionability checks replace
+    the old ``wait_for_timeout(3000)``.
+    """
+    budget = StepBudget(budget_ms)
+    # Captured before the click; waiting for a load state afterwards would
+    # resolve at once on the old document.
+    before = page.url
+    async with _timed_step(page, "click"):
+        if response is None:
+            await locator.click(timeout=budget.remaining())
+        else:
+            async with page.expect_response(_response_matcher(response), timeout=budget.remaining()):
+                await locator.click(timeout=budget.remaining())
+        if navigation:
+            await page.wait_for_url(lambda url: url != before, wait_until="domcontentloaded",
+                                    timeout=budget.remaining())
+        await settle(page, min(SETTLE_MS, budget.remaining()))
+    await _checkpoint(page, "click")
+
+
+async def open_page(context, path="/", *, response=None, budget_ms=NAVIGATION_BUDGET_MS):
+    """Open a new page in ``context`` and :func:`goto` ``path`` on it."""
+    page = await context.new_page()
+    await goto(page, path, response=response, budget_ms=budget_ms)
+    return page
@@ -0,0 +1,6 @@
+"""HTTP-level load and benchmark tooling for the Next.js ``/api/*`` routes."""
+
+from .client import BASE_URL, ApiClient
+from .stats import LatencyStats, Recorder, format_table, percentile
+
+__all__ = ["BASE_URL", "ApiClient", "LatencyStats", "Recorder", "format_table", "percentile"]
@@ -0,0 +1,104 @@
+"""Open-loop HTTP load generator for the Next.js ``/api/*`` routes.
+
+Arrivals follow a Poisson process at ``--rate`` scenarios per second no
+matter how slowly the server answers, so queueing shows up as latency
+instead of silently lowering the offered load (the coordinated-omission
+trap of closed-loop tools). Run it against ``next start`` backed by a
+local Supabase (``supabase start``), never against production::
+
+    python -m load --rate 50 --duration 60
+    python -m load --rate 200 --mix browse_feed=1,open_project=3 --json tmp/load.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from .client import BASE_URL, ApiClient, cached_access_token
+from .scenarios import DEFAULT_MIX, SCENARIOS, discover_fixtures, make_rng, parse_mix, picker
+from .stats import Recorder, format_table
+
+
+async def run_open_loop(client, fixtures, mix, rate, duration_sec, max_in_flight, seed=0):
+    """Fire scenarios at exponential inter-arrival times for ``duration_sec``.
+
+    Returns ``(scenario_recorder, elapsed_sec, dropped)``; arrivals that would
+    exceed ``max_in_flight`` are counted as dropped rather than queued.
+    """
+    rng = make_rng(seed)
+    pick = picker(mix, rng)
+    scenarios = Recorder()
+    in_flight = set()
+    dropped = 0
+
+    async def run_one(name):
+        started = time.perf_counter()
+        try:
+            await SCENARIOS[name](client, fixtures, rng)
+            status = 200
+        except Exception:
+            status = None
+        scenarios.add(name, (time.perf_counter() - started) * 1000, status)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    next_arrival = started
+    while next_arrival - started < duration_sec:
+        delay = next_arrival - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            dropped += 1
+        else:
+            task = asyncio.create_task(run_one(pick()))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        next_arrival += rng.expovariate(rate)
+    if in_flight:
+        await asyncio.gather(*in_flight)
+    return scenarios, loop.time() - started, dropped
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m load", description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--rate", type=float, default=20, help="scenario arrivals per second")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of arrivals")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="weighted scenarios, e.g. browse_feed=5,open_project=3")
+    parser.add_argument("--connections", type=int, default=64, help="keep-alive pool size")
+    parser.add_argument("--max-in-flight", type=int, default=2000)
+    parser.add_argument("--token", help="bearer token for authenticated calls (POST /api/likes); "
+                                        "defaults to the harness's cached login")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the summary as JSON here")
+    return parser.parse_args(argv)
+
+
+async def main(args):
+    async with ApiClient(args.base_url, connections=args.connections) as client:
+        fixtures = await discover_fixtures(client, token=args.token or cached_access_token())
+        client.recorder = Recorder()
+        scenarios, elapsed, dropped = await run_open_loop(
+            client, fixtures, args.mix, args.rate, args.duration, args.max_in_flight, args.seed
+        )
+    requests = client.recorder.summary(elapsed)
+    flows = scenarios.summary(elapsed)
+    print(format_table(requests, f"requests against {args.base_url} ({elapsed:.1f}s, "
+                                 f"{len(fixtures.project_ids)} projects)"))
+    print()
+    print(format_table(flows, "scenarios"))
+    total = sum(row["count"] for row in requests.values())
+    print(f"\n{total / elapsed:.1f} req/s overall, {dropped} arrival(s) dropped at max-in-flight")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"baseUrl": args.base_url, "rate": args.rate, "elapsedSec": elapsed,
+                       "dropped": dropped, "requests": requests, "scenarios": flows}, f, indent=2)
+    errors = sum(row["errors"] for row in requests.values())
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args(sys.argv[1:]))))
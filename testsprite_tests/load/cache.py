@@ -0,0 +1,294 @@
+"""Cache effectiveness probe for the API routes and pages behind ``next start``.
+
+``GET /api/projects`` declares ``revalidate = 60`` and answers with
+``s-maxage=60, stale-while-revalidate=300``; whether Next.js actually
+serves those responses from its cache (and spares Supabase) shows in the
+``x-nextjs-cache`` header and in the database's transaction counter. The
+probe runs four phases against :data:`ROUTES`:
+
+* **cold**: one request per route, one at a time (restart the server
+  first for a truly cold cache);
+* **warm**: ``--warm-requests`` requests drawn by the routes' weights,
+  like the feed's banner/first page/scroll sequence, ``--concurrency``
+  in flight;
+* **expiry**: after waiting ``--ttl-sec`` plus a margin, a burst of
+  ``--burst`` simultaneous requests per route; the database transactions
+  it causes against the cold cost show whether one request revalidates
+  or the whole burst goes to Supabase (a revalidation storm);
+* **keys**: ``--keys`` distinct URLs from ``--key-route``, sampling the
+  server's resident memory as the key space grows, then re-requesting the
+  first keys to see whether they were kept or evicted.
+
+Per route it reports cold vs warm latency, HIT/STALE/MISS ratios (``none``
+when the header is absent, i.e. the route rendered dynamically) and
+database transactions per request::
+
+    python -m load.cache
+    python -m load.cache --route "/api/projects?page=1&limit=20" --ttl-sec 60 --burst 100
+    python -m load.cache --keys 5000 --skip-expiry
+
+``src/lib/cache.ts``'s ``cachedFetch`` has no callers at this point, so
+its ``Map`` never fills on the server; the key-space phase measures the
+caches ``next start`` keeps itself. Needs a local ``supabase start``
+stack for the transaction counts (see :mod:`load.db`); runs are stored
+under ``tmp/bench/cache/``.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from . import db, results
+from .client import BASE_URL, ApiClient
+from .crawl import find_server_pid, rss_kib
+from .scenarios import make_rng
+from .stats import percentile
+
+SUITE = "cache"
+# Path -> weight of the warm phase, after the feed's request mix (see load.scenarios).
+ROUTES = {
+    "/api/projects?page=1&limit=20": 10,
+    "/api/projects?page=2&limit=20": 3,
+    "/api/banners?pageType=discover&activeOnly=true": 10,
+    "/api/recruit-items": 3,
+    "/": 5,
+    "/recruit": 2,
+}
+KEY_ROUTE = "/api/projects?page=1&limit=20&search=probe{i}"
+CACHE_HEADERS = ("x-nextjs-cache", "cache-control", "age")
+OUTCOMES = ("HIT", "STALE", "MISS", "none")
+# pg_stat_database is flushed by other backends about once a second.
+STATS_SETTLE_SEC = 1.1
+EXPIRY_MARGIN_SEC = 2
+RSS_SAMPLES = 20
+REVISIT = 50
+
+COUNTERS_SQL = """
+SELECT xact_commit + xact_rollback AS xacts, tup_returned + tup_fetched AS tuples
+FROM pg_stat_database WHERE datname = current_database()
+"""
+
+
+class DbCounter:
+    """Database-wide transaction and tuple counters, or nothing without a database."""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def read(self):
+        if self.pool is None:
+            return None
+        await asyncio.sleep(STATS_SETTLE_SEC)
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(COUNTERS_SQL)
+        return {"xacts": row["xacts"], "tuples": row["tuples"]}
+
+    @staticmethod
+    def delta(before, after, requests):
+        if before is None or after is None:
+            return None
+        # Minus the counter read itself.
+        xacts = after["xacts"] - before["xacts"] - 1
+        return {
+            "xacts": xacts,
+            "tuples": after["tuples"] - before["tuples"],
+            "xactsPerRequest": round(xacts / requests, 2) if requests else None,
+        }
+
+
+def outcome(sample):
+    value = (sample.get("headers") or {}).get("x-nextjs-cache")
+    return value.upper() if value else "none"
+
+
+def describe(samples):
+    """Latency and cache-header summary of a list of :meth:`ApiClient.timed_get` samples."""
+    latencies = sorted(s["totalMs"] for s in samples)
+    counts = {name: 0 for name in OUTCOMES}
+    for sample in samples:
+        name = outcome(sample)
+        counts[name] = counts.get(name, 0) + 1
+    return {
+        "requests": len(samples),
+        "errors": sum(s["status"] is None or s["status"] >= 400 for s in samples),
+        "p50Ms": round(percentile(latencies, 50), 1) if latencies else None,
+        "p95Ms": round(percentile(latencies, 95), 1) if latencies else None,
+        "cache": {name: round(count / len(samples), 3) for name, count in counts.items()} if samples else {},
+        "cacheControl": next((s["headers"]["cache-control"] for s in samples
+                              if (s.get("headers") or {}).get("cache-control")), None),
+    }
+
+
+async def get(client, path):
+    return await client.timed_get(path, name=path.split("?")[0], keep_headers=CACHE_HEADERS)
+
+
+async def cold_phase(client, counter, routes):
+    phase = {}
+    for path in routes:
+        before = await counter.read()
+        sample = await get(client, path)
+        phase[path] = {**describe([sample]), "db": DbCounter.delta(before, await counter.read(), 1)}
+    return phase
+
+
+async def warm_phase(client, counter, routes, requests, concurrency, seed):
+    rng = make_rng(seed)
+    paths = rng.choices(list(routes), weights=list(routes.values()), k=requests)
+    semaphore = asyncio.Semaphore(concurrency)
+    samples = {path: [] for path in routes}
+
+    async def one(path):
+        async with semaphore:
+            samples[path].append(await get(client, path))
+
+    before = await counter.read()
+    await asyncio.gather(*(one(path) for path in paths))
+    db_delta = DbCounter.delta(before, await counter.read(), requests)
+    return {path: describe(found) for path, found in samples.items() if found}, db_delta
+
+
+async def expiry_phase(client, counter, routes, burst, cold):
+    phase = {}
+    for path in routes:
+        before = await counter.read()
+        samples = await asyncio.gather(*(get(client, path) for _ in range(burst)))
+        db_delta = DbCounter.delta(before, await counter.read(), burst)
+        cold_cost = (cold.get(path, {}).get("db") or {}).get("xacts")
+        storm = None
+        if db_delta is not None and cold_cost:
+            # ~1: one revalidation for the burst; ~burst: every request hit the database.
+            storm = round(db_delta["xacts"] / cold_cost, 1)
+        phase[path] = {**describe(samples), "db": db_delta, "stormFactor": storm}
+    return phase
+
+
+async def key_phase(client, counter, key_route, keys, concurrency, pid):
+    semaphore = asyncio.Semaphore(concurrency)
+    every = max(1, keys // RSS_SAMPLES)
+    memory = [{"keys": 0, "rssKiB": rss_kib(pid) if pid else None}]
+    samples = []
+
+    async def one(i):
+        async with semaphore:
+            samples.append(await get(client, key_route.format(i=i)))
+
+    before = await counter.read()
+    for start in range(0, keys, every):
+        await asyncio.gather(*(one(i) for i in range(start, min(start + every, keys))))
+        memory.append({"keys": min(start + every, keys), "rssKiB": rss_kib(pid) if pid else None})
+    db_delta = DbCounter.delta(before, await counter.read(), keys)
+    revisit = [await get(client, key_route.format(i=i)) for i in range(min(REVISIT, keys))]
+    known = [m for m in memory if m["rssKiB"] is not None]
+    growth = None
+    if len(known) > 1 and known[-1]["keys"] > known[0]["keys"]:
+        growth = round((known[-1]["rssKiB"] - known[0]["rssKiB"]) / (known[-1]["keys"] - known[0]["keys"]), 2)
+    return {
+        "keys": keys,
+        "route": key_route,
+        "first": describe(samples),
+        "revisit": describe(revisit),
+        "db": db_delta,
+        "memory": memory,
+        "rssKiBPerKey": growth,
+    }
+
+
+def _pct(summary, name):
+    return f"{summary['cache'].get(name, 0) * 100:.0f}%" if summary.get("cache") else "-"
+
+
+def _ms(value):
+    return "-" if value is None else f"{value:.0f}"
+
+
+def print_report(data):
+    print(f"{'route':<46} {'cold':>6} {'warm p50':>9} {'HIT':>5} {'STALE':>6} {'MISS':>5} {'none':>5} "
+          f"{'burst p50':>10} {'storm':>6}")
+    for path in data["routes"]:
+        cold = data["cold"].get(path, {})
+        warm = data["warm"].get(path, {})
+        burst = data["expiry"].get(path, {})
+        storm = burst.get("stormFactor")
+        print(f"{path[:46]:<46} {_ms(cold.get('p50Ms')):>6} {_ms(warm.get('p50Ms')):>9} "
+              f"{_pct(warm, 'HIT'):>5} {_pct(warm, 'STALE'):>6} {_pct(warm, 'MISS'):>5} {_pct(warm, 'none'):>5} "
+              f"{_ms(burst.get('p50Ms')):>10} {'-' if storm is None else storm:>6}")
+    if data.get("warmDb"):
+        print(f"warm phase: {data['warmDb']['xactsPerRequest']} database transaction(s) per request")
+    keys = data.get("keys")
+    if keys:
+        kept = keys["revisit"]["cache"].get("HIT", 0) + keys["revisit"]["cache"].get("STALE", 0)
+        per_key = "-" if keys["rssKiBPerKey"] is None else f"{keys['rssKiBPerKey']} KiB"
+        print(f"key space: {keys['keys']} keys, server RSS +{per_key} per key, "
+              f"first {keys['revisit']['requests']} keys re-served from cache: {kept * 100:.0f}%")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m load.cache", description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--dsn", default=db.DATABASE_URL)
+    parser.add_argument("--no-db", action="store_true", help="skip the Postgres transaction counts")
+    parser.add_argument("--route", action="append", dest="routes",
+                        help="route to probe (repeatable; default: the feed's routes)")
+    parser.add_argument("--warm-requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--ttl-sec", type=float, default=60, help="revalidate/s-maxage of the routes")
+    parser.add_argument("--burst", type=int, default=50)
+    parser.add_argument("--skip-expiry", action="store_true")
+    parser.add_argument("--key-route", default=KEY_ROUTE, help="URL template with {i} for the key phase")
+    parser.add_argument("--keys", type=int, default=2000, help="distinct keys to request (0 skips)")
+    parser.add_argument("--server-pid", type=int, help="next server PID (default: found in /proc)")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+async def run(args):
+    routes = {path: 1 for path in args.routes} if args.routes else ROUTES
+    pid = args.server_pid or find_server_pid()
+    if pid is None:
+        print("next server process not found; memory will not be sampled", file=sys.stderr)
+    pool = None if args.no_db else await db.create_pool(args.dsn, size=1)
+    counter = DbCounter(pool)
+    data = {"baseUrl": args.base_url, "routes": list(routes), "ttlSec": args.ttl_sec}
+    try:
+        async with ApiClient(args.base_url, connections=max(args.concurrency, args.burst)) as client:
+            print("cold ...", file=sys.stderr, flush=True)
+            data["cold"] = await cold_phase(client, counter, routes)
+            warm_started = time.monotonic()
+            print("warm ...", file=sys.stderr, flush=True)
+            data["warm"], data["warmDb"] = await warm_phase(
+                client, counter, routes, args.warm_requests, args.concurrency, args.seed)
+            data["expiry"] = {}
+            if not args.skip_expiry:
+                wait = args.ttl_sec + EXPIRY_MARGIN_SEC - (time.monotonic() - warm_started)
+                print(f"waiting {max(wait, 0):.0f}s for the cache entries to expire ...", file=sys.stderr,
+                      flush=True)
+                await asyncio.sleep(max(wait, 0))
+                data["expiry"] = await expiry_phase(client, counter, routes, args.burst, data["cold"])
+            if args.keys:
+                print(f"key space ({args.keys} keys) ...", file=sys.stderr, flush=True)
+                data["keys"] = await key_phase(client, counter, args.key_route, args.keys,
+                                               args.concurrency, pid)
+    finally:
+        if pool is not None:
+            await pool.close()
+
+    print_report(data)
+    warm_ratios = [data["warm"][p]["cache"] for p in data["warm"]]
+    if warm_ratios and all(r.get("none", 0) == 1 for r in warm_ratios):
+        print("note: no response carried x-nextjs-cache; every route rendered dynamically")
+    storms = [p for p, burst in data["expiry"].items() if (burst.get("stormFactor") or 0) >= args.burst / 2]
+    for path in storms:
+        print(f"STORM {path}: the expiry burst reached the database about once per request")
+    path = results.write_run(SUITE, data)
+    print(f"\nrun -> {path}")
+    return 1 if storms else 0
+
+
+def main(argv=None):
+    return asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
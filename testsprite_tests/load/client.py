@@ -0,0 +1,126 @@
+"""Pooled keep-alive HTTP client that times every request it makes."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import aiohttp
+
+from .stats import Recorder
+
+BASE_URL = os.environ.get("TESTSPRITE_BASE_URL", "http://localhost:3000").rstrip("/")
+AUTH_STATE_PATH = Path(__file__).resolve().parent.parent / "tmp" / "auth_state.json"
+
+
+def cached_access_token(path=AUTH_STATE_PATH):
+    """Access token from the harness's cached storage state, if there is one."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    for origin in state.get("origins", []):
+        for item in origin.get("localStorage", []):
+            if item["name"].endswith("-auth-token"):
+                try:
+                    return json.loads(item["value"]).get("access_token")
+                except (ValueError, AttributeError):
+                    return None
+    return None
+
+
+class ApiClient:
+    """One ``aiohttp`` session with a bounded keep-alive connection pool.
+
+    Every call is recorded under ``name`` (defaulting to the path) in
+    :attr:`recorder`; transport errors are recorded with status ``None``
+    instead of being raised so a load run keeps going.
+    """
+
+    def __init__(self, base_url=BASE_URL, connections=64, timeout_sec=30, recorder=None):
+        self.base_url = base_url.rstrip("/")
+        self.connections = connections
+        self.timeout_sec = timeout_sec
+        self.recorder = recorder or Recorder()
+        self._session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.connections, limit_per_host=self.connections, keepalive_timeout=60
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout_sec)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+
+    async def request(self, method, path, *, name=None, token=None, **kwargs):
+        """Return ``(status, body_bytes)``; ``status`` is ``None`` on transport errors."""
+        headers = kwargs.pop("headers", {})
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        started = time.perf_counter()
+        status, body = None, b""
+        try:
+            async with self._session.request(
+                method, f"{self.base_url}{path}", headers=headers, **kwargs
+            ) as response:
+                body = await response.read()
+                status = response.status
+        except (aiohttp.ClientError, TimeoutError):
+            pass
+        self.recorder.add(
+            name or f"{method} {path.split('?')[0]}",
+            (time.perf_counter() - started) * 1000,
+            status,
+            len(body),
+        )
+        return status, body
+
+    async def get(self, path, **kwargs):
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path, **kwargs):
+        return await self.request("POST", path, **kwargs)
+
+    async def timed_get(self, path, *, name=None, keep_headers=(), **kwargs):
+        """GET ``path`` and return its status, time to first byte, total time and size.
+
+        ``ttfbMs`` is taken when the response headers have arrived; redirects
+        are followed and counted. ``status`` is ``None`` on transport errors.
+        The response headers named in ``keep_headers`` are returned under
+        ``headers`` (``None`` when absent).
+        """
+        started = time.perf_counter()
+        sample = {"status": None, "ttfbMs": None, "totalMs": None, "bytes": 0, "redirects": 0,
+                  "contentType": ""}
+        if keep_headers:
+            sample["headers"] = dict.fromkeys(keep_headers)
+        try:
+            async with self._session.get(f"{self.base_url}{path}", **kwargs) as response:
+                sample["ttfbMs"] = round((time.perf_counter() - started) * 1000, 1)
+                body = await response.read()
+                sample.update(
+                    status=response.status, bytes=len(body), redirects=len(response.history),
+                    contentType=response.headers.get("Content-Type", "").split(";")[0],
+                )
+                for header in keep_headers:
+                    sample["headers"][header] = response.headers.get(header)
+        except (aiohttp.ClientError, TimeoutError):
+            pass
+        sample["totalMs"] = round((time.perf_counter() - started) * 1000, 1)
+        self.recorder.add(name or f"GET {path.split('?')[0]}", sample["totalMs"], sample["status"],
+                          sample["bytes"])
+        return sample
+
+    async def get_json(self, path, **kwargs):
+        status, body = await self.get(path, **kwargs)
+        if status != 200:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
@@ -0,0 +1,300 @@
+"""Threaded-comment benchmark for ``GET /api/comments`` and the detail modal.
+
+For every shape and size it creates a fresh project (so it tops the feed)
+with a comment tree of that shape written straight into ``"Comment"``:
+
+* ``wide``: many top-level comments with a few direct replies each;
+* ``deep``: reply chains ``--chain`` levels deep;
+* ``viral``: preferential attachment, where busy threads attract more
+  replies, as under a trending project.
+
+Comments come from ``--commenters`` synthetic users, since the route looks
+every distinct author up in GoTrue. Per point it records the API's
+median/p95 latency, payload size and Postgres transactions per request
+(``pg_stat_database``, GoTrue's lookups included), then opens the project
+in the feed's detail modal (``ProjectDetailModalV2``) with Playwright and
+measures the comment fetch, the time from opening the comment panel to
+a ``comment-item`` being painted for every comment the route returned,
+and the DOM size of the list::
+
+    python -m load.comments --sizes 100,1000,5000
+    python -m load.comments --shapes deep --chain 200 --no-browser
+    python -m load.comments --cleanup
+
+Needs ``next start`` backed by a local ``supabase start`` stack (see
+:mod:`load.db`); the browser part needs Playwright and is skipped
+without it. Runs are stored under ``tmp/bench/comments/``.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import statistics
+import sys
+import time
+
+from . import db, results, seed
+from .cache import DbCounter
+from .client import BASE_URL, ApiClient
+from .scenarios import make_rng
+from .stats import percentile
+
+SUITE = "comments"
+USER_PREFIX = "comments"
+BENCH_MARK = "[bench-comments] "
+SHAPES = ("wide", "deep", "viral")
+DEFAULT_SIZES = [100, 1000, 5000]
+WIDE_REPLIES = 4
+VIRAL_REPLY_RATIO = 0.6
+# /api/projects is cached for up to a minute, so a new project can take that long to reach the feed.
+FEED_WAIT_SEC = 75
+RENDER_TIMEOUT_MS = 60000
+
+_RENDERED_SCRIPT = """
+async (expected) => {
+  const count = () => document.querySelectorAll('[data-testid=comment-item]').length;
+  while (count() < expected) await new Promise(r => requestAnimationFrame(r));
+  await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+  const list = document.querySelector('[data-testid=comment-list]');
+  return {items: count(), domNodes: list ? list.querySelectorAll('*').length : 0};
+}
+"""
+
+
+def tree(shape, size, rng, chain):
+    """``[(parent_index, depth)]`` for ``size`` comments of ``shape``."""
+    nodes = []
+    if shape == "wide":
+        roots = max(1, size // (WIDE_REPLIES + 1))
+        nodes = [(None, 0)] * roots
+        while len(nodes) < size:
+            nodes.append((rng.randrange(roots), 1))
+    elif shape == "deep":
+        for i in range(size):
+            parent = None if i % chain == 0 else i - 1
+            nodes.append((parent, 0 if parent is None else nodes[parent][1] + 1))
+    else:
+        # Every comment is a target once, plus once per reply it received.
+        targets = []
+        for i in range(size):
+            parent = rng.choice(targets) if targets and rng.random() < VIRAL_REPLY_RATIO else None
+            nodes.append((parent, 0 if parent is None else nodes[parent][1] + 1))
+            targets.append(i)
+            if parent is not None:
+                targets.append(parent)
+    return nodes
+
+
+async def create_point(conn, columns, shape, size, rng, owner, commenters, chain):
+    """Insert a project with a ``shape`` comment tree; returns ``(project_id, max_depth)``."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    project_id = await conn.fetchval(
+        """
+        INSERT INTO "Project" (user_id, category_id, title, content_text, thumbnail_url, rendering_type)
+        VALUES ($1, (SELECT min(category_id) FROM "Category"), $2, $3, $4, 'image')
+        RETURNING project_id
+        """,
+        owner, f"{BENCH_MARK}{shape} {size}", f"{shape} comment tree with {size} comments",
+        f"{seed.THUMBNAILS[0]}?w=800",
+    )
+    nodes = tree(shape, size, rng, chain)
+    comments = [{
+        "user_id": rng.choice(commenters), "project_id": project_id, "content": rng.choice(seed.COMMENTS),
+        "created_at": now - datetime.timedelta(seconds=size - i), "parent": parent, "depth": depth,
+    } for i, (parent, depth) in enumerate(nodes)]
+    await seed.insert_comments(conn, comments, columns)
+    return project_id, max(depth for _, depth in nodes)
+
+
+def count_tree(comments):
+    """``(comments, max_depth)`` of the nested ``replies`` the route returns."""
+    total, deepest = 0, -1
+    stack = [(c, 0) for c in comments]
+    while stack:
+        comment, depth = stack.pop()
+        total += 1
+        deepest = max(deepest, depth)
+        stack.extend((reply, depth + 1) for reply in comment.get("replies") or [])
+    return total, deepest
+
+
+async def measure_api(client, counter, project_id, repeats):
+    path = f"/api/comments?projectId={project_id}"
+    await client.get(path, name="warmup")
+    before = await counter.read()
+    first = await client.timed_get(path, name="GET /api/comments")
+    db_delta = DbCounter.delta(before, await counter.read(), 1)
+    samples = [first] + [await client.timed_get(path, name="GET /api/comments") for _ in range(repeats - 1)]
+    status, body = await client.get(path, name="payload")
+    returned, depth = (0, -1)
+    if status == 200:
+        returned, depth = count_tree(json.loads(body).get("comments") or [])
+    latencies = sorted(s["totalMs"] for s in samples)
+    return {
+        "status": status,
+        "p50Ms": round(percentile(latencies, 50), 1),
+        "p95Ms": round(percentile(latencies, 95), 1),
+        "ttfbMs": round(statistics.median(s["ttfbMs"] or 0 for s in samples), 1),
+        "bytes": len(body),
+        "returned": returned,
+        "returnedDepth": depth,
+        "db": db_delta,
+    }
+
+
+async def open_modal(page, project_id):
+    """Load the feed until the project's card shows up and open it; returns the fetch time."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+    card = page.locator(f'[data-testid=image-card][data-project-id="{project_id}"]')
+    deadline = time.monotonic() + FEED_WAIT_SEC
+    while True:
+        await page.goto("/", wait_until="domcontentloaded")
+        try:
+            await card.first.wait_for(state="visible", timeout=10000)
+            break
+        except PlaywrightTimeout:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(5)
+    started = time.perf_counter()
+    async with page.expect_response(lambda r: "/api/comments?" in r.url) as response_info:
+        await card.first.click()
+    await (await response_info.value).finished()
+    return (time.perf_counter() - started) * 1000
+
+
+async def measure_browser(browser, base_url, project_id, expected):
+    context = await browser.new_context(base_url=base_url, viewport={"width": 1440, "height": 900})
+    try:
+        page = await context.new_page()
+        fetch_ms = await open_modal(page, project_id)
+        button = page.locator("[data-testid=project-detail-modal] [data-testid=project-comment-button]")
+        started = time.perf_counter()
+        await button.filter(visible=True).first.click()
+        await page.wait_for_selector("[data-testid=comment-list]")
+        try:
+            rendered = await asyncio.wait_for(page.evaluate(_RENDERED_SCRIPT, expected),
+                                              RENDER_TIMEOUT_MS / 1000)
+        except asyncio.TimeoutError:
+            # The wait's length is not a render time; keep it out of renderMs.
+            rendered = await page.evaluate(
+                "() => ({items: document.querySelectorAll('[data-testid=comment-item]').length, domNodes: null})")
+            return {"fetchMs": round(fetch_ms, 1), "renderMs": None, "renderTimedOut": True, **rendered}
+        return {
+            "fetchMs": round(fetch_ms, 1),
+            "renderMs": round((time.perf_counter() - started) * 1000, 1),
+            "renderTimedOut": False,
+            **rendered,
+        }
+    finally:
+        await context.close()
+
+
+def print_table(rows):
+    print(f"{'shape':<6} {'size':>6} {'depth':>5} {'api p50':>8} {'p95':>7} {'KiB':>8} {'tx/req':>7} "
+          f"{'fetch ms':>9} {'render ms':>10} {'DOM':>7}")
+    for row in rows:
+        api, ui = row["api"], row.get("browser") or {}
+        tx = "-" if not api["db"] else api["db"]["xacts"]
+        render = "timeout" if ui.get("renderTimedOut") else "-" if "renderMs" not in ui else f"{ui['renderMs']:.0f}"
+        print(f"{row['shape']:<6} {row['size']:>6} {row['depth']:>5} {api['p50Ms']:>8.0f} {api['p95Ms']:>7.0f} "
+              f"{api['bytes'] / 1024:>8.1f} {tx:>7} {ui.get('fetchMs', '-'):>9} {render:>10} "
+              f"{ui.get('domNodes') if ui.get('domNodes') is not None else '-':>7}")
+
+
+def _split(value, cast=int):
+    return [cast(part) for part in value.split(",") if part.strip()]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m load.comments", description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--dsn", default=db.DATABASE_URL)
+    parser.add_argument("--sizes", type=_split, default=DEFAULT_SIZES, help="comma-separated comment counts")
+    parser.add_argument("--shapes", type=lambda s: _split(s, str), default=list(SHAPES))
+    parser.add_argument("--chain", type=int, default=50, help="reply depth of the deep shape's chains")
+    parser.add_argument("--commenters", type=int, default=200, help="distinct synthetic authors")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--no-browser", action="store_true", help="skip the modal render measurement")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--cleanup", action="store_true", help="delete the bench projects and users afterwards")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    unknown = set(args.shapes) - set(SHAPES)
+    if unknown:
+        parser.error(f"unknown shape(s) {', '.join(sorted(unknown))}; choose from {', '.join(SHAPES)}")
+    return args
+
+
+async def run(args):
+    browser = playwright = None
+    if not args.no_browser:
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            print("playwright is not installed; measuring the API only", file=sys.stderr)
+        else:
+            playwright = await async_playwright().start()
+            browser = await playwright.chromium.launch(headless=not args.headed)
+    pool = await db.create_pool(args.dsn, size=2)
+    counter = DbCounter(pool)
+    rows = []
+    try:
+        async with pool.acquire() as conn:
+            columns = (await seed.table_columns(conn, ["Comment"])).get("Comment")
+            if not columns:
+                raise RuntimeError('"Comment" not found; run supabase/schema.sql first')
+            await conn.execute('DELETE FROM "Project" WHERE title LIKE $1', BENCH_MARK + "%")
+            users = await db.ensure_users(conn, args.commenters + 1, USER_PREFIX)
+        owner, commenters = users[0][0], [user_id for user_id, _ in users[1:]]
+        async with ApiClient(args.base_url, connections=4, timeout_sec=120) as client:
+            for size in args.sizes:
+                for shape in args.shapes:
+                    rng = make_rng(f"{args.seed}:{shape}:{size}")
+                    async with pool.acquire() as conn:
+                        project_id, depth = await create_point(conn, columns, shape, size, rng, owner,
+                                                               commenters, args.chain)
+                    row = {"shape": shape, "size": size, "depth": depth, "projectId": project_id,
+                           "api": await measure_api(client, counter, project_id, args.repeats)}
+                    # The route can return fewer comments than were written (PostgREST's
+                    # row limit), so wait for what it actually returned.
+                    if browser is not None and row["api"]["returned"]:
+                        row["browser"] = await measure_browser(browser, args.base_url, project_id,
+                                                               row["api"]["returned"])
+                    rows.append(row)
+                    print(f"  {shape} {size}: {row['api']['p50Ms']:.0f} ms", file=sys.stderr, flush=True)
+        if args.cleanup:
+            async with pool.acquire() as conn:
+                await conn.execute('DELETE FROM "Project" WHERE title LIKE $1', BENCH_MARK + "%")
+                await db.delete_users(conn, USER_PREFIX)
+    finally:
+        await pool.close()
+        if browser is not None:
+            await browser.close()
+            await playwright.stop()
+
+    print_table(rows)
+    for row in rows:
+        if row["api"]["returned"] != row["size"]:
+            print(f"note: {row['shape']} {row['size']}: the route returned {row['api']['returned']} comment(s)")
+        if (row.get("browser") or {}).get("renderTimedOut"):
+            print(f"note: {row['shape']} {row['size']}: the list did not finish rendering "
+                  f"within {RENDER_TIMEOUT_MS / 1000:.0f}s")
+    path = results.write_run(SUITE, {"baseUrl": args.base_url, "commenters": args.commenters,
+                                     "chain": args.chain, "rows": rows})
+    print(f"\nrun -> {path}")
+    return 0 if all(row["api"]["status"] == 200 for row in rows) else 1
+
+
+def main(argv=None):
+    try:
+        return asyncio.run(run(parse_args(argv)))
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
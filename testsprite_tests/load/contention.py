@@ -0,0 +1,251 @@
+"""Like/view contention benchmark for the project counter triggers.
+
+``setup_project_counts.sql`` keeps ``likes_count`` in step with ``"Like"``
+through a per-row ``UPDATE "Project"`` trigger, and every view runs
+``increment_views``, so all traffic for one trending project serialises
+on a single row lock. This fires thousands of concurrent like/unlike
+toggles (``POST /api/likes``) and views (``POST /api/projects/[id]/view``)
+from synthetic users at a few hot projects, samples lock waits from
+``pg_stat_activity`` while it runs, then checks the counters against the
+real rows::
+
+    python -m load.contention --users 500 --ops 5000 --concurrency 256
+    python -m load.contention --project 12 --view-ratio 0.8 --cleanup
+
+Needs ``next start`` backed by a local ``supabase start`` stack (see
+:mod:`load.db`). Exits non-zero when a counter drifts from its rows.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from . import db
+from .client import BASE_URL, ApiClient
+from .scenarios import make_rng
+from .stats import format_table
+
+USER_PREFIX = "contention"
+LIKE_NAME = "POST /api/likes"
+VIEW_NAME = "POST /api/projects/[id]/view"
+SAMPLE_INTERVAL_SEC = 0.1
+
+LOCK_SAMPLE_SQL = """
+SELECT
+  count(*) FILTER (WHERE a.wait_event_type = 'Lock') AS waiting,
+  coalesce(max(extract(epoch FROM now() - a.state_change) * 1000)
+           FILTER (WHERE a.wait_event_type = 'Lock'), 0) AS longest_ms,
+  coalesce(jsonb_object_agg(a.wait_event, 1) FILTER (WHERE a.wait_event_type = 'Lock'),
+           '{}') AS events
+FROM pg_stat_activity a
+WHERE a.datname = current_database() AND a.pid <> pg_backend_pid()
+"""
+
+COUNTERS_SQL = """
+SELECT p.project_id, coalesce(p.likes_count, 0) AS likes_count,
+       coalesce(p.views_count, 0) AS views_count,
+       (SELECT count(*) FROM "Like" l WHERE l.project_id = p.project_id) AS like_rows
+FROM "Project" p
+WHERE p.project_id = ANY($1::int[])
+ORDER BY p.project_id
+"""
+
+
+class LockSampler:
+    """Polls ``pg_stat_activity`` for backends blocked on heavyweight locks."""
+
+    def __init__(self, pool, interval_sec=SAMPLE_INTERVAL_SEC):
+        self.pool = pool
+        self.interval_sec = interval_sec
+        self.samples = 0
+        self.waiting_total = 0
+        self.max_waiting = 0
+        self.longest_ms = 0.0
+        self.events = {}
+        self._task = None
+
+    async def _run(self):
+        async with self.pool.acquire() as conn:
+            while True:
+                row = await conn.fetchrow(LOCK_SAMPLE_SQL)
+                self.samples += 1
+                self.waiting_total += row["waiting"]
+                self.max_waiting = max(self.max_waiting, row["waiting"])
+                self.longest_ms = max(self.longest_ms, float(row["longest_ms"]))
+                for event in json.loads(row["events"]):
+                    self.events[event] = self.events.get(event, 0) + 1
+                await asyncio.sleep(self.interval_sec)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    def summary(self):
+        return {
+            "samples": self.samples,
+            "meanWaiting": self.waiting_total / self.samples if self.samples else 0,
+            "maxWaiting": self.max_waiting,
+            "longestWaitMs": self.longest_ms,
+            "waitEvents": dict(sorted(self.events.items(), key=lambda kv: -kv[1])),
+        }
+
+
+async def hot_projects(conn, explicit, count):
+    if explicit:
+        return explicit
+    rows = await conn.fetch(
+        'SELECT project_id FROM "Project" ORDER BY views_count DESC NULLS LAST LIMIT $1', count
+    )
+    return [row["project_id"] for row in rows]
+
+
+async def read_counters(conn, project_ids):
+    return {row["project_id"]: dict(row) for row in await conn.fetch(COUNTERS_SQL, project_ids)}
+
+
+async def deadlocks(conn):
+    return await conn.fetchval(
+        "SELECT deadlocks FROM pg_stat_database WHERE datname = current_database()"
+    )
+
+
+async def fire(client, users, project_ids, ops, concurrency, view_ratio, seed):
+    """Run ``ops`` operations with at most ``concurrency`` in flight.
+
+    Returns successful view counts per project; like toggles are checked
+    against the ``"Like"`` rows afterwards, so their outcome is not tracked.
+    """
+    rng = make_rng(seed)
+    tokens = {user_id: db.mint_token(user_id, email) for user_id, email in users}
+    user_ids = list(tokens)
+    views_ok = dict.fromkeys(project_ids, 0)
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(project_id, user_id, is_view):
+        async with gate:
+            if is_view:
+                status, _ = await client.post(f"/api/projects/{project_id}/view", name=VIEW_NAME)
+                if status == 200:
+                    views_ok[project_id] += 1
+            else:
+                await client.post(
+                    "/api/likes", name=LIKE_NAME, token=tokens[user_id],
+                    json={"projectId": project_id},
+                )
+
+    await asyncio.gather(*(
+        one(rng.choice(project_ids), rng.choice(user_ids), rng.random() < view_ratio)
+        for _ in range(ops)
+    ))
+    return views_ok
+
+
+def verify(before, after, views_ok):
+    """Rows describing each project's drift; an empty ``problems`` list means consistent."""
+    report, problems = [], []
+    for project_id, row in after.items():
+        expected_views = before[project_id]["views_count"] + views_ok[project_id]
+        entry = {
+            "projectId": project_id,
+            "likesCount": row["likes_count"],
+            "likeRows": row["like_rows"],
+            "viewsCount": row["views_count"],
+            "expectedViews": expected_views,
+        }
+        report.append(entry)
+        if row["likes_count"] != row["like_rows"]:
+            problems.append(f"project {project_id}: likes_count {row['likes_count']} != "
+                            f"{row['like_rows']} Like rows")
+        if row["views_count"] != expected_views:
+            problems.append(f"project {project_id}: views_count {row['views_count']} != "
+                            f"{expected_views} (before + successful view calls)")
+    return report, problems
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m load.contention",
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--dsn", default=db.DATABASE_URL)
+    parser.add_argument("--users", type=int, default=200, help="synthetic users to like from")
+    parser.add_argument("--project", type=int, action="append", dest="projects",
+                        help="project id to hammer (repeatable); defaults to the most viewed")
+    parser.add_argument("--hot", type=int, default=3, help="how many most-viewed projects to use")
+    parser.add_argument("--ops", type=int, default=3000, help="total like toggles + views")
+    parser.add_argument("--concurrency", type=int, default=256, help="requests in flight")
+    parser.add_argument("--view-ratio", type=float, default=0.5, help="share of operations that are views")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cleanup", action="store_true",
+                        help="delete the synthetic users and restore views_count afterwards")
+    parser.add_argument("--json", help="also write the summary as JSON here")
+    return parser.parse_args(argv)
+
+
+async def main(args):
+    pool = await db.create_pool(args.dsn)
+    try:
+        async with pool.acquire() as conn:
+            project_ids = await hot_projects(conn, args.projects, args.hot)
+            if not project_ids:
+                print("no projects to benchmark; seed the database first", file=sys.stderr)
+                return 2
+            users = await db.ensure_users(conn, args.users, USER_PREFIX)
+            before = await read_counters(conn, project_ids)
+            deadlocks_before = await deadlocks(conn)
+
+        sampler = LockSampler(pool)
+        sampler.start()
+        started = time.perf_counter()
+        try:
+            async with ApiClient(args.base_url, connections=args.concurrency) as client:
+                views_ok = await fire(client, users, project_ids, args.ops, args.concurrency,
+                                      args.view_ratio, args.seed)
+        finally:
+            await sampler.stop()
+        elapsed = time.perf_counter() - started
+
+        async with pool.acquire() as conn:
+            after = await read_counters(conn, project_ids)
+            new_deadlocks = (await deadlocks(conn)) - deadlocks_before
+            report, problems = verify(before, after, views_ok)
+            if args.cleanup:
+                await db.delete_users(conn, USER_PREFIX)
+                await conn.executemany(
+                    'UPDATE "Project" SET views_count = $2 WHERE project_id = $1',
+                    [(pid, row["views_count"]) for pid, row in before.items()],
+                )
+    finally:
+        await pool.close()
+
+    requests = client.recorder.summary(elapsed)
+    locks = sampler.summary()
+    print(format_table(requests, f"{args.ops} ops from {len(users)} users on projects "
+                                 f"{', '.join(map(str, project_ids))} ({elapsed:.1f}s)"))
+    print(f"\n{args.ops / elapsed:.1f} ops/s; lock waiters mean {locks['meanWaiting']:.1f}, "
+          f"max {locks['maxWaiting']}, longest wait {locks['longestWaitMs']:.0f} ms; "
+          f"{new_deadlocks} deadlock(s)")
+    if locks["waitEvents"]:
+        print("lock wait events: " + ", ".join(f"{k} x{v}" for k, v in locks["waitEvents"].items()))
+    for problem in problems:
+        print(f"MISMATCH {problem}")
+    if not problems:
+        print("counters match the Like rows and successful view calls")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"baseUrl": args.base_url, "projects": project_ids, "ops": args.ops,
+                       "elapsedSec": elapsed, "requests": requests, "locks": locks,
+                       "deadlocks": new_deadlocks, "counters": report, "problems": problems},
+                      f, indent=2)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args(sys.argv[1:]))))
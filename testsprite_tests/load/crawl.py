@@ -0,0 +1,290 @@
+"""Throughput benchmark for the recruit crawler behind ``POST /api/crawl``.
+
+Runs :mod:`load.fakeboard` in-process, triggers the crawl (with the cron
+secret, as the ``vercel.json`` schedule does) for each value of one board
+setting (``--sweep``: source latency, injected error rate or listings per
+page) and records per value:
+
+* wall time, items found/added/updated and items per second;
+* what the crawler fetched from the fake boards (requests, distinct pages,
+  bytes), which shows how far it follows pagination;
+* ``recruit_items`` rows written and transactions committed while the
+  crawl ran, i.e. how well the database writes are batched;
+* resident memory of the ``next`` server process (start, peak, end).
+
+The crawler itself caps each source (:data:`SOURCE_CAPS`): it keeps the
+first 10 Wevity listings and asks Wanted for ``limit=12`` without following
+``links.next``. A crawl therefore reads at most 22 listings however large
+the boards are, so the default sweep varies source latency, which does
+change the crawl. ``--sweep items`` shows where the caps bite; the run warns
+when ``found`` stays flat across sizes.
+
+Start the app against the fake boards and a local ``supabase start``::
+
+    CRAWLER_SOURCE_BASE=http://127.0.0.1:8765 npx next start
+    python -m load.crawl                                   # latency 0,100,400 ms
+    python -m load.crawl --sweep error-rate --values 0,0.2,0.5 --runs 5
+    python -m load.crawl --sweep items --values 10,100,1000 --pages 3
+
+Runs are stored under ``tmp/bench/crawl/`` (see :mod:`load.results`).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from . import db, results
+from .client import BASE_URL, ApiClient
+from .fakeboard import DEFAULT_PORT, FakeBoard, serve
+
+SUITE = "crawl"
+CRAWL_NAME = "POST /api/crawl"
+# The route's fallback when CRON_SECRET is unset.
+DEFAULT_SECRET = os.environ.get("CRON_SECRET", "your-secret-key-here")
+RSS_INTERVAL_SEC = 0.1
+# Listings per crawl each source can yield, whatever the board serves
+# (src/lib/crawlers/crawler.ts: Wevity ``slice(0, 10)``, Wanted ``limit=12``).
+SOURCE_CAPS = {"wevity": 10, "wanted": 12}
+# --sweep name -> (FakeBoard attribute, value type, default values)
+SWEEPS = {
+    "latency-ms": ("latency_ms", float, [0, 100, 400]),
+    "error-rate": ("error_rate", float, [0.0, 0.2, 0.5]),
+    "items": ("items", int, [10, 100, 1000]),
+}
+
+WRITES_SQL = """
+SELECT coalesce(sum(n_tup_ins), 0) AS inserted, coalesce(sum(n_tup_upd), 0) AS updated
+FROM pg_stat_user_tables WHERE relname IN ('recruit_items', 'crawl_logs')
+"""
+COMMITS_SQL = "SELECT xact_commit FROM pg_stat_database WHERE datname = current_database()"
+
+
+def _split(value, cast=int):
+    return [cast(part) for part in value.split(",") if part.strip()]
+
+
+def find_server_pid():
+    """PID of the local ``next start``/``next-server`` process, or ``None``."""
+    for proc in Path("/proc").glob("[0-9]*"):
+        try:
+            cmdline = (proc / "cmdline").read_bytes().replace(b"\0", b" ")
+        except OSError:
+            continue
+        if b"next-server" in cmdline or b"next start" in cmdline:
+            return int(proc.name)
+    return None
+
+
+def rss_kib(pid):
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+class RssSampler:
+    """Polls a process's resident set size while a crawl runs."""
+
+    def __init__(self, pid, interval_sec=RSS_INTERVAL_SEC):
+        self.pid = pid
+        self.interval_sec = interval_sec
+        self.start_kib = self.peak_kib = rss_kib(pid) if pid else None
+        self._task = None
+
+    async def _run(self):
+        while True:
+            current = rss_kib(self.pid)
+            if current is not None:
+                self.peak_kib = max(self.peak_kib or 0, current)
+            await asyncio.sleep(self.interval_sec)
+
+    def start(self):
+        if self.pid:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        end = rss_kib(self.pid) if self.pid else None
+        return {"startKiB": self.start_kib, "peakKiB": self.peak_kib, "endKiB": end}
+
+
+async def db_counters(pool):
+    async with pool.acquire() as conn:
+        writes = await conn.fetchrow(WRITES_SQL)
+        return {"inserted": writes["inserted"], "updated": writes["updated"],
+                "commits": await conn.fetchval(COMMITS_SQL)}
+
+
+async def crawl_once(client, pool, board, crawl_type, secret, pid):
+    """Trigger one crawl and measure it; returns a sample dict."""
+    board.reset_stats()
+    before = await db_counters(pool)
+    sampler = RssSampler(pid)
+    sampler.start()
+    started = time.perf_counter()
+    try:
+        status, body = await client.post(
+            "/api/crawl", name=CRAWL_NAME, headers={"Authorization": "Bearer cron"},
+            json={"type": crawl_type, "secret": secret},
+        )
+    finally:
+        memory = await sampler.stop()
+    elapsed = time.perf_counter() - started
+    after = await db_counters(pool)
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        payload = {}
+    found = payload.get("itemsFound", 0)
+    written = (after["inserted"] - before["inserted"]) + (after["updated"] - before["updated"])
+    commits = after["commits"] - before["commits"]
+    return {
+        "status": status,
+        "error": payload.get("error"),
+        "elapsedSec": round(elapsed, 3),
+        "itemsFound": found,
+        "itemsAdded": payload.get("itemsAdded", 0),
+        "itemsUpdated": payload.get("itemsUpdated", 0),
+        "itemsPerSec": round(found / elapsed, 2) if elapsed else 0.0,
+        "rowsWritten": written,
+        "commits": commits,
+        "commitsPerItem": round(commits / found, 2) if found else None,
+        "fetched": board.snapshot(),
+        "memory": memory,
+    }
+
+
+def summarize(value, samples):
+    ok = [s for s in samples if s["status"] == 200] or samples
+    peaks = [s["memory"]["peakKiB"] for s in ok if s["memory"]["peakKiB"]]
+    starts = [s["memory"]["startKiB"] for s in ok if s["memory"]["startKiB"]]
+    return {
+        "value": value,
+        "runs": len(samples),
+        "failedRuns": sum(s["status"] != 200 for s in samples),
+        "medianSec": statistics.median(s["elapsedSec"] for s in ok),
+        "itemsFound": statistics.median(s["itemsFound"] for s in ok),
+        "itemsPerSec": statistics.median(s["itemsPerSec"] for s in ok),
+        "rowsWritten": statistics.median(s["rowsWritten"] for s in ok),
+        "commitsPerItem": statistics.median(
+            [s["commitsPerItem"] for s in ok if s["commitsPerItem"] is not None] or [0]),
+        "pagesFetched": max(sum(s["fetched"]["pages"].values()) for s in ok),
+        "sourcesFetched": max(len(s["fetched"]["pages"]) for s in ok),
+        "peakRssDeltaMiB": round((max(peaks) - min(starts)) / 1024, 1) if peaks and starts else None,
+    }
+
+
+def capped_sizes(rows):
+    """Successful rows of an ``items`` sweep whose items found never grew; else empty."""
+    ok = [row for row in rows if row["failedRuns"] < row["runs"]]
+    if len(ok) < 2 or len({row["itemsFound"] for row in ok}) > 1:
+        return []
+    return ok
+
+
+def print_table(sweep, rows):
+    print(f"{sweep:>10} {'runs':>5} {'median s':>9} {'found':>7} {'items/s':>9} "
+          f"{'rows':>6} {'tx/item':>8} {'pages':>6} {'RSS +MiB':>9}")
+    for row in rows:
+        rss = "-" if row["peakRssDeltaMiB"] is None else f"{row['peakRssDeltaMiB']:.1f}"
+        print(f"{row['value']:>10g} {row['runs'] - row['failedRuns']:>2}/{row['runs']:<2} "
+              f"{row['medianSec']:>9.2f} {row['itemsFound']:>7.0f} {row['itemsPerSec']:>9.1f} "
+              f"{row['rowsWritten']:>6.0f} {row['commitsPerItem']:>8.2f} {row['pagesFetched']:>6} "
+              f"{rss:>9}")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m load.crawl", description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--dsn", default=db.DATABASE_URL)
+    parser.add_argument("--host", default="127.0.0.1", help="address the fake boards listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--sweep", default="latency-ms", choices=list(SWEEPS),
+                        help="board setting to vary between crawls")
+    parser.add_argument("--values", type=lambda value: _split(value, float),
+                        help="comma-separated values of the swept setting (default per --sweep)")
+    parser.add_argument("--items", type=int, default=50, help="listings per page when not swept")
+    parser.add_argument("--pages", type=int, default=3, help="pagination depth of each board")
+    parser.add_argument("--latency-ms", type=float, default=50, help="source latency when not swept")
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="injected 503 rate when not swept")
+    parser.add_argument("--type", default="all", choices=["all", "job", "contest", "event"])
+    parser.add_argument("--runs", type=int, default=3, help="crawls per listing size")
+    parser.add_argument("--secret", default=DEFAULT_SECRET, help="CRON_SECRET of the server")
+    parser.add_argument("--server-pid", type=int, help="next server PID for memory sampling "
+                                                       "(default: found in /proc)")
+    parser.add_argument("--cleanup", action="store_true", help="delete the crawled bench rows afterwards")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+async def run(args):
+    pid = args.server_pid or find_server_pid()
+    if pid is None:
+        print("next server process not found; memory will not be sampled", file=sys.stderr)
+    attribute, cast, defaults = SWEEPS[args.sweep]
+    values = [cast(value) for value in args.values] if args.values else defaults
+    board = FakeBoard(items=args.items, pages=args.pages, latency_ms=args.latency_ms,
+                      jitter_ms=args.jitter_ms, error_rate=args.error_rate, seed=args.seed)
+    runner = await serve(board, args.host, args.port)
+    pool = await db.create_pool(args.dsn)
+    rows, samples = [], {}
+    try:
+        async with ApiClient(args.base_url, connections=4, timeout_sec=600) as client:
+            for value in values:
+                board.configure(**{attribute: value})
+                samples[value] = []
+                for _ in range(args.runs):
+                    sample = await crawl_once(client, pool, board, args.type, args.secret, pid)
+                    samples[value].append(sample)
+                    if sample["status"] != 200:
+                        print(f"{args.sweep}={value}: crawl returned {sample['status']}: {sample['error']}",
+                              file=sys.stderr)
+                rows.append(summarize(value, samples[value]))
+        if args.cleanup:
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM recruit_items WHERE title LIKE '[벤치]%'")
+    finally:
+        await pool.close()
+        await runner.cleanup()
+
+    print_table(args.sweep, rows)
+    capped = capped_sizes(rows) if args.sweep == "items" else []
+    if capped:
+        caps = ", ".join(f"{source} {cap}" for source, cap in SOURCE_CAPS.items())
+        sizes = ",".join(f"{row['value']:g}" for row in capped)
+        print(f"warning: items found stayed at {capped[0]['itemsFound']:.0f} for items {sizes}; "
+              f"the crawler caps each source ({caps}) and does not follow pagination, "
+              f"so those sizes measure the same crawl")
+    elif args.pages > 1 and rows and all(row["pagesFetched"] <= row["sourcesFetched"] for row in rows):
+        print(f"note: the crawler fetched one page per source although each board has {args.pages}")
+    path = results.write_run(SUITE, {
+        "baseUrl": args.base_url, "type": args.type, "sweep": args.sweep, "pages": args.pages,
+        "items": args.items, "latencyMs": args.latency_ms, "errorRate": args.error_rate,
+        "sourceCaps": SOURCE_CAPS, "cappedSizes": [row["value"] for row in capped],
+        "rows": rows, "samples": {str(k): v for k, v in samples.items()},
+    })
+    print(f"\nrun -> {path}")
+    return 0 if all(row["failedRuns"] < row["runs"] for row in rows) else 1
+
+
+def main(argv=None):
+    return asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""Local stand-in for the job boards ``src/lib/crawlers/crawler.ts`` scrapes.
+
+Serves generated listings in the shapes the crawler parses:
+
+* ``/wevity/?c=find...&gp=N``: an HTML contest list of ``li > .hide-info``
+  entries, ``items`` per page with a next-page link until ``pages``;
+* ``/wanted/api/v4/jobs?limit=&offset=``: the Wanted jobs JSON with
+  ``links.next`` until ``items * pages`` jobs have been served.
+
+Every response waits ``latency_ms`` (plus up to ``jitter_ms``) and fails
+with 503 at ``error_rate``. Start ``next`` with
+``CRAWLER_SOURCE_BASE=http://127.0.0.1:8765`` to crawl it::
+
+    python -m load.fakeboard --port 8765 --items 200 --pages 5 --latency-ms 80
+
+:mod:`load.crawl` runs it in-process and reads :attr:`FakeBoard.stats`.
+"""
+
+import argparse
+import asyncio
+import datetime
+import html
+import json
+import random
+import sys
+
+from aiohttp import web
+
+DEFAULT_PORT = 8765
+CATEGORIES = ["디자인", "웹/모바일/IT", "영상/UCC", "광고/마케팅", "캐릭터/만화"]
+SKILLS = ["Figma", "Photoshop", "Illustrator", "After Effects", "React", "TypeScript", "Blender"]
+COMPANIES = ["스튜디오 오로라", "(주)픽셀웍스", "브랜드랩", "모션하우스", "크리에이티브원"]
+CITIES = ["서울", "성남", "부산", "대전", "원격"]
+
+
+class FakeBoard:
+    """Generated listings plus counters of what the crawler fetched."""
+
+    def __init__(self, items=50, pages=1, latency_ms=0, jitter_ms=0, error_rate=0.0, seed=0):
+        self.items = items
+        self.pages = pages
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {"requests": {}, "pages": {}, "bytes": 0, "errors": 0}
+
+    def configure(self, **settings):
+        for name, value in settings.items():
+            setattr(self, name, value)
+        self.reset_stats()
+
+    async def _delay(self):
+        wait_ms = self.latency_ms + (self.rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if wait_ms:
+            await asyncio.sleep(wait_ms / 1000)
+
+    async def _respond(self, source, page, make):
+        stats = self.stats
+        stats["requests"][source] = stats["requests"].get(source, 0) + 1
+        stats["pages"].setdefault(source, set()).add(page)
+        await self._delay()
+        if self.error_rate and self.rng.random() < self.error_rate:
+            stats["errors"] += 1
+            return web.Response(status=503, text="injected failure")
+        response = make()
+        stats["bytes"] += len(response.body)
+        return response
+
+    def _due(self, index):
+        return (datetime.date(2026, 1, 1) + datetime.timedelta(days=index % 180)).isoformat()
+
+    async def wevity(self, request):
+        page = max(1, int(request.query.get("gp", 1)))
+
+        def make():
+            first = (page - 1) * self.items
+            rows = []
+            if page <= self.pages:
+                for i in range(first, first + self.items):
+                    rows.append(
+                        f'<li><div class="thumb"><img src="/upload/contest/{i}.jpg" alt=""></div>'
+                        f'<div class="hide-info"><div class="hide-tit"><a href="?c=find&amp;s=1&amp;gbn=view'
+                        f'&amp;ix={100000 + i}">{html.escape(f"[벤치] 디자인 공모전 {i}")}</a></div>'
+                        f'<div class="hide-dday">D-{i % 60}</div>'
+                        f'<div class="hide-cat">{CATEGORIES[i % len(CATEGORIES)]}</div></div></li>'
+                    )
+            pager = (f'<a class="next" href="?c=find&amp;s=1&amp;gub=1&amp;cidx=20&amp;gp={page + 1}">다음</a>'
+                     if page < self.pages else "")
+            body = ('<!DOCTYPE html><html><head><meta charset="utf-8"><title>공모전</title></head>'
+                    f'<body><div class="list"><ul class="list">{"".join(rows)}</ul></div>'
+                    f'<div class="paging">{pager}</div></body></html>')
+            return web.Response(text=body, content_type="text/html")
+
+        return await self._respond("wevity", page, make)
+
+    async def wanted(self, request):
+        limit = max(1, int(request.query.get("limit", 20)))
+        offset = max(0, int(request.query.get("offset", 0)))
+
+        def make():
+            total = self.items * self.pages
+            jobs = [{
+                "id": 900000 + i,
+                "position": f"[벤치] 프로덕트 디자이너 {i}",
+                "due_time": self._due(i) if i % 3 else None,
+                "company": {"name": COMPANIES[i % len(COMPANIES)]},
+                "address": {"location": CITIES[i % len(CITIES)]},
+                "title_img": {"thumb": f"https://static.example.test/wd/{i}.jpg"},
+                "reward": {"total": f"{(i % 5 + 1) * 100}만원"},
+                "skill_tags": [{"title": SKILLS[(i + k) % len(SKILLS)]} for k in range(3)],
+            } for i in range(offset, min(offset + limit, total))]
+            next_link = None
+            if offset + limit < total:
+                next_link = f"/api/v4/jobs?limit={limit}&offset={offset + limit}"
+            return web.json_response({"data": jobs, "links": {"prev": None, "next": next_link}})
+
+        return await self._respond("wanted", offset // limit + 1, make)
+
+    def snapshot(self):
+        """JSON-friendly copy of :attr:`stats`."""
+        return {
+            "requests": dict(self.stats["requests"]),
+            "pages": {source: len(pages) for source, pages in self.stats["pages"].items()},
+            "bytes": self.stats["bytes"],
+            "errors": self.stats["errors"],
+        }
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/wevity/", self.wevity)
+        app.router.add_get("/wanted/api/v4/jobs", self.wanted)
+        app.router.add_get("/__stats", lambda request: web.json_response(self.snapshot()))
+        return app
+
+
+async def serve(board, host="127.0.0.1", port=DEFAULT_PORT):
+    """Start ``board`` and return the runner; ``await runner.cleanup()`` stops it."""
+    runner = web.AppRunner(board.app(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m load.fakeboard", description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--items", type=int, default=50, help="listings per page")
+    parser.add_argument("--pages", type=int, default=1, help="pagination depth")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    board = FakeBoard(args.items, args.pages, args.latency_ms, args.jitter_ms, args.error_rate, args.seed)
+
+    async def run():
+        runner = await serve(board, args.host, args.port)
+        print(f"fake job boards on http://{args.host}:{args.port} "
+              f"(stats at /__stats); set CRAWLER_SOURCE_BASE to that address", flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+            print(json.dumps(board.snapshot()))
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
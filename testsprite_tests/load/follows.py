@@ -0,0 +1,460 @@
+"""Follower/following list benchmark for creator profiles with a large fan-out.
+
+``run`` seeds one synthetic creator per ``--sizes`` follower count, plus
+a following list of ``--following-ratio`` times that size, into
+``"Follow"`` (``supabase/setup_follow.sql``). The graph behind them is
+skewed: every one of the ``--fans`` synthetic users also follows a
+heavy-tailed number of other fans, picked by a Zipf ranking
+(``--skew``), so a few fans are popular and most are not. Seeding is
+resumable: a creator whose edges are already in place is kept.
+
+Per creator it records median/p95 latency, payload size and Postgres
+transactions per request of the routes a profile visit hits:
+``/api/follows?userId=`` (counts), the first and the last
+:data:`PAGE_SIZE`-row page of ``...&type=followers``, the first page of
+``...&type=following`` and ``/api/users/[id]``. A creator whose reported
+follower ``count`` is not its seeded size is marked incomplete, left out
+of ``compare`` and fails the run. With Playwright it then opens
+``/creator/[username]``, clicks the follower count and measures the
+``FollowListModal`` render, the DOM size of the list and frame times
+while scrolling ``--scroll-px`` per frame (loading more pages as it
+goes), once windowed and once with ``?listWindowing=off``. That switch
+only works on a dev server or a build made with
+``NEXT_PUBLIC_BENCH_LIST_TOGGLE=1``; elsewhere the unwindowed mode is
+reported as unavailable::
+
+    python -m load.follows run --sizes 100,1000,10000,50000
+    python -m load.follows run --sizes 1000 --no-browser
+    python -m load.follows compare             # latest run vs baseline
+    python -m load.follows baseline            # promote the latest run
+    python -m load.follows clean               # drop the synthetic users and edges
+
+Needs ``next start`` backed by a local ``supabase start`` stack (see
+:mod:`load.db`). The browser part needs Playwright and is skipped
+without it. Runs are stored under ``tmp/bench/follows/``.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from . import db, results, seed
+from .cache import DbCounter
+from .client import BASE_URL, ApiClient
+from .scenarios import make_rng
+from .stats import percentile
+
+SUITE = "follows"
+USER_PREFIX = "follows"
+CREATOR_PREFIX = f"{USER_PREFIX}-creator"
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+# FollowListModal's page size.
+PAGE_SIZE = 50
+ENDPOINTS = {
+    "counts": "/api/follows?userId={id}",
+    "followers": "/api/follows?userId={id}&type=followers&page=1&limit={limit}",
+    "followers-last": "/api/follows?userId={id}&type=followers&page={last}&limit={limit}",
+    "following": "/api/follows?userId={id}&type=following&page=1&limit={limit}",
+    "user": "/api/users/{id}",
+}
+LIST_MODES = {"windowed": "", "full": "?listWindowing=off"}
+RENDER_TIMEOUT_MS = 60000
+# A frame over twice the 60 Hz budget is one the user sees drop.
+JANK_FRAME_MS = 1000 / 60 * 2
+# metric -> (relative, absolute) growth that counts as a regression; both must be exceeded.
+REGRESSION = {
+    "p50Ms": (0.25, 20.0),
+    "bytes": (0.10, 1024),
+    "renderMs": (0.25, 50.0),
+    "frameP95Ms": (0.25, 8.0),
+    "domNodes": (0.10, 100),
+}
+
+_RENDERED_SCRIPT = """
+async () => {
+  const list = document.querySelector('[data-testid=follow-list]');
+  await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+  return {
+    windowed: list.dataset.windowed === 'true',
+    loaded: Number(list.dataset.loaded),
+    items: list.querySelectorAll('[data-testid=follow-list-item]').length,
+    domNodes: list.querySelectorAll('*').length,
+    documentNodes: document.getElementsByTagName('*').length,
+  };
+}
+"""
+
+# Scrolls the list by ``px`` per animation frame for ``frames`` frames (the
+# modal appends pages as the end comes into view) and returns the time
+# between consecutive frames.
+_SCROLL_SCRIPT = """
+async ([frames, px]) => {
+  const list = document.querySelector('[data-testid=follow-list]');
+  const deltas = [];
+  let last = await new Promise(r => requestAnimationFrame(r));
+  for (let i = 1; i <= frames; i++) {
+    list.scrollTop += px;
+    const now = await new Promise(r => requestAnimationFrame(r));
+    deltas.push(now - last);
+    last = now;
+  }
+  return {
+    frameMs: deltas,
+    loaded: Number(list.dataset.loaded),
+    items: list.querySelectorAll('[data-testid=follow-list-item]').length,
+    domNodes: list.querySelectorAll('*').length,
+  };
+}
+"""
+
+
+def background_edges(fans, mean, skew, rng):
+    """``{(follower, following)}`` fan indexes of the skewed graph among the fans."""
+    followed = seed.Zipf(len(fans), skew, rng)
+    edges = set()
+    for u in range(len(fans)):
+        for target in followed.sample(rng, seed.activity(rng, mean)):
+            if target != u:
+                edges.add((u, target))
+    return edges
+
+
+def _stamp(rng, now, days=365):
+    return now - datetime.timedelta(seconds=rng.randrange(days * 86400))
+
+
+async def seed_creator(conn, creator, size, following, fans, rng):
+    """Give ``creator`` its edges unless they are already there; returns the rows added."""
+    have = await conn.fetchrow(
+        'SELECT count(*) FILTER (WHERE following_id = $1) AS followers, '
+        'count(*) FILTER (WHERE follower_id = $1) AS following '
+        'FROM "Follow" WHERE following_id = $1 OR follower_id = $1',
+        creator,
+    )
+    if (have["followers"], have["following"]) == (size, following):
+        return 0
+    await conn.execute('DELETE FROM "Follow" WHERE following_id = $1 OR follower_id = $1', creator)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    rows = [(fans[i], creator, _stamp(rng, now)) for i in rng.sample(range(len(fans)), size)]
+    rows += [(creator, fans[i], _stamp(rng, now)) for i in rng.sample(range(len(fans)), following)]
+    await conn.copy_records_to_table("Follow", records=rows,
+                                     columns=["follower_id", "following_id", "created_at"])
+    return len(rows)
+
+
+async def seed_background(conn, fans, mean, skew, rng):
+    """Replace the fan-to-fan edges unless their count already matches; returns the rows added."""
+    edges = background_edges(fans, mean, skew, rng)
+    have = await conn.fetchval(
+        'SELECT count(*) FROM "Follow" WHERE follower_id = ANY($1) AND following_id = ANY($1)', fans)
+    if have == len(edges):
+        return 0
+    await conn.execute('DELETE FROM "Follow" WHERE follower_id = ANY($1) AND following_id = ANY($1)', fans)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    rows = [(fans[u], fans[v], _stamp(rng, now)) for u, v in sorted(edges)]
+    await conn.copy_records_to_table("Follow", records=rows,
+                                     columns=["follower_id", "following_id", "created_at"])
+    return len(rows)
+
+
+async def seed_graph(conn, args):
+    """Fans, creators and their edges; returns ``[(size, creator_id, nickname)]``."""
+    if not await conn.fetchval("""SELECT to_regclass('public."Follow"') IS NOT NULL"""):
+        raise RuntimeError('"Follow" not found; run supabase/setup_follow.sql first')
+    fans = [user_id for user_id, _ in await db.ensure_users(conn, max(args.fans, max(args.sizes)), USER_PREFIX)]
+    creators = await db.ensure_users(conn, len(args.sizes), CREATOR_PREFIX)
+    added = await seed_background(conn, fans, args.fan_follows, args.skew, make_rng(f"{args.seed}:background"))
+    points = []
+    for (creator, email), size in zip(creators, sorted(args.sizes)):
+        # A nickname without '@' keeps /creator/[username] a plain path segment.
+        nickname = email.split("@")[0]
+        await conn.execute("UPDATE public.users SET nickname = $2 WHERE id = $1", creator, nickname)
+        following = round(size * args.following_ratio)
+        added += await seed_creator(conn, creator, size, following, fans,
+                                    make_rng(f"{args.seed}:creator:{size}"))
+        points.append((size, creator, nickname))
+    if added:
+        await conn.execute('ANALYZE "Follow"')
+    print(f"graph: {added} edge(s) added", file=sys.stderr)
+    return points
+
+
+def _returned(endpoint, body):
+    """``(rows, total)`` of a response: list rows and the reported count, where there are any."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None, None
+    if endpoint.startswith(("followers", "following")):
+        key = endpoint.split("-")[0]
+        return len(data.get(key) or []), data.get("count")
+    if endpoint == "counts":
+        return None, data.get("followersCount")
+    return (1 if data.get("user") else 0), None
+
+
+async def measure_endpoint(client, counter, endpoint, user_id, size, repeats):
+    last = max(1, math.ceil(size / PAGE_SIZE))
+    path = ENDPOINTS[endpoint].format(id=user_id, limit=PAGE_SIZE, last=last)
+    name = f"GET {endpoint}"
+    await client.get(path, name="warmup")
+    before = await counter.read()
+    first = await client.timed_get(path, name=name)
+    db_delta = DbCounter.delta(before, await counter.read(), 1)
+    samples = [first] + [await client.timed_get(path, name=name) for _ in range(repeats - 1)]
+    status, body = await client.get(path, name="payload")
+    latencies = sorted(s["totalMs"] for s in samples)
+    returned, total = _returned(endpoint, body) if status == 200 else (None, None)
+    return {
+        "status": status,
+        "p50Ms": round(percentile(latencies, 50), 1),
+        "p95Ms": round(percentile(latencies, 95), 1),
+        "ttfbMs": round(statistics.median(s["ttfbMs"] or 0 for s in samples), 1),
+        "bytes": len(body),
+        "returned": returned,
+        "count": total,
+        "db": db_delta,
+    }
+
+
+async def measure_list(browser, base_url, nickname, mode, scroll_frames, scroll_px):
+    """Open the follower list of ``nickname``'s profile and scroll through it."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+    context = await browser.new_context(base_url=base_url, viewport={"width": 1440, "height": 900})
+    try:
+        page = await context.new_page()
+        await page.goto(f"/creator/{nickname}{LIST_MODES[mode]}", wait_until="domcontentloaded")
+        button = page.locator("[data-testid=creator-followers]")
+        await button.wait_for(state="visible", timeout=RENDER_TIMEOUT_MS)
+        started = time.perf_counter()
+        async with page.expect_response(lambda r: "type=followers" in r.url,
+                                        timeout=RENDER_TIMEOUT_MS) as response_info:
+            await button.click()
+        await (await response_info.value).finished()
+        fetch_ms = (time.perf_counter() - started) * 1000
+        try:
+            await page.wait_for_selector("[data-testid=follow-list]", timeout=RENDER_TIMEOUT_MS)
+            rendered = await page.evaluate(_RENDERED_SCRIPT)
+        except PlaywrightTimeout:
+            return {"fetchMs": round(fetch_ms, 1), "renderTimedOut": True}
+        render_ms = (time.perf_counter() - started) * 1000
+        if rendered["windowed"] != (mode == "windowed"):
+            # A production build without NEXT_PUBLIC_BENCH_LIST_TOGGLE ignores ?listWindowing=off.
+            return {"fetchMs": round(fetch_ms, 1), "renderTimedOut": False, "unavailable": True}
+        scrolled = await page.evaluate(_SCROLL_SCRIPT, [scroll_frames, scroll_px])
+        frames = sorted(scrolled["frameMs"])
+        return {
+            "fetchMs": round(fetch_ms, 1),
+            "renderMs": round(render_ms, 1),
+            "renderTimedOut": False,
+            **rendered,
+            "frameP50Ms": round(percentile(frames, 50), 1),
+            "frameP95Ms": round(percentile(frames, 95), 1),
+            "frameMaxMs": round(frames[-1], 1),
+            "jankFrames": sum(ms > JANK_FRAME_MS for ms in frames),
+            "scrolledLoaded": scrolled["loaded"],
+            "scrolledItems": scrolled["items"],
+            "scrolledDomNodes": scrolled["domNodes"],
+        }
+    finally:
+        await context.close()
+
+
+def metrics(rows):
+    """``{(size, target, metric): value}`` over a run's complete rows, for :func:`compare`."""
+    flat = {}
+    for row in rows:
+        if not row.get("complete"):
+            continue
+        for endpoint, api in row["api"].items():
+            for metric in ("p50Ms", "bytes"):
+                flat[(row["size"], endpoint, metric)] = api[metric]
+        for mode, ui in (row.get("browser") or {}).items():
+            for metric in ("renderMs", "frameP95Ms", "domNodes"):
+                if ui.get(metric) is not None:
+                    flat[(row["size"], f"list[{mode}]", metric)] = ui[metric]
+    return flat
+
+
+def compare(run_rows, baseline_rows):
+    """``[((size, target, metric), baseline, current)]`` for values that grew too much."""
+    reference = metrics(baseline_rows)
+    regressions = []
+    for key, after in metrics(run_rows).items():
+        before = reference.get(key)
+        if before is None or math.isnan(before) or math.isnan(after):
+            continue
+        rel, abs_ = REGRESSION[key[2]]
+        delta = after - before
+        if delta > abs_ and delta > before * rel:
+            regressions.append((key, before, after))
+    return regressions
+
+
+def print_table(rows):
+    print(f"{'followers':>9} {'endpoint':<14} {'p50 ms':>7} {'p95 ms':>7} {'KiB':>8} {'rows':>6} "
+          f"{'count':>7} {'tx/req':>7}")
+    for row in rows:
+        for endpoint, api in row["api"].items():
+            tx = "-" if not api["db"] else api["db"]["xacts"]
+            returned = "-" if api["returned"] is None else api["returned"]
+            count = "-" if api["count"] is None else api["count"]
+            print(f"{row['size']:>9} {endpoint:<14} {api['p50Ms']:>7.0f} {api['p95Ms']:>7.0f} "
+                  f"{api['bytes'] / 1024:>8.1f} {returned:>6} {count:>7} {tx:>7}")
+    if not any(row.get("browser") for row in rows):
+        return
+    print(f"\n{'followers':>9} {'list':<9} {'fetch ms':>9} {'render ms':>10} {'DOM':>7} "
+          f"{'frame p50':>10} {'p95':>6} {'max':>6} {'jank':>5}")
+    for row in rows:
+        for mode, ui in (row.get("browser") or {}).items():
+            if ui["renderTimedOut"] or ui.get("unavailable"):
+                state = "timeout" if ui["renderTimedOut"] else "unavailable"
+                print(f"{row['size']:>9} {mode:<9} {ui['fetchMs']:>9.0f} {state:>10}")
+                continue
+            print(f"{row['size']:>9} {mode:<9} {ui['fetchMs']:>9.0f} {ui['renderMs']:>10.0f} "
+                  f"{ui['domNodes']:>7} {ui['frameP50Ms']:>10.1f} {ui['frameP95Ms']:>6.1f} "
+                  f"{ui['frameMaxMs']:>6.0f} {ui['jankFrames']:>5}")
+
+
+def _split(value, cast=int):
+    return [cast(part) for part in value.split(",") if part.strip()]
+
+
+async def run(args):
+    browser = playwright = None
+    if not args.no_browser:
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            print("playwright is not installed; measuring the API only", file=sys.stderr)
+        else:
+            playwright = await async_playwright().start()
+            browser = await playwright.chromium.launch(headless=not args.headed)
+    pool = await db.create_pool(args.dsn, size=2)
+    counter = DbCounter(pool)
+    rows = []
+    try:
+        async with pool.acquire() as conn:
+            points = await seed_graph(conn, args)
+        async with ApiClient(args.base_url, connections=4, timeout_sec=120) as client:
+            for size, creator, nickname in points:
+                row = {"size": size, "following": round(size * args.following_ratio),
+                       "userId": str(creator), "nickname": nickname, "api": {}}
+                for endpoint in ENDPOINTS:
+                    row["api"][endpoint] = await measure_endpoint(client, counter, endpoint, creator,
+                                                                  size, args.repeats)
+                row["complete"] = row["api"]["followers"]["count"] == size
+                if browser is not None:
+                    row["browser"] = {mode: await measure_list(browser, args.base_url, nickname, mode,
+                                                               args.scroll_frames, args.scroll_px)
+                                      for mode in LIST_MODES}
+                rows.append(row)
+                print(f"  {size}: followers list {row['api']['followers']['p50Ms']:.0f} ms",
+                      file=sys.stderr, flush=True)
+    finally:
+        await pool.close()
+        if browser is not None:
+            await browser.close()
+            await playwright.stop()
+
+    print_table(rows)
+    for row in rows:
+        if not row["complete"]:
+            print(f"FAIL {row['size']}: the followers list reports count "
+                  f"{row['api']['followers']['count']}; left out of compare")
+        for mode, ui in (row.get("browser") or {}).items():
+            if ui.get("unavailable"):
+                print(f"note: {row['size']} {mode}: ?listWindowing=off is ignored by this build "
+                      f"(build with NEXT_PUBLIC_BENCH_LIST_TOGGLE=1)")
+    path = results.write_run(SUITE, {"baseUrl": args.base_url, "fans": max(args.fans, max(args.sizes)),
+                                     "fanFollows": args.fan_follows, "skew": args.skew,
+                                     "followingRatio": args.following_ratio, "repeats": args.repeats,
+                                     "rows": rows})
+    print(f"\nrun -> {path}")
+    ok = all(row["complete"] and all(api["status"] == 200 for api in row["api"].values()) for row in rows)
+    return 0 if ok else 1
+
+
+async def clean(args):
+    pool = await db.create_pool(args.dsn, size=1)
+    try:
+        async with pool.acquire() as conn:
+            # Their follows cascade.
+            deleted = await db.delete_users(conn, USER_PREFIX)
+    finally:
+        await pool.close()
+    print(f"{deleted} synthetic user(s) removed")
+    return 0
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m load.follows", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_parser = sub.add_parser("run", help="seed the follow graph and measure each creator")
+    run_parser.add_argument("--base-url", default=BASE_URL)
+    run_parser.add_argument("--dsn", default=db.DATABASE_URL)
+    run_parser.add_argument("--sizes", type=_split, default=DEFAULT_SIZES,
+                            help="comma-separated follower counts, one creator each")
+    run_parser.add_argument("--following-ratio", type=float, default=0.1,
+                            help="each creator's following list as a share of its followers")
+    run_parser.add_argument("--fans", type=int, default=0,
+                            help="synthetic fans (at least the largest size)")
+    run_parser.add_argument("--fan-follows", type=float, default=20, help="mean follows per fan")
+    run_parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of fan popularity")
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--scroll-frames", type=int, default=120, help="frames to scroll the list over")
+    run_parser.add_argument("--scroll-px", type=int, default=400, help="pixels scrolled per frame")
+    run_parser.add_argument("--no-browser", action="store_true", help="skip the list render measurement")
+    run_parser.add_argument("--headed", action="store_true")
+    run_parser.add_argument("--seed", type=int, default=0)
+    cmp_parser = sub.add_parser("compare", help="flag points slower or larger than the baseline")
+    cmp_parser.add_argument("run", nargs="?", help="run file (default: latest)")
+    cmp_parser.add_argument("--baseline", default=str(results.baseline_path(SUITE)))
+    base_parser = sub.add_parser("baseline", help="store a run as the new baseline")
+    base_parser.add_argument("run", nargs="?", help="run file (default: latest)")
+    clean_parser = sub.add_parser("clean", help="delete the synthetic users and their follows")
+    clean_parser.add_argument("--dsn", default=db.DATABASE_URL)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "run":
+        try:
+            return asyncio.run(run(args))
+        except RuntimeError as exc:
+            print(exc, file=sys.stderr)
+            return 2
+    if args.command == "clean":
+        return asyncio.run(clean(args))
+
+    runs = results.runs(SUITE)
+    if args.run is None and not runs:
+        print(f"no runs in {results.suite_dir(SUITE)}; use `run` first", file=sys.stderr)
+        return 2
+    run_path = args.run or runs[-1]
+
+    if args.command == "baseline":
+        results.promote(SUITE, run_path)
+        print(f"baseline <- {Path(run_path).name}")
+        return 0
+
+    if not Path(args.baseline).exists():
+        print(f"no baseline at {args.baseline}; use `baseline` first", file=sys.stderr)
+        return 2
+    regressions = compare(results.load(run_path)["rows"], results.load(args.baseline)["rows"])
+    for (size, target, metric), before, after in regressions:
+        print(f"REGRESSION followers={size} {target} {metric}: {before:g} -> {after:g}")
+    print(f"{len(regressions)} regression(s) vs {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""Deep-pagination and search latency benchmark for ``GET /api/projects``.
+
+The route pages with ``range(offset, offset + limit - 1)`` ordered by
+``created_at`` and searches with ``title.ilike.%q%,content_text.ilike.%q%``;
+both cost grows with the size of ``"Project"``. ``run`` tops the table up
+to each corpus size in turn with synthetic rows (resumable: rows already
+seeded are kept), then sweeps ``page``, ``limit``, ``category`` and
+``search`` and records median/p95 latency per point::
+
+    python -m load.pagination run --sizes 10000,100000,1000000
+    python -m load.pagination compare          # latest run vs baseline
+    python -m load.pagination baseline         # promote the latest run
+    python -m load.pagination plot --out tmp/bench/pagination.png
+    python -m load.pagination clean            # drop the synthetic rows
+
+Needs ``next start`` backed by a local ``supabase start`` stack (see
+:mod:`load.db`). ``plot --out`` needs matplotlib; without it ``plot``
+prints the same grids as text.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+from . import db, results
+from .client import BASE_URL, ApiClient
+from .stats import percentile
+
+SUITE = "pagination"
+USER_PREFIX = "pagination"
+SEED_MARK = "[bench] "
+SEED_BATCH = 50000
+# Every RARE_EVERY-th seeded row mentions RARE_TERM, so rare-term searches
+# have a known, tiny hit rate at every corpus size.
+RARE_TERM = "needle"
+RARE_EVERY = 10000
+VOCABULARY = [
+    "브랜딩", "포스터", "로고", "일러스트", "타이포", "사진", "모션", "웹디자인", "패키지", "캐릭터",
+    "poster", "branding", "logo", "motion", "3d", "ui", "ux", "editorial", "illustration", "photo",
+]
+DEFAULT_SIZES = [10000, 100000, 1000000]
+DEFAULT_PAGES = [1, 10, 100, 1000, 5000, 20000]
+DEFAULT_LIMITS = [20, 50]
+DEFAULT_CATEGORIES = ["", "photo"]
+DEFAULT_SEARCHES = ["", "브랜딩", RARE_TERM, "zzqx-no-match"]
+# A point regresses when its median is both this much slower relatively and absolutely.
+REGRESSION_REL = 0.25
+REGRESSION_ABS_MS = 20.0
+
+SEED_SQL = """
+INSERT INTO "Project" (user_id, category_id, title, content_text, rendering_type, created_at, updated_at)
+SELECT
+  ($3::uuid[])[(i % cardinality($3::uuid[])) + 1],
+  ($4::int[])[(i * 7 % cardinality($4::int[])) + 1],
+  $6::text || ($5::text[])[(abs(hashtext('a' || i)) % cardinality($5::text[])) + 1] || ' '
+     || ($5::text[])[(abs(hashtext('b' || i)) % cardinality($5::text[])) + 1] || ' #' || i,
+  ($5::text[])[(abs(hashtext('c' || i)) % cardinality($5::text[])) + 1] || ' '
+     || ($5::text[])[(abs(hashtext('d' || i)) % cardinality($5::text[])) + 1] || ' '
+     || ($5::text[])[(abs(hashtext('e' || i)) % cardinality($5::text[])) + 1]
+     || CASE WHEN i % $7::int = 0 THEN ' ' || $8::text ELSE '' END,
+  'image',
+  now() - i * interval '37 seconds',
+  now() - i * interval '37 seconds'
+FROM generate_series($1::int, $2::int - 1) AS i
+"""
+
+
+async def seeded_count(conn):
+    return await conn.fetchval('SELECT count(*) FROM "Project" WHERE title LIKE $1', SEED_MARK + "%")
+
+
+async def seed_to(conn, size, owners):
+    """Insert synthetic projects until ``size`` of them exist; returns how many were added."""
+    have = await seeded_count(conn)
+    if have > size:
+        print(f"  {have} rows already seeded; run `clean` to measure {size} exactly", file=sys.stderr)
+    if have >= size:
+        return 0
+    categories = [row["category_id"] for row in await conn.fetch('SELECT category_id FROM "Category"')]
+    if not categories:
+        raise RuntimeError('"Category" is empty; run supabase/schema.sql first')
+    owner_ids = [user_id for user_id, _ in owners]
+    for start in range(have, size, SEED_BATCH):
+        end = min(start + SEED_BATCH, size)
+        await conn.execute(SEED_SQL, start, end, owner_ids, categories, VOCABULARY,
+                           SEED_MARK, RARE_EVERY, RARE_TERM)
+        print(f"  seeded {end}/{size}", file=sys.stderr)
+    await conn.execute('ANALYZE "Project"')
+    return size - have
+
+
+def sweep_points(size, pages, limits, categories, searches):
+    """Parameter combinations worth measuring at ``size`` rows."""
+    for limit in limits:
+        for page in pages:
+            if (page - 1) * limit >= size:
+                continue
+            for category in categories:
+                for search in searches:
+                    yield {"size": size, "limit": limit, "page": page,
+                           "category": category, "search": search}
+
+
+def point_key(point):
+    return (point["size"], point["limit"], point["page"], point["category"], point["search"])
+
+
+async def measure(client, point, repeats, warmup, counter):
+    params = {"page": point["page"], "limit": point["limit"]}
+    if point["category"]:
+        params["category"] = point["category"]
+    if point["search"]:
+        params["search"] = point["search"]
+    latencies, errors, rows = [], 0, None
+    for attempt in range(warmup + repeats):
+        # A unique parameter keeps any HTTP or route cache from answering.
+        params["_b"] = next(counter)
+        started = time.perf_counter()
+        status, body = await client.get("/api/projects", params=dict(params), name="GET /api/projects")
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if attempt < warmup:
+            continue
+        if status != 200:
+            errors += 1
+            continue
+        latencies.append(elapsed_ms)
+        if rows is None:
+            try:
+                rows = len(json.loads(body)["projects"])
+            except (ValueError, KeyError, TypeError):
+                rows = None
+    latencies.sort()
+    return {**point, "p50": percentile(latencies, 50), "p95": percentile(latencies, 95),
+            "rows": rows, "errors": errors}
+
+
+def _split(text, convert=str):
+    return [convert(part) for part in text.split(",")]
+
+
+async def run(args):
+    pool = await db.create_pool(args.dsn, size=2)
+    points = []
+    counter = itertools.count()
+    try:
+        async with pool.acquire() as conn:
+            owners = await db.ensure_users(conn, args.owners, USER_PREFIX)
+        async with ApiClient(args.base_url, connections=4, timeout_sec=120) as client:
+            for size in sorted(args.sizes):
+                async with pool.acquire() as conn:
+                    added = await seed_to(conn, size, owners)
+                print(f"corpus {size}: {added} row(s) added", file=sys.stderr)
+                for point in sweep_points(size, args.pages, args.limits, args.categories, args.searches):
+                    points.append(await measure(client, point, args.repeats, args.warmup, counter))
+    finally:
+        await pool.close()
+    path = results.write_run(SUITE, {"baseUrl": args.base_url, "sizes": sorted(args.sizes),
+                                     "repeats": args.repeats, "points": points})
+    print_grids(points)
+    print(f"\nstored {path}")
+    errors = sum(p["errors"] for p in points)
+    return 1 if errors else 0
+
+
+def compare(run_points, baseline_points):
+    """``[(point, baseline_p50, current_p50)]`` for points that got slower."""
+    reference = {point_key(p): p for p in baseline_points}
+    regressions = []
+    for point in run_points:
+        before = reference.get(point_key(point))
+        if before is None or math.isnan(before["p50"]) or math.isnan(point["p50"]):
+            continue
+        delta = point["p50"] - before["p50"]
+        if delta > REGRESSION_ABS_MS and delta > before["p50"] * REGRESSION_REL:
+            regressions.append((point, before["p50"], point["p50"]))
+    return regressions
+
+
+def _label(point):
+    return (f"size={point['size']} limit={point['limit']} page={point['page']} "
+            f"category={point['category'] or '-'} search={point['search'] or '-'}")
+
+
+def print_grids(points):
+    """Median latency by page depth (rows) and corpus size (columns), one grid per filter."""
+    sizes = sorted({p["size"] for p in points})
+    groups = {}
+    for p in points:
+        groups.setdefault((p["limit"], p["category"], p["search"]), {})[(p["page"], p["size"])] = p["p50"]
+    for (limit, category, search), cells in sorted(groups.items()):
+        print(f"\np50 ms  limit={limit} category={category or '-'} search={search or '-'}")
+        print(f"{'page':>8} " + " ".join(f"{size:>10}" for size in sizes))
+        for page in sorted({page for page, _ in cells}):
+            row = [cells.get((page, size)) for size in sizes]
+            print(f"{page:>8} " + " ".join(f"{v:>10.1f}" if v is not None else f"{'':>10}" for v in row))
+
+
+def plot(points, out):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, (by_page, by_size) = plt.subplots(1, 2, figsize=(12, 5))
+    limit = min(p["limit"] for p in points)
+    plain = [p for p in points if p["limit"] == limit and not p["category"] and not p["search"]]
+    for size in sorted({p["size"] for p in plain}):
+        series = sorted((p["page"], p["p50"]) for p in plain if p["size"] == size)
+        by_page.plot(*zip(*series), marker="o", label=f"{size:,} rows")
+    by_page.set(xscale="log", xlabel="page", ylabel="p50 ms", title=f"depth (limit={limit})")
+    by_page.legend()
+    first = [p for p in points if p["limit"] == limit and p["page"] == 1 and not p["category"]]
+    for search in sorted({p["search"] for p in first}):
+        series = sorted((p["size"], p["p50"]) for p in first if p["search"] == search)
+        by_size.plot(*zip(*series), marker="o", label=f"search={search or '-'}")
+    by_size.set(xscale="log", xlabel="corpus size", ylabel="p50 ms", title="page 1 by search term")
+    by_size.legend()
+    fig.tight_layout()
+    fig.savefig(out)
+
+
+async def clean(args):
+    pool = await db.create_pool(args.dsn, size=1)
+    try:
+        async with pool.acquire() as conn:
+            deleted = await conn.execute('DELETE FROM "Project" WHERE title LIKE $1', SEED_MARK + "%")
+            await db.delete_users(conn, USER_PREFIX)
+    finally:
+        await pool.close()
+    print(f"{deleted.split()[-1]} synthetic project(s) removed")
+    return 0
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m load.pagination", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_parser = sub.add_parser("run", help="seed each corpus size and sweep the parameters")
+    run_parser.add_argument("--base-url", default=BASE_URL)
+    run_parser.add_argument("--dsn", default=db.DATABASE_URL)
+    run_parser.add_argument("--sizes", type=lambda s: _split(s, int), default=DEFAULT_SIZES)
+    run_parser.add_argument("--pages", type=lambda s: _split(s, int), default=DEFAULT_PAGES)
+    run_parser.add_argument("--limits", type=lambda s: _split(s, int), default=DEFAULT_LIMITS)
+    run_parser.add_argument("--categories", type=_split, default=DEFAULT_CATEGORIES,
+                            help="comma-separated genre values; an empty entry means no filter")
+    run_parser.add_argument("--searches", type=_split, default=DEFAULT_SEARCHES,
+                            help="comma-separated search terms; an empty entry means no search")
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--owners", type=int, default=50, help="synthetic users owning the rows")
+    cmp_parser = sub.add_parser("compare", help="flag points slower than the baseline")
+    cmp_parser.add_argument("run", nargs="?", help="run file (default: latest)")
+    cmp_parser.add_argument("--baseline", default=str(results.baseline_path(SUITE)))
+    base_parser = sub.add_parser("baseline", help="store a run as the new baseline")
+    base_parser.add_argument("run", nargs="?", help="run file (default: latest)")
+    plot_parser = sub.add_parser("plot", help="latency by page depth and corpus size")
+    plot_parser.add_argument("run", nargs="?", help="run file (default: latest)")
+    plot_parser.add_argument("--out", help="write a PNG here (needs matplotlib)")
+    clean_parser = sub.add_parser("clean", help="delete the synthetic projects and owners")
+    clean_parser.add_argument("--dsn", default=db.DATABASE_URL)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "run":
+        return asyncio.run(run(args))
+    if args.command == "clean":
+        return asyncio.run(clean(args))
+
+    runs = results.runs(SUITE)
+    if args.run is None and not runs:
+        print(f"no runs in {results.suite_dir(SUITE)}; use `run` first", file=sys.stderr)
+        return 2
+    run_path = args.run or runs[-1]
+    points = results.load(run_path)["points"]
+
+    if args.command == "baseline":
+        results.promote(SUITE, run_path)
+        print(f"baseline <- {Path(run_path).name}")
+        return 0
+    if args.command == "plot":
+        print_grids(points)
+        if args.out:
+            try:
+                plot(points, args.out)
+            except ImportError:
+                print("--out needs matplotlib (pip install matplotlib)", file=sys.stderr)
+                return 2
+            print(f"\nwrote {args.out}")
+        return 0
+
+    regressions = compare(points, results.load(args.baseline)["points"])
+    for point, before, after in regressions:
+        print(f"REGRESSION {_label(point)}: p50 {before:.1f} -> {after:.1f} ms")
+    print(f"{len(regressions)} regression(s) vs {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
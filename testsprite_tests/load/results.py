@@ -0,0 +1,57 @@
+"""JSON result store and baselines for the benchmark suites.
+
+Each suite writes ``tmp/bench/<suite>/<timestamp>-<commit>.json``;
+``baseline.json`` next to them is the run later runs are compared with.
+"""
+
+import json
+import subprocess
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent.parent / "tmp" / "bench"
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR.parent.parent, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def suite_dir(suite):
+    return BENCH_DIR / suite
+
+
+def baseline_path(suite):
+    return suite_dir(suite) / "baseline.json"
+
+
+def write_run(suite, data):
+    """Store one run (``data`` gains ``startedAt``/``commit``) and return its path."""
+    commit = current_commit()
+    started = time.strftime("%Y%m%dT%H%M%S")
+    directory = suite_dir(suite)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{started}-{commit}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"startedAt": started, "commit": commit, **data}, f, indent=2)
+    return path
+
+
+def runs(suite):
+    return sorted(p for p in suite_dir(suite).glob("*.json") if p.name != "baseline.json")
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def promote(suite, path):
+    target = baseline_path(suite)
+    target.write_text(Path(path).read_text(encoding="utf-8"), encoding="utf-8")
+    return target
@@ -0,0 +1,98 @@
+"""Weighted API request mixes mirroring the browser flows of the cases.
+
+Each scenario is an async function ``(client, fixtures, rng)`` issuing the
+same ``/api/*`` calls the page makes during that flow. ``fixtures`` holds
+ids discovered once before the run so scenarios never depend on each
+other.
+"""
+
+import random
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Fixtures:
+    project_ids: list = field(default_factory=list)
+    user_ids: list = field(default_factory=list)
+    token: str = None
+
+
+async def discover_fixtures(client, token=None, pages=3):
+    """Collect real project and creator ids from ``GET /api/projects``."""
+    fixtures = Fixtures(token=token)
+    for page in range(1, pages + 1):
+        data = await client.get_json(f"/api/projects?page={page}&limit=50", name="warmup")
+        projects = (data or {}).get("projects") or []
+        fixtures.project_ids.extend(p["project_id"] for p in projects)
+        fixtures.user_ids.extend(p["user_id"] for p in projects if p.get("user_id"))
+        if len(projects) < 50:
+            break
+    fixtures.user_ids = sorted(set(fixtures.user_ids))
+    return fixtures
+
+
+async def browse_feed(client, fixtures, rng):
+    """TC001: landing page banners, first feed page, sometimes infinite scroll."""
+    await client.get("/api/banners?pageType=discover&activeOnly=true", name="GET /api/banners")
+    await client.get("/api/projects?page=1&limit=20", name="GET /api/projects")
+    if rng.random() < 0.4:
+        await client.get(f"/api/projects?page={rng.randint(2, 5)}&limit=20", name="GET /api/projects (scroll)")
+
+
+async def open_project(client, fixtures, rng):
+    """TC002: open the detail modal, count a view, load likes and comments."""
+    if not fixtures.project_ids:
+        return await browse_feed(client, fixtures, rng)
+    project_id = rng.choice(fixtures.project_ids)
+    await client.get(f"/api/projects/{project_id}", name="GET /api/projects/[id]")
+    await client.post(f"/api/projects/{project_id}/view", name="POST /api/projects/[id]/view")
+    await client.get(f"/api/likes?projectId={project_id}", name="GET /api/likes")
+    await client.get(f"/api/comments?projectId={project_id}", name="GET /api/comments")
+    if fixtures.token and rng.random() < 0.1:
+        await client.post("/api/likes", json={"projectId": project_id}, token=fixtures.token, name="POST /api/likes")
+
+
+async def browse_recruit(client, fixtures, rng):
+    """TC006: the connection marketplace listings and its banners."""
+    await client.get("/api/banners?pageType=connect&activeOnly=true", name="GET /api/banners")
+    await client.get("/api/recruit-items", name="GET /api/recruit-items")
+
+
+async def view_creator(client, fixtures, rng):
+    """Creator profile opened from a card: profile plus follow counts."""
+    if not fixtures.user_ids:
+        return await browse_feed(client, fixtures, rng)
+    user_id = rng.choice(fixtures.user_ids)
+    await client.get(f"/api/users/{user_id}", name="GET /api/users/[id]")
+    await client.get(f"/api/follows?userId={user_id}", name="GET /api/follows")
+
+
+SCENARIOS = {
+    "browse_feed": browse_feed,
+    "open_project": open_project,
+    "browse_recruit": browse_recruit,
+    "view_creator": view_creator,
+}
+DEFAULT_MIX = {"browse_feed": 50, "open_project": 30, "browse_recruit": 12, "view_creator": 8}
+
+
+def parse_mix(text):
+    """Parse ``"browse_feed=5,open_project=3"`` into a weight mapping."""
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"unknown scenario {name!r}; choose from {', '.join(SCENARIOS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def picker(mix, rng):
+    """Return a zero-argument function drawing scenario names by weight."""
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    return lambda: rng.choices(names, weights)[0]
+
+
+def make_rng(seed):
+    return random.Random(seed)
@@ -0,0 +1,712 @@
+"""Bulk synthetic data for a local Supabase stack at production scale.
+
+Fills the tables ``supabase/schema.sql`` and the ``setup_*.sql`` scripts
+create: ``users`` (with their ``auth.users`` rows), ``"Project"``,
+``"Like"``, ``"Comment"`` with ``parent_comment_id`` reply trees,
+``"Follow"``, ``"Collection"``/``"CollectionItem"`` and ``recruit_items``.
+Popularity follows a power law: project likes, comments and collection
+saves are drawn from one Zipf ranking (``--like-skew``), followers from
+another (``--follow-skew``) and a few creators own most projects
+(``--owner-skew``); per-user activity is Pareto distributed.
+
+Every step runs in chunks of about ``--chunk`` rows. A chunk is generated
+from its own RNG (``seed:step:chunk``), loaded with ``COPY`` (comments use
+one multi-row insert per reply depth to get their ids back) and recorded
+in ``bench.seed_chunks`` in the same transaction, so an interrupted run
+resumes where it stopped and reproduces the same data. The defaults load
+about a million rows::
+
+    python -m load.seed run                          # ~1.1M rows
+    python -m load.seed run --scale 0.1 --jobs 4     # a tenth, four connections
+    python -m load.seed status
+    python -m load.seed clean
+
+When the database role may set ``session_replication_role`` the load
+skips triggers and foreign-key checks, and the counter columns of
+``setup_project_counts.sql`` are recomputed at the end either way.
+Seeded rows are marked with :data:`SEED_MARK` or belong to ``seed-<n>``
+users (see :mod:`load.db`). Never point this at a hosted project.
+"""
+
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+
+import asyncpg
+
+from . import db
+from .scenarios import make_rng
+
+USER_PREFIX = "seed"
+SEED_MARK = "[seed] "
+DEFAULT_CHUNK = 20000
+# Pareto shape of per-user activity: most users do little, a few do a lot.
+ACTIVITY_ALPHA = 1.8
+MAX_REPLY_DEPTH = 3
+ITEMS_PER_COLLECTION = 8
+VIEWS_PER_LIKE = 25
+# Namespace of the generated collection ids, so resumed chunks reuse them.
+COLLECTION_NAMESPACE = uuid.UUID("b1f7d3f2-5c0e-4a8e-9c7a-3e2d1f0a9b64")
+
+# Table -> the supabase/ script that creates it.
+REQUIRED_TABLES = {
+    "users": "schema.sql",
+    "Category": "schema.sql",
+    "Project": "schema.sql",
+    "Like": "schema.sql",
+    "Comment": "schema.sql",
+    "Follow": "setup_follow.sql",
+    "Collection": "setup_collections.sql",
+    "CollectionItem": "setup_collections.sql",
+    "recruit_items": "CREATE_RECRUIT_ITEMS_TABLE.sql",
+}
+# Filled only where the script that adds them has been applied.
+OPTIONAL_COLUMNS = {
+    ("Project", "views"): "schema.sql",
+    ("Project", "views_count"): "setup_project_counts.sql",
+    ("Project", "likes_count"): "setup_project_counts.sql",
+    ("Project", "comments_count"): "setup_project_counts.sql",
+    ("Comment", "is_deleted"): "migrations/001_add_is_deleted.sql",
+    ("Comment", "mentioned_user_id"): "setup_comment_replies.sql",
+}
+
+SYLLABLES = ["하", "윤", "서", "민", "지", "도", "아", "린", "준", "태", "소", "예", "현", "우", "채", "온"]
+VOCABULARY = [
+    "브랜딩", "포스터", "로고", "일러스트", "타이포", "사진", "모션", "웹디자인", "패키지", "캐릭터",
+    "poster", "branding", "logo", "motion", "3d", "ui", "ux", "editorial", "illustration", "photo",
+]
+COMMENTS = [
+    "색감이 정말 좋네요!", "레퍼런스로 저장해 갑니다.", "작업 과정이 궁금해요.", "폰트 정보 알 수 있을까요?",
+    "구도가 인상적이에요.", "multiply 레이어 쓰신 건가요?", "다음 작업도 기대할게요 👏", "이거 실물로 보고 싶네요.",
+    "Great composition.", "How long did this take?", "와 디테일 미쳤다", "포트폴리오 잘 보고 갑니다.",
+]
+RECRUIT_TITLES = {
+    "job": ["프로덕트 디자이너", "모션 디자이너", "브랜드 디자이너", "3D 아티스트", "UI/UX 디자이너"],
+    "contest": ["포스터 공모전", "캐릭터 디자인 공모전", "영상 공모전", "브랜드 로고 공모전"],
+    "event": ["디자인 컨퍼런스", "포트폴리오 리뷰 데이", "일러스트 페어", "네트워킹 밋업"],
+}
+COMPANIES = ["스튜디오 오로라", "(주)픽셀웍스", "브랜드랩", "모션하우스", "크리에이티브원", "바이브스튜디오"]
+CITIES = ["서울", "성남", "부산", "대전", "제주", "원격"]
+EMPLOYMENT = ["정규직", "계약직", "프리랜서", "인턴"]
+# Photos the app already uses, on a host next.config.ts allows for next/image.
+THUMBNAILS = [
+    "https://images.unsplash.com/photo-1618005182384-a83a8bd57fbe",
+    "https://images.unsplash.com/photo-1506905925346-21bda4d32df4",
+    "https://images.unsplash.com/photo-1469474968028-56623f02e42e",
+    "https://images.unsplash.com/photo-1501785888041-af3ef285b470",
+    "https://images.unsplash.com/photo-1470071459604-3b5ec3a7fe05",
+]
+
+PROGRESS_DDL = """
+CREATE SCHEMA IF NOT EXISTS bench;
+CREATE TABLE IF NOT EXISTS bench.seed_plans (
+  prefix text PRIMARY KEY,
+  plan jsonb NOT NULL,
+  created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE TABLE IF NOT EXISTS bench.seed_chunks (
+  prefix text NOT NULL,
+  step text NOT NULL,
+  chunk int NOT NULL,
+  rows int NOT NULL,
+  seconds real NOT NULL,
+  PRIMARY KEY (prefix, step, chunk)
+);
+"""
+
+COLUMNS_SQL = """
+SELECT table_name, column_name, format_type(a.atttypid, a.atttypmod) AS type
+FROM information_schema.columns c
+JOIN pg_attribute a ON a.attrelid = format('%I.%I', c.table_schema, c.table_name)::regclass
+                   AND a.attname = c.column_name
+WHERE c.table_schema = 'public' AND c.table_name = ANY($1::text[])
+"""
+
+PROJECT_MAP_SQL = """
+SELECT project_id, substring(title FROM ' #([0-9]+)$')::int AS n
+FROM "Project" WHERE title LIKE $1
+"""
+
+COUNTERS_SQL = """
+UPDATE "Project" p
+SET {assignments}
+FROM "Project" s
+LEFT JOIN (SELECT project_id, count(*) AS n FROM "Like" GROUP BY project_id) l USING (project_id)
+LEFT JOIN (SELECT project_id, count(*) AS n FROM "Comment" GROUP BY project_id) c USING (project_id)
+WHERE p.project_id = s.project_id AND s.title LIKE $1
+"""
+
+
+@dataclass
+class Plan:
+    """Everything that decides the generated rows; resuming needs the same plan."""
+
+    seed: int = 0
+    users: int = 20000
+    projects: int = 100000
+    likes: int = 600000
+    comments: int = 200000
+    follows: int = 150000
+    collections: int = 8000
+    recruit: int = 5000
+    like_skew: float = 1.0
+    follow_skew: float = 1.1
+    owner_skew: float = 0.8
+    reply_ratio: float = 0.35
+    days: int = 365
+    until: str = ""
+    chunk: int = DEFAULT_CHUNK
+
+    def scaled(self, factor):
+        counts = ("users", "projects", "likes", "comments", "follows", "collections", "recruit")
+        return Plan(**{**asdict(self), **{name: max(1, round(getattr(self, name) * factor)) for name in counts}})
+
+
+class Zipf:
+    """Power-law popularity over ``n`` items: rank ``r`` has weight ``1 / (r + 1) ** s``.
+
+    Ranks are shuffled onto item indexes so popular items are spread over
+    the table instead of being its oldest rows.
+    """
+
+    def __init__(self, n, s, rng):
+        weights = [1 / (r + 1) ** s for r in range(n)]
+        self.s = s
+        self.total = sum(weights)
+        self.cum = list(itertools.accumulate(weights))
+        self.by_rank = list(range(n))
+        rng.shuffle(self.by_rank)
+        self.rank = [0] * n
+        for r, index in enumerate(self.by_rank):
+            self.rank[index] = r
+        self._ranks = range(n)
+
+    def sample(self, rng, k):
+        return [self.by_rank[r] for r in rng.choices(self._ranks, cum_weights=self.cum, k=k)]
+
+    def share(self, index):
+        return 1 / (self.rank[index] + 1) ** self.s / self.total
+
+
+@dataclass
+class Context:
+    """State shared by the chunks of one run."""
+
+    plan: Plan
+    until: datetime.datetime
+    user_ids: list
+    categories: list
+    columns: dict
+    fast: bool = False
+    projects: Zipf = None
+    owners: Zipf = None
+    followed: Zipf = None
+    project_ids: list = field(default_factory=list)
+
+    def project_time(self, index):
+        """Creation time of project ``index``: evenly spread, newest last."""
+        span = self.plan.days * 86400
+        return self.until - datetime.timedelta(seconds=span * (self.plan.projects - index) / self.plan.projects)
+
+    def after(self, rng, start, limit_sec=None):
+        """A random moment between ``start`` and the end of the seeded period."""
+        room = max(0.0, (self.until - start).total_seconds())
+        if limit_sec is not None:
+            room = min(room, limit_sec)
+        return start + datetime.timedelta(seconds=rng.uniform(0, room))
+
+
+def activity(rng, mean):
+    """A heavy-tailed count with the given mean (Pareto with :data:`ACTIVITY_ALPHA`)."""
+    scale = mean * (ACTIVITY_ALPHA - 1) / ACTIVITY_ALPHA
+    value = scale * rng.paretovariate(ACTIVITY_ALPHA)
+    return int(value) + (rng.random() < value - int(value))
+
+
+def nickname(rng, index):
+    return "".join(rng.choices(SYLLABLES, k=rng.randint(2, 3))) + str(index)
+
+
+def phrase(rng, words):
+    return " ".join(rng.choices(VOCABULARY, k=words))
+
+
+async def load_users(conn, ctx, rng, start, end):
+    plan = ctx.plan
+    auth_rows, public_rows = [], []
+    for i in range(start, end):
+        user_id, email = db.synthetic_user(USER_PREFIX, i)
+        name = nickname(rng, i)
+        created = ctx.until - datetime.timedelta(seconds=rng.uniform(0, plan.days * 86400))
+        auth_rows.append((
+            user_id, db.NIL_INSTANCE, "authenticated", "authenticated", email, "", created,
+            '{"provider": "email", "providers": ["email"]}', json.dumps({"nickname": name}),
+            created, created, "", "", "", "",
+        ))
+        public_rows.append((user_id, email, name, created))
+    await conn.copy_records_to_table(
+        "users", schema_name="auth", records=auth_rows,
+        columns=["id", "instance_id", "aud", "role", "email", "encrypted_password", "email_confirmed_at",
+                 "raw_app_meta_data", "raw_user_meta_data", "created_at", "updated_at",
+                 "confirmation_token", "recovery_token", "email_change_token_new", "email_change"],
+    )
+    # With triggers on, on_auth_user_created has already added these.
+    await conn.execute(
+        """
+        INSERT INTO public.users (id, email, nickname, created_at, updated_at)
+        SELECT id, email, nickname, t, t FROM unnest($1::uuid[], $2::text[], $3::text[], $4::timestamptz[])
+          AS r(id, email, nickname, t)
+        ON CONFLICT (id) DO NOTHING
+        """,
+        *map(list, zip(*public_rows)),
+    )
+    return len(auth_rows) + len(public_rows)
+
+
+async def load_projects(conn, ctx, rng, start, end):
+    plan = ctx.plan
+    columns = ["user_id", "category_id", "title", "content_text", "thumbnail_url", "rendering_type",
+               "created_at", "updated_at"]
+    view_columns = [name for name in ("views", "views_count") if name in ctx.columns["Project"]]
+    owners = ctx.owners.sample(rng, end - start)
+    rows = []
+    for i, owner in zip(range(start, end), owners):
+        created = ctx.project_time(i)
+        expected_likes = plan.likes * ctx.projects.share(i)
+        views = int(expected_likes * VIEWS_PER_LIKE * rng.lognormvariate(0, 0.5)) + rng.randint(0, 30)
+        rows.append((
+            ctx.user_ids[owner], rng.choice(ctx.categories), f"{SEED_MARK}{phrase(rng, 2)} #{i}",
+            phrase(rng, rng.randint(5, 40)), f"{rng.choice(THUMBNAILS)}?w=800", "image",
+            created, created, *([views] * len(view_columns)),
+        ))
+    await conn.copy_records_to_table("Project", records=rows, columns=columns + view_columns)
+    return len(rows)
+
+
+async def load_likes(conn, ctx, rng, start, end):
+    mean = ctx.plan.likes / ctx.plan.users
+    rows = []
+    for u in range(start, end):
+        for p in set(ctx.projects.sample(rng, activity(rng, mean))):
+            rows.append((ctx.user_ids[u], ctx.project_ids[p], ctx.after(rng, ctx.project_time(p))))
+    await conn.copy_records_to_table("Like", records=rows, columns=["user_id", "project_id", "created_at"])
+    return len(rows)
+
+
+def comment_trees(ctx, rng, start, end):
+    """Comments for projects ``start..end`` in the shape :func:`insert_comments` takes.
+
+    A project gets comments in proportion to its popularity; each comment
+    replies to an earlier one on the same project with ``reply_ratio``.
+    """
+    plan = ctx.plan
+    comments = []
+    for p in range(start, end):
+        expected = plan.comments * ctx.projects.share(p)
+        count = int(expected) + (rng.random() < expected - int(expected))
+        thread = []
+        for _ in range(count):
+            parent = None
+            if thread and rng.random() < plan.reply_ratio:
+                parent = rng.choice(thread)
+                if comments[parent]["depth"] >= MAX_REPLY_DEPTH:
+                    parent = None
+            created = (ctx.after(rng, comments[parent]["created_at"], limit_sec=3 * 86400) if parent is not None
+                       else ctx.after(rng, ctx.project_time(p)))
+            thread.append(len(comments))
+            comments.append({
+                "user_id": ctx.user_ids[rng.randrange(plan.users)], "project_id": ctx.project_ids[p],
+                "content": rng.choice(COMMENTS), "created_at": created, "parent": parent,
+                "depth": 0 if parent is None else comments[parent]["depth"] + 1,
+                "deleted": rng.random() < 0.02,
+            })
+    return comments
+
+
+def _comment_insert_sql(columns):
+    names = ["user_id", "project_id", "content", "parent_comment_id", "created_at", "updated_at"]
+    values = ["u", "p", "c", "parent", "t", "t"]
+    arrays = ["$1::uuid[]", "$2::int[]", "$3::text[]", f"$4::{columns['comment_id']}[]", "$5::timestamptz[]"]
+    aliases = ["u", "p", "c", "parent", "t"]
+    for name, cast in (("is_deleted", "bool"), ("mentioned_user_id", "uuid")):
+        if name in columns:
+            names.append(name)
+            values.append(name)
+            arrays.append(f"${len(arrays) + 1}::{cast}[]")
+            aliases.append(name)
+    # RETURNING promises no order, so pair each new id with its input ordinal
+    # by joining back on every inserted value; identical rows are numbered on
+    # both sides so each one still gets its own id.
+    key = [name for name in names if name != "updated_at"]
+    match = " AND ".join(f"i.{name} IS NOT DISTINCT FROM r.{alias}" for name, alias in zip(key, aliases))
+    return (f'WITH r AS (SELECT * FROM unnest({", ".join(arrays)}) WITH ORDINALITY AS r({", ".join(aliases)}, n)), '
+            f'ins AS (INSERT INTO "Comment" ({", ".join(names)}) SELECT {", ".join(values)} FROM r '
+            f'RETURNING comment_id, {", ".join(key)}) '
+            f'SELECT i.comment_id, r.n FROM '
+            f'(SELECT *, row_number() OVER (PARTITION BY {", ".join(key)} ORDER BY comment_id) AS k FROM ins) i '
+            f'JOIN (SELECT *, row_number() OVER (PARTITION BY {", ".join(aliases)} ORDER BY n) AS k FROM r) r '
+            f'ON {match} AND i.k = r.k')
+
+
+async def insert_comments(conn, comments, columns):
+    """Insert ``comments`` one reply depth at a time and return their ids in order.
+
+    Each comment is a dict with ``user_id``, ``project_id``, ``content``,
+    ``created_at``, ``depth``, ``parent`` (index of an earlier comment or
+    ``None``) and optionally ``deleted``; ``columns`` maps the ``"Comment"``
+    columns to their types. Replies mention their parent's author where
+    ``mentioned_user_id`` exists.
+    """
+    sql = _comment_insert_sql(columns)
+    ids = [None] * len(comments)
+    levels = {}
+    for i, comment in enumerate(comments):
+        levels.setdefault(comment["depth"], []).append(i)
+    for depth in sorted(levels):
+        level = [comments[i] for i in levels[depth]]
+        args = [
+            [c["user_id"] for c in level],
+            [c["project_id"] for c in level],
+            [c["content"] for c in level],
+            [None if c["parent"] is None else ids[c["parent"]] for c in level],
+            [c["created_at"] for c in level],
+        ]
+        if "is_deleted" in columns:
+            args.append([c.get("deleted", False) for c in level])
+        if "mentioned_user_id" in columns:
+            args.append([None if c["parent"] is None else comments[c["parent"]]["user_id"] for c in level])
+        rows = await conn.fetch(sql, *args)
+        if len(rows) != len(level):
+            raise RuntimeError(f"matched {len(rows)} of {len(level)} inserted comments at depth {depth}")
+        for row in rows:
+            ids[levels[depth][row["n"] - 1]] = row["comment_id"]
+    return ids
+
+
+async def load_comments(conn, ctx, rng, start, end):
+    return len(await insert_comments(conn, comment_trees(ctx, rng, start, end), ctx.columns["Comment"]))
+
+
+async def load_follows(conn, ctx, rng, start, end):
+    mean = ctx.plan.follows / ctx.plan.users
+    rows = []
+    for u in range(start, end):
+        since = ctx.until - datetime.timedelta(days=ctx.plan.days)
+        for target in set(ctx.followed.sample(rng, activity(rng, mean))) - {u}:
+            rows.append((ctx.user_ids[u], ctx.user_ids[target], ctx.after(rng, since)))
+    await conn.copy_records_to_table("Follow", records=rows,
+                                     columns=["follower_id", "following_id", "created_at"])
+    return len(rows)
+
+
+async def load_collections(conn, ctx, rng, start, end):
+    mean = ctx.plan.collections / ctx.plan.users
+    since = ctx.until - datetime.timedelta(days=ctx.plan.days)
+    collections, items = [], []
+    for u in range(start, end):
+        for k in range(activity(rng, mean)):
+            collection_id = uuid.uuid5(COLLECTION_NAMESPACE, f"{ctx.plan.seed}-{u}-{k}")
+            created = ctx.after(rng, since)
+            collections.append((collection_id, ctx.user_ids[u], f"{SEED_MARK}{phrase(rng, 1)} {k + 1}",
+                                rng.random() < 0.5, created, created))
+            for p in set(ctx.projects.sample(rng, max(1, activity(rng, ITEMS_PER_COLLECTION)))):
+                items.append((collection_id, ctx.project_ids[p], ctx.after(rng, max(created, ctx.project_time(p)))))
+    await conn.copy_records_to_table(
+        "Collection", records=collections,
+        columns=["collection_id", "user_id", "name", "is_public", "created_at", "updated_at"],
+    )
+    await conn.copy_records_to_table("CollectionItem", records=items,
+                                     columns=["collection_id", "project_id", "added_at"])
+    return len(collections) + len(items)
+
+
+async def load_recruit(conn, ctx, rng, start, end):
+    rows = []
+    for i in range(start, end):
+        kind = rng.choices(["job", "contest", "event"], [5, 3, 2])[0]
+        company = rng.choice(COMPANIES)
+        created = ctx.after(rng, ctx.until - datetime.timedelta(days=ctx.plan.days))
+        rows.append((
+            f"{SEED_MARK}{rng.choice(RECRUIT_TITLES[kind])} #{i}", f"{company} {phrase(rng, 12)}", kind,
+            (created + datetime.timedelta(days=rng.randint(7, 90))).date(), rng.choice(CITIES),
+            f"{rng.randint(1, 20) * 50}만원" if kind == "contest" else None,
+            f"{rng.randint(30, 80) * 100}만원" if kind == "job" else None,
+            company, rng.choice(EMPLOYMENT) if kind == "job" else None,
+            f"https://example.test/recruit/{i}", f"{rng.choice(THUMBNAILS)}?w=600",
+            rng.random() < 0.9, created, created,
+        ))
+    await conn.copy_records_to_table(
+        "recruit_items", records=rows,
+        columns=["title", "description", "type", "date", "location", "prize", "salary", "company",
+                 "employment_type", "link", "thumbnail", "is_active", "created_at", "updated_at"],
+    )
+    return len(rows)
+
+
+@dataclass
+class Step:
+    name: str
+    units: int
+    rows_per_unit: float
+    load: object
+
+    def ranges(self, chunk_rows):
+        size = max(1, int(chunk_rows / max(self.rows_per_unit, 1e-9)))
+        return [(start, min(start + size, self.units)) for start in range(0, self.units, size)]
+
+
+def steps(plan):
+    """The load order; later steps reference rows of earlier ones."""
+    return [
+        Step("users", plan.users, 2, load_users),
+        Step("projects", plan.projects, 1, load_projects),
+        Step("likes", plan.users, plan.likes / plan.users, load_likes),
+        Step("comments", plan.projects, plan.comments / plan.projects, load_comments),
+        Step("follows", plan.users, plan.follows / plan.users, load_follows),
+        Step("collections", plan.users, plan.collections / plan.users * (1 + ITEMS_PER_COLLECTION),
+             load_collections),
+        Step("recruit", plan.recruit, 1, load_recruit),
+    ]
+
+
+async def table_columns(conn, tables):
+    """``{table: {column: type}}`` for the existing ones of ``tables`` in ``public``."""
+    columns = {}
+    for row in await conn.fetch(COLUMNS_SQL, list(tables)):
+        columns.setdefault(row["table_name"], {})[row["column_name"]] = row["type"]
+    return columns
+
+
+async def check_schema(conn):
+    """``{table: {column: type}}`` for :data:`REQUIRED_TABLES`; raises if one is missing."""
+    columns = await table_columns(conn, REQUIRED_TABLES)
+    missing = sorted({script for table, script in REQUIRED_TABLES.items() if table not in columns})
+    if missing:
+        raise RuntimeError(f"missing tables; run supabase/{', supabase/'.join(missing)} first")
+    for (table, column), script in OPTIONAL_COLUMNS.items():
+        if column not in columns[table]:
+            print(f'  "{table}".{column} not found (supabase/{script}); left out', file=sys.stderr)
+    return columns
+
+
+async def can_skip_triggers(conn):
+    try:
+        await conn.execute("SET session_replication_role = replica")
+    except asyncpg.InsufficientPrivilegeError:
+        return False
+    await conn.execute("RESET session_replication_role")
+    return True
+
+
+async def load_plan(conn, prefix):
+    stored = await conn.fetchval("SELECT plan FROM bench.seed_plans WHERE prefix = $1", prefix)
+    return Plan(**json.loads(stored)) if stored else None
+
+
+async def done_chunks(conn, prefix, step):
+    rows = await conn.fetch("SELECT chunk, rows FROM bench.seed_chunks WHERE prefix = $1 AND step = $2",
+                            prefix, step)
+    return {row["chunk"]: row["rows"] for row in rows}
+
+
+async def project_map(conn, count):
+    ids = [None] * count
+    for row in await conn.fetch(PROJECT_MAP_SQL, SEED_MARK + "%"):
+        if row["n"] is not None and row["n"] < count:
+            ids[row["n"]] = row["project_id"]
+    if None in ids:
+        raise RuntimeError(f"{ids.count(None)} seeded project(s) missing; run `clean` and seed again")
+    return ids
+
+
+async def run_step(pool, ctx, step, jobs):
+    """Load the chunks of ``step`` not recorded yet; returns ``(rows, seconds)`` of this run."""
+    async with pool.acquire() as conn:
+        done = await done_chunks(conn, USER_PREFIX, step.name)
+    ranges = step.ranges(ctx.plan.chunk)
+    todo = [k for k in range(len(ranges)) if k not in done]
+    if not todo:
+        print(f"  {step.name}: {sum(done.values())} rows already seeded", file=sys.stderr)
+        return 0, 0.0
+    semaphore = asyncio.Semaphore(jobs)
+    loaded = []
+    started = time.perf_counter()
+
+    async def one(k):
+        async with semaphore, pool.acquire() as conn:
+            rng = make_rng(f"{ctx.plan.seed}:{step.name}:{k}")
+            chunk_started = time.perf_counter()
+            async with conn.transaction():
+                await conn.execute("SET LOCAL synchronous_commit = off")
+                if ctx.fast:
+                    await conn.execute("SET LOCAL session_replication_role = replica")
+                rows = await step.load(conn, ctx, rng, *ranges[k])
+                seconds = time.perf_counter() - chunk_started
+                await conn.execute("INSERT INTO bench.seed_chunks VALUES ($1, $2, $3, $4, $5)",
+                                   USER_PREFIX, step.name, k, rows, seconds)
+            loaded.append(rows)
+            total = sum(loaded)
+            print(f"  {step.name} {len(done) + len(loaded)}/{len(ranges)}: {total} rows "
+                  f"({total / (time.perf_counter() - started):.0f}/s)", file=sys.stderr, flush=True)
+
+    await asyncio.gather(*(one(k) for k in todo))
+    return sum(loaded), time.perf_counter() - started
+
+
+async def finish(conn, ctx):
+    """Recompute the counter columns of seeded projects and refresh planner statistics."""
+    counters = {"likes_count": "coalesce(l.n, 0)", "comments_count": "coalesce(c.n, 0)"}
+    assignments = [f"{name} = {value}" for name, value in counters.items() if name in ctx.columns["Project"]]
+    if assignments:
+        await conn.execute(COUNTERS_SQL.format(assignments=", ".join(assignments)), SEED_MARK + "%")
+    for table in ("users", "Project", "Like", "Comment", "Follow", "Collection", "CollectionItem",
+                  "recruit_items"):
+        await conn.execute(f'ANALYZE public."{table}"')
+
+
+def plan_from(args, stored):
+    """The plan for this run: the options given, or the stored plan's when resuming."""
+    given = {f.name: getattr(args, f.name) for f in fields(Plan) if getattr(args, f.name, None) is not None}
+    if stored is not None and not given and args.scale is None:
+        return stored
+    plan = Plan(**given)
+    if args.scale is not None:
+        plan = plan.scaled(args.scale)
+    if not plan.until:
+        plan.until = stored.until if stored else datetime.date.today().isoformat()
+    return plan
+
+
+async def run(args):
+    pool = await db.create_pool(args.dsn, size=args.jobs + 1)
+    try:
+        async with pool.acquire() as conn:
+            columns = await check_schema(conn)
+            await conn.execute(PROGRESS_DDL)
+            stored = await load_plan(conn, USER_PREFIX)
+            plan = plan_from(args, stored)
+            if stored is not None and stored != plan:
+                print("the database holds a different seed plan:\n  " + json.dumps(asdict(stored)) +
+                      "\nrerun with the same options (or none) to resume, or `clean` first", file=sys.stderr)
+                return 2
+            if stored is None:
+                await conn.execute("INSERT INTO bench.seed_plans (prefix, plan) VALUES ($1, $2)",
+                                   USER_PREFIX, json.dumps(asdict(plan)))
+            categories = [row["category_id"] for row in await conn.fetch('SELECT category_id FROM "Category"')]
+            if not categories:
+                raise RuntimeError('"Category" is empty; run supabase/schema.sql first')
+            fast = await can_skip_triggers(conn)
+        if not fast:
+            print("  no permission to skip triggers; counters and foreign keys are checked per row",
+                  file=sys.stderr)
+
+        print(f"planning {plan.users} users, {plan.projects} projects (seed {plan.seed})", file=sys.stderr)
+        until = datetime.datetime.combine(datetime.date.fromisoformat(plan.until), datetime.time(),
+                                          tzinfo=datetime.timezone.utc)
+        ctx = Context(
+            plan=plan, until=until, categories=categories, columns=columns, fast=fast,
+            user_ids=[db.synthetic_user(USER_PREFIX, i)[0] for i in range(plan.users)],
+            projects=Zipf(plan.projects, plan.like_skew, make_rng(f"{plan.seed}:rank:projects")),
+            owners=Zipf(plan.users, plan.owner_skew, make_rng(f"{plan.seed}:rank:owners")),
+            followed=Zipf(plan.users, plan.follow_skew, make_rng(f"{plan.seed}:rank:followed")),
+        )
+        summary = []
+        for step in steps(plan):
+            rows, seconds = await run_step(pool, ctx, step, args.jobs)
+            summary.append((step.name, rows, seconds))
+            if step.name == "projects":
+                async with pool.acquire() as conn:
+                    ctx.project_ids = await project_map(conn, plan.projects)
+        async with pool.acquire() as conn:
+            started = time.perf_counter()
+            await finish(conn, ctx)
+            summary.append(("counters+analyze", 0, time.perf_counter() - started))
+    finally:
+        await pool.close()
+
+    print(f"{'step':<18} {'rows':>10} {'seconds':>9} {'rows/s':>9}")
+    for name, rows, seconds in summary:
+        rate = f"{rows / seconds:.0f}" if rows and seconds else "-"
+        print(f"{name:<18} {rows:>10} {seconds:>9.1f} {rate:>9}")
+    total_rows = sum(rows for _, rows, _ in summary)
+    total_sec = sum(seconds for _, _, seconds in summary)
+    print(f"{'total':<18} {total_rows:>10} {total_sec:>9.1f}")
+    return 0
+
+
+async def status(args):
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        await conn.execute(PROGRESS_DDL)
+        plan = await load_plan(conn, USER_PREFIX)
+        if plan is None:
+            print("nothing seeded")
+            return 0
+        print(json.dumps(asdict(plan)))
+        for step in steps(plan):
+            done = await done_chunks(conn, USER_PREFIX, step.name)
+            chunks = len(step.ranges(plan.chunk))
+            print(f"{step.name:<12} {len(done):>5}/{chunks:<5} chunks {sum(done.values()):>10} rows")
+    finally:
+        await conn.close()
+    return 0
+
+
+async def clean(args):
+    conn = await asyncpg.connect(args.dsn)
+    try:
+        await conn.execute(PROGRESS_DDL)
+        removed = {}
+        for table in ("recruit_items", "Collection", "Project"):
+            column = "name" if table == "Collection" else "title"
+            result = await conn.execute(f'DELETE FROM "{table}" WHERE {column} LIKE $1', SEED_MARK + "%")
+            removed[table] = int(result.split()[-1])
+        # Likes, comments and follows of the users cascade.
+        removed["users"] = await db.delete_users(conn, USER_PREFIX)
+        await conn.execute("DELETE FROM bench.seed_chunks WHERE prefix = $1", USER_PREFIX)
+        await conn.execute("DELETE FROM bench.seed_plans WHERE prefix = $1", USER_PREFIX)
+    finally:
+        await conn.close()
+    print(", ".join(f"{count} {table}" for table, count in removed.items()) + " removed")
+    return 0
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m load.seed", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_parser = sub.add_parser("run", help="seed (or resume seeding) the synthetic data set")
+    defaults = Plan()
+    for name in ("seed", "users", "projects", "likes", "comments", "follows", "collections", "recruit",
+                 "days", "chunk"):
+        run_parser.add_argument(f"--{name}", type=int, help=f"default {getattr(defaults, name)}")
+    for name in ("like_skew", "follow_skew", "owner_skew", "reply_ratio"):
+        run_parser.add_argument(f"--{name.replace('_', '-')}", dest=name, type=float,
+                                help=f"default {getattr(defaults, name)}")
+    run_parser.add_argument("--until", help="newest timestamp date (default: today, or the stored plan's)")
+    run_parser.add_argument("--scale", type=float, help="multiply every row count")
+    run_parser.add_argument("--jobs", type=int, default=2, help="chunks loaded concurrently")
+    run_parser.add_argument("--dsn", default=db.DATABASE_URL)
+    for name, help_text in (("status", "show the stored plan and loaded chunks"),
+                            ("clean", "delete the seeded rows and users")):
+        sub.add_parser(name, help=help_text).add_argument("--dsn", default=db.DATABASE_URL)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    command = {"run": run, "status": status, "clean": clean}[args.command]
+    try:
+        return asyncio.run(command(args))
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Latency bookkeeping and plain-text reporting for the load tools."""
+
+import math
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted sequence."""
+    if not sorted_values:
+        return math.nan
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+class LatencyStats:
+    """Latencies (ms), error count and bytes for one named request kind."""
+
+    def __init__(self):
+        self.latencies_ms = []
+        self.errors = 0
+        self.bytes = 0
+        self.statuses = {}
+
+    def add(self, latency_ms, status, size=0):
+        self.latencies_ms.append(latency_ms)
+        self.bytes += size
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if status is None or status >= 400:
+            self.errors += 1
+
+    def summary(self, elapsed_sec):
+        values = sorted(self.latencies_ms)
+        return {
+            "count": len(values),
+            "errors": self.errors,
+            "rps": len(values) / elapsed_sec if elapsed_sec > 0 else math.nan,
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": values[-1] if values else math.nan,
+            "bytes": self.bytes,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items(), key=str)},
+        }
+
+
+class Recorder:
+    """Named :class:`LatencyStats` buckets shared by every in-flight request."""
+
+    def __init__(self):
+        self.buckets = {}
+
+    def add(self, name, latency_ms, status, size=0):
+        self.buckets.setdefault(name, LatencyStats()).add(latency_ms, status, size)
+
+    def summary(self, elapsed_sec):
+        return {name: stats.summary(elapsed_sec) for name, stats in sorted(self.buckets.items())}
+
+
+def format_table(summary, title=None):
+    """Render ``Recorder.summary()`` output as an aligned text table."""
+    lines = [title] if title else []
+    header = f"{'name':<34} {'count':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for name, row in summary.items():
+        lines.append(
+            f"{name[:34]:<34} {row['count']:>7} {row['errors']:>5} {row['rps']:>8.1f} "
+            f"{row['p50']:>8.1f} {row['p95']:>8.1f} {row['p99']:>8.1f} {row['max']:>8.1f}"
+        )
+    return "\n".join(lines)
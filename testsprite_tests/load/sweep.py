@@ -0,0 +1,238 @@
+"""Concurrent health and latency sweep over every public route.
+
+Reads the routes from ``/sitemap.xml`` (``src/app/sitemap.ts``, rebased
+onto ``--base-url``), adds ``--sample`` ``/project/[id]`` and
+``/creator/[username]`` pages discovered through ``GET /api/projects``,
+and fetches them all ``--repeats`` times with at most ``--concurrency``
+requests in flight over one keep-alive pool. Per URL it records status,
+time to first byte, total time and HTML bytes; the first fetch is kept
+separately as the cold number::
+
+    python -m load.sweep                        # sweep and check the budget
+    python -m load.sweep --update-budget        # accept today's timings
+    python -m load.sweep --concurrency 32 --sample 20
+
+The run fails on a 4xx/5xx or transport error, and on a route group
+(``/project/[id]`` counts once) whose median TTFB, total time or bytes
+exceed ``tmp/bench/sweep/budget.json``. Runs are stored under
+``tmp/bench/sweep/`` (see :mod:`load.results`).
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import statistics
+import sys
+import time
+import xml.etree.ElementTree as ET
+from urllib.parse import quote, urlparse
+
+from . import results
+from .client import BASE_URL, ApiClient
+
+SUITE = "sweep"
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+HTML_HEADERS = {"Accept": "text/html,application/xhtml+xml"}
+# Dynamic routes, most specific first: (pattern, group name).
+ROUTE_GROUPS = [
+    (re.compile(r"^/project/\d+$"), "/project/[id]"),
+    (re.compile(r"^/creator/[^/]+$"), "/creator/[username]"),
+    (re.compile(r"^/category/[^/]+$"), "/category/[slug]"),
+]
+# Budget headroom over today's medians; the floor keeps fast routes from flapping.
+BUDGET_HEADROOM = 1.5
+BUDGET_FLOOR_MS = 50
+BYTES_HEADROOM = 1.1
+
+
+def route_group(path):
+    for pattern, name in ROUTE_GROUPS:
+        if pattern.match(path):
+            return name
+    return path
+
+
+def sitemap_paths(xml_bytes):
+    """Paths of the ``<loc>`` entries; the sitemap's own host is dropped."""
+    root = ET.fromstring(xml_bytes)
+    paths = []
+    for loc in root.iter(f"{SITEMAP_NS}loc"):
+        parsed = urlparse((loc.text or "").strip())
+        paths.append((parsed.path or "/") + (f"?{parsed.query}" if parsed.query else ""))
+    return paths
+
+
+async def discover(client, sample):
+    """Sitemap routes plus up to ``sample`` project and creator pages each.
+
+    Returns ``(paths, problems)``; a missing sitemap is a problem, not a crash.
+    """
+    problems = []
+    status, body = await client.get("/sitemap.xml", name="GET /sitemap.xml")
+    paths = []
+    if status == 200:
+        try:
+            paths = sitemap_paths(body)
+        except ET.ParseError as exc:
+            problems.append(f"/sitemap.xml: unparsable ({exc})")
+    else:
+        problems.append(f"/sitemap.xml: status {status}")
+    if sample:
+        data = await client.get_json(f"/api/projects?page=1&limit={sample * 3}", name="GET /api/projects")
+        if data is None:
+            problems.append("GET /api/projects failed; no project or creator pages sampled")
+        projects = (data or {}).get("projects") or []
+        creators = []
+        for project in projects:
+            username = (project.get("User") or {}).get("username")
+            if username and username != "Unknown" and username not in creators:
+                creators.append(username)
+        paths += [f"/project/{p['project_id']}" for p in projects[:sample]]
+        paths += [f"/creator/{quote(name)}" for name in creators[:sample]]
+    return list(dict.fromkeys(paths)), problems
+
+
+async def sweep(client, paths, repeats, concurrency):
+    """``{path: [sample, ...]}`` with ``repeats`` fetches of every path."""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples = {path: [] for path in paths}
+
+    async def fetch(path):
+        async with semaphore:
+            samples[path].append(await client.timed_get(path, name=route_group(path), headers=HTML_HEADERS))
+
+    for _ in range(repeats):
+        # Rounds keep each URL's first fetch cold while the rest of the site is hit in parallel.
+        await asyncio.gather(*(fetch(path) for path in paths))
+    return samples
+
+
+def _median(values):
+    values = [v for v in values if v is not None]
+    return round(statistics.median(values), 1) if values else None
+
+
+def summarize(samples):
+    rows = []
+    for path, runs in samples.items():
+        statuses = sorted({s["status"] for s in runs}, key=str)
+        rows.append({
+            "path": path,
+            "group": route_group(path),
+            "statuses": statuses,
+            "coldTtfbMs": runs[0]["ttfbMs"],
+            "ttfbMs": _median(s["ttfbMs"] for s in runs),
+            "totalMs": _median(s["totalMs"] for s in runs),
+            "bytes": max(s["bytes"] for s in runs),
+            "redirects": max(s["redirects"] for s in runs),
+            "contentType": runs[-1]["contentType"],
+        })
+    return sorted(rows, key=lambda row: -(row["ttfbMs"] or 0))
+
+
+def by_group(rows):
+    groups = {}
+    for row in rows:
+        groups.setdefault(row["group"], []).append(row)
+    return groups
+
+
+def status_problems(rows):
+    problems = []
+    for row in rows:
+        bad = [s for s in row["statuses"] if s is None or s >= 400]
+        if bad:
+            shown = ", ".join("error" if s is None else str(s) for s in bad)
+            problems.append(f"{row['path']}: {shown}")
+    return problems
+
+
+def budget_from(rows):
+    budget = {}
+    for group, members in by_group(rows).items():
+        ok = [m for m in members if m["ttfbMs"] is not None]
+        if not ok:
+            continue
+        budget[group] = {
+            "maxTtfbMs": round(max(BUDGET_FLOOR_MS, max(m["ttfbMs"] for m in ok) * BUDGET_HEADROOM)),
+            "maxTotalMs": round(max(BUDGET_FLOOR_MS, max(m["totalMs"] for m in ok) * BUDGET_HEADROOM)),
+            "maxBytes": int(max(m["bytes"] for m in ok) * BYTES_HEADROOM),
+        }
+    return budget
+
+
+def check_budget(rows, budget):
+    problems = []
+    for group, members in by_group(rows).items():
+        limits = budget.get(group)
+        if limits is None:
+            continue
+        for key, limit_key, unit in (("ttfbMs", "maxTtfbMs", "ms TTFB"), ("totalMs", "maxTotalMs", "ms total"),
+                                     ("bytes", "maxBytes", "bytes")):
+            value = _median(m[key] for m in members)
+            if value is not None and value > limits[limit_key]:
+                problems.append(f"{group}: {value:.0f} {unit} > {limits[limit_key]}")
+    return problems
+
+
+def print_table(rows):
+    print(f"{'path':<40} {'status':>7} {'cold ms':>8} {'ttfb ms':>8} {'total ms':>9} {'KiB':>7}")
+    for row in rows:
+        status = "/".join("err" if s is None else str(s) for s in row["statuses"])
+        cold = "-" if row["coldTtfbMs"] is None else f"{row['coldTtfbMs']:.0f}"
+        ttfb = "-" if row["ttfbMs"] is None else f"{row['ttfbMs']:.0f}"
+        print(f"{row['path'][:40]:<40} {status:>7} {cold:>8} {ttfb:>8} {row['totalMs']:>9.0f} "
+              f"{row['bytes'] / 1024:>7.1f}")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m load.sweep", description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=3, help="fetches per URL; the first counts as cold")
+    parser.add_argument("--sample", type=int, default=10, help="project and creator pages to add each")
+    parser.add_argument("--path", action="append", dest="paths", help="extra path to sweep (repeatable)")
+    parser.add_argument("--timeout-sec", type=float, default=30)
+    parser.add_argument("--update-budget", action="store_true", help="write the budget from this sweep")
+    return parser.parse_args(argv)
+
+
+async def run(args):
+    started = time.perf_counter()
+    async with ApiClient(args.base_url, connections=args.concurrency, timeout_sec=args.timeout_sec) as client:
+        paths, problems = await discover(client, args.sample)
+        paths += [p for p in args.paths or [] if p not in paths]
+        samples = await sweep(client, paths, args.repeats, args.concurrency)
+    elapsed = time.perf_counter() - started
+    rows = summarize(samples)
+    print_table(rows)
+    problems += status_problems(rows)
+
+    budget_path = results.suite_dir(SUITE) / "budget.json"
+    if args.update_budget or not budget_path.exists():
+        budget_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(budget_path, "w", encoding="utf-8") as f:
+            json.dump(budget_from(rows), f, indent=2)
+        print(f"budget -> {budget_path}")
+    else:
+        with open(budget_path, encoding="utf-8") as f:
+            problems += check_budget(rows, json.load(f))
+
+    path = results.write_run(SUITE, {
+        "baseUrl": args.base_url, "concurrency": args.concurrency, "repeats": args.repeats,
+        "elapsedSec": round(elapsed, 2), "rows": rows, "problems": problems,
+        "samples": samples,
+    })
+    for problem in problems:
+        print(f"FAIL {problem}")
+    print(f"{len(paths)} URL(s) x {args.repeats} in {elapsed:.1f}s; run -> {path}")
+    return 1 if problems else 0
+
+
+def main(argv=None):
+    return asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
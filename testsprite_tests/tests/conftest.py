@@ -0,0 +1,6 @@
+"""Put ``testsprite_tests/`` on ``sys.path`` so the tests import ``harness`` as ``python -m harness`` does."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,94 @@
+"""Plan validation and caching in :mod:`harness.compiler`."""
+
+import asyncio
+import json
+
+import pytest
+
+from harness import compiler
+from harness.compiler import CompileError, CompiledCase, compile_entry, compile_plan
+from harness.plan import PLAN_PATH
+
+
+def entry(*runs, **fields):
+    return {"id": "TC900", "title": "t", "steps": [{"description": f"s{i}", "run": r} for i, r in enumerate(runs)],
+            **fields}
+
+
+def test_compile_entry_builds_the_step_graph():
+    graph = compile_entry(entry(
+        {"goto": "/", "response": "/api/projects"},
+        [{"click": "sel:category_filter:photo"}, {"expect_visible": ["sel:image_card"]}],
+        None,
+        dependsOn=["TC003"], requiresAuth=True,
+    ))
+    assert graph["dependsOn"] == ["TC003"] and graph["requiresAuth"] is True
+    assert graph["resourcePolicy"] == "full"
+    assert [len(step["ops"]) for step in graph["steps"]] == [1, 2, 0]
+    assert graph["steps"][0]["ops"][0] == ["goto", {"goto": "/", "response": "/api/projects"}]
+    assert graph["steps"][1]["index"] == 2
+
+
+@pytest.mark.parametrize("run, message", [
+    ("goto /", "run entries must be objects"),
+    ({"goto": "/", "click": "a"}, "expected exactly one of"),
+    ({"response": "/api"}, "expected exactly one of"),
+    ({"goto": "/", "retries": 3}, "unknown keys ['retries']"),
+    ({"click": "sel:no_such_thing"}, "unknown selector 'no_such_thing'"),
+    ({"click": "sel:category_filter"}, "needs argument"),
+    ({"expect_visible": ["sel:image_card:3"]}, "takes no argument"),
+])
+def test_compile_entry_rejects_invalid_steps(run, message):
+    with pytest.raises(CompileError) as info:
+        compile_entry(entry(run))
+    assert "TC900 step 1" in str(info.value)
+    assert message in str(info.value)
+
+
+def test_the_shipped_plan_compiles(tmp_path):
+    compiled = compile_plan(PLAN_PATH, tmp_path / "compiled.json")
+    assert compiled and all(graph["steps"] for graph in compiled.values())
+
+
+def test_compile_plan_reuses_the_cache_until_the_plan_changes(tmp_path, monkeypatch):
+    plan_path, cache_path = tmp_path / "plan.json", tmp_path / "compiled.json"
+    plan_path.write_text(json.dumps([entry({"goto": "/"})]), encoding="utf-8")
+    first = compile_plan(plan_path, cache_path)
+
+    calls = []
+    monkeypatch.setattr(compiler, "compile_entry", lambda e: calls.append(e["id"]) or {"id": e["id"]})
+    assert compile_plan(plan_path, cache_path) == first
+    assert calls == []
+
+    plan_path.write_text(json.dumps([entry({"goto": "/about"})]), encoding="utf-8")
+    assert compile_plan(plan_path, cache_path) == {"TC900": {"id": "TC900"}}
+    assert calls == ["TC900"]
+
+
+def test_compile_plan_recovers_from_a_corrupt_cache(tmp_path):
+    plan_path, cache_path = tmp_path / "plan.json", tmp_path / "compiled.json"
+    plan_path.write_text(json.dumps([entry({"goto": "/"})]), encoding="utf-8")
+    cache_path.write_text("{not json", encoding="utf-8")
+    assert list(compile_plan(plan_path, cache_path)) == ["TC900"]
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["cases"]["TC900"]["id"] == "TC900"
+
+
+def test_compiled_case_reports_pending_steps_and_wraps_failures(monkeypatch):
+    calls = []
+
+    async def ok(ctx, spec):
+        calls.append(spec["goto"])
+
+    async def broken(ctx, spec):
+        raise RuntimeError("no such element")
+
+    monkeypatch.setitem(compiler.OPS, "goto", ok)
+    monkeypatch.setitem(compiler.OPS, "click", broken)
+    monkeypatch.setattr("harness.steps.load_credentials", lambda: ("a@example.com", "pw"))
+    case = CompiledCase(compile_entry(entry({"goto": "/"}, None, {"click": "a"}, {"goto": "/never"})))
+    assert [step["index"] for step in case.pending_steps] == [2]
+
+    with pytest.raises(AssertionError, match=r"TC900 step 3 \(s2\): no such element"):
+        asyncio.run(case.run_test(context=None))
+    assert calls == ["/"]
+    assert [r["status"] for r in case.step_results] == ["PASSED", "PENDING", "FAILED"]
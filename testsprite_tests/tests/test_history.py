@@ -0,0 +1,83 @@
+"""Flake scores, quarantine and expected durations in :mod:`harness.history`."""
+
+import pytest
+
+from harness import history
+from harness.history import case_stats, expected_durations, flake_score, quarantined, record_run
+
+P, F = "PASSED", "FAILED"
+
+
+def result(case_id, *attempts):
+    """A scheduler result whose attempts are ``(status, seconds)`` pairs."""
+    return {"caseId": case_id, "attempts": [
+        {"status": status, "durationSec": seconds, "error": "" if status == P else "boom"}
+        for status, seconds in attempts
+    ]}
+
+
+def record(path, case_id, statuses, seconds=1.0):
+    for i, status in enumerate(statuses):
+        record_run([result(case_id, (status, seconds))], f"run{i}", "abc", path)
+
+
+@pytest.mark.parametrize("statuses, score", [
+    ([], 0.0),
+    ([F], 0.0),
+    ([F] * 6, 0.0),
+    ([P] * 6, 0.0),
+    ([P, F, P, F, P], 1.0),
+    ([P, P, F, F, P], 0.5),
+])
+def test_flake_score_counts_flips(statuses, score):
+    assert flake_score(statuses) == score
+
+
+def test_record_run_stores_every_attempt_and_skips_blocked_cases(tmp_path):
+    path = tmp_path / "history.sqlite"
+    stored = record_run([result("TC001", (F, 2.0), (P, 1.0)), {"caseId": "TC002", "attempts": []}],
+                        "run0", "abc", path)
+    assert stored == 2
+    stats = case_stats(["TC001", "TC002"], path)
+    assert list(stats) == ["TC001"]
+    assert stats["TC001"]["attempts"] == 2 and stats["TC001"]["passRate"] == 0.5
+
+
+def test_case_stats_without_a_store_is_empty(tmp_path):
+    assert case_stats(["TC001"], tmp_path / "missing.sqlite") == {}
+    assert not (tmp_path / "missing.sqlite").exists()
+
+
+def test_quarantine_needs_enough_attempts_and_a_high_score(tmp_path):
+    path = tmp_path / "history.sqlite"
+    record(path, "TC001", [P, F, P, F, P])      # flaky, enough attempts
+    record(path, "TC002", [P, F, P, F])         # flaky, too few attempts
+    record(path, "TC003", [F, F, F, F, F, F])   # consistently failing
+    record(path, "TC004", [P, P, P, P, P, F])   # one recent failure
+    assert quarantined(["TC001", "TC002", "TC003", "TC004"], path) == {"TC001"}
+
+
+def test_only_the_last_window_counts(tmp_path):
+    path = tmp_path / "history.sqlite"
+    record(path, "TC001", [P, F] * 5 + [P] * history.WINDOW)
+    stats = case_stats(["TC001"], path)["TC001"]
+    assert stats["attempts"] == history.WINDOW and stats["flakeScore"] == 0.0 and not stats["quarantined"]
+
+
+def test_median_duration_prefers_passing_attempts(tmp_path):
+    path = tmp_path / "history.sqlite"
+    record_run([result("TC001", (F, 30.0), (P, 2.0)), result("TC002", (F, 5.0), (F, 7.0))], "r", "abc", path)
+    record_run([result("TC001", (P, 4.0))], "r2", "abc", path)
+    stats = case_stats(["TC001", "TC002"], path)
+    assert stats["TC001"]["medianSec"] == 3.0
+    assert stats["TC002"]["medianSec"] == 6.0
+
+
+def test_expected_durations_estimate_unseen_cases_from_steps(tmp_path):
+    path = tmp_path / "history.sqlite"
+    assert expected_durations(["TC001"], {}, path) is None
+    record(path, "TC001", [P], seconds=8.0)
+    plan = {"TC001": {"steps": [1, 2, 3, 4]}, "TC002": {"steps": [1, 2]}}
+    assert expected_durations(["TC001", "TC002", "TC003"], plan, path) == {
+        "TC001": 8.0, "TC002": 4.0, "TC003": 2.0,
+    }
@@ -0,0 +1,95 @@
+"""Import-graph expansion and case selection in :mod:`harness.impact`."""
+
+import pytest
+
+from harness import impact
+from harness.impact import dependents, import_graph, select_cases
+
+SOURCES = {
+    "src/app/layout.tsx": 'import "./globals.css";\nimport { Header } from "@/components/Header";',
+    "src/app/globals.css": "",
+    "src/app/page.tsx": 'import { ImageCard } from "@/components";',
+    "src/app/creator/[username]/page.tsx": 'import { FollowListModal } from "@/components/FollowListModal";',
+    "src/app/creator/layout.tsx": "export default function L() {}",
+    "src/app/recruit/page.tsx": 'const m = await import("../../lib/jobs");',
+    "src/components/index.ts": 'export * from "./ImageCard";',
+    "src/components/ImageCard.tsx": 'import { cn } from "../lib/utils";',
+    "src/components/Header.tsx": "export function Header() {}",
+    "src/components/FollowListModal.tsx": 'import { Dialog } from "@/components/ui/dialog";',
+    "src/components/ui/dialog.tsx": 'import * as DialogPrimitive from "@radix-ui/react-dialog";',
+    "src/lib/utils.ts": "",
+    "src/lib/jobs.ts": "",
+    "src/lib/orphan.ts": "",
+}
+PLAN = {
+    "TC001": {"id": "TC001", "features": ["Main Landing Page"]},
+    "TC006": {"id": "TC006", "features": ["Marketplace"]},
+    "TC007": {"id": "TC007", "features": ["Creator Profile"]},
+}
+FEATURES = {
+    "Main Landing Page": ["src/app/page.tsx"],
+    "Marketplace": ["src/app/recruit/"],
+    "Creator Profile": ["src/app/creator/"],
+}
+CASES = ["TC001", "TC006", "TC007"]
+
+
+@pytest.fixture
+def importers(tmp_path):
+    for name, text in SOURCES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return import_graph(tmp_path)
+
+
+def test_resolve_handles_aliases_relative_paths_and_index_files():
+    known = {"src/components/index.ts", "src/lib/utils.ts", "src/components/ImageCard.tsx"}
+    assert impact._resolve("src/app/page.tsx", "@/components", known) == "src/components/index.ts"
+    assert impact._resolve("src/components/ImageCard.tsx", "../lib/utils", known) == "src/lib/utils.ts"
+    assert impact._resolve("src/components/index.ts", "./ImageCard", known) == "src/components/ImageCard.tsx"
+    assert impact._resolve("src/app/page.tsx", "react", known) is None
+    assert impact._resolve("src/app/page.tsx", "@/missing", known) is None
+
+
+def test_import_graph_links_imports_reexports_dynamic_imports_and_layouts(importers):
+    assert importers["src/components/index.ts"] == {"src/app/page.tsx"}
+    assert importers["src/components/ImageCard.tsx"] == {"src/components/index.ts"}
+    assert importers["src/lib/jobs.ts"] == {"src/app/recruit/page.tsx"}
+    assert importers["src/app/globals.css"] == {"src/app/layout.tsx"}
+    assert importers["src/app/creator/layout.tsx"] == {"src/app/creator/[username]/page.tsx"}
+    assert "src/app/recruit/page.tsx" in importers["src/app/layout.tsx"]
+
+
+def test_dependents_is_transitive(importers):
+    assert dependents(["src/lib/utils.ts"], importers) == {
+        "src/lib/utils.ts", "src/components/ImageCard.tsx", "src/components/index.ts", "src/app/page.tsx",
+    }
+
+
+def test_a_leaf_change_selects_only_the_cases_whose_features_reach_it(importers):
+    selected, full, reasons = select_cases(
+        ["src/components/ui/dialog.tsx"], PLAN, FEATURES, importers, CASES)
+    assert (selected, full) == (["TC007"], False)
+    assert reasons["src/components/ui/dialog.tsx"] == "Creator Profile -> TC007"
+
+
+def test_changes_reaching_the_root_layout_or_no_feature_run_everything(importers):
+    assert select_cases(["src/components/Header.tsx"], PLAN, FEATURES, importers, CASES)[:2] == (CASES, True)
+    assert select_cases(["src/lib/orphan.ts"], PLAN, FEATURES, importers, CASES)[:2] == (CASES, True)
+
+
+def test_shared_ignored_and_case_files(importers):
+    assert select_cases(["package.json"], PLAN, FEATURES, importers, CASES)[1] is True
+    assert select_cases(["README.md", "testsprite_tests/load/seed.py", "testsprite_tests/tests/test_x.py"],
+                        PLAN, FEATURES, importers, CASES)[:2] == ([], False)
+    assert select_cases(["Dockerfile"], PLAN, FEATURES, importers, CASES)[1] is True
+    selected, full, _ = select_cases(
+        ["testsprite_tests/TC006_Connection_Marketplace_Job_Postings_and_Proposals.py", "src/lib/jobs.ts"],
+        PLAN, FEATURES, importers, CASES)
+    assert (selected, full) == (["TC006"], False)
+
+
+def test_selection_is_limited_to_the_requested_cases(importers):
+    selected, full, _ = select_cases(["src/lib/jobs.ts"], PLAN, FEATURES, importers, ["TC001"])
+    assert (selected, full) == ([], False)
@@ -0,0 +1,112 @@
+"""Incremental stream reading and report rendering in :mod:`harness.report`."""
+
+import pytest
+
+from harness.report import ReportBuilder, append_record, start_run
+
+PLAN = {
+    "TC001": {"id": "TC001", "title": "Landing", "requirement": "Landing Page"},
+    "TC002": {"id": "TC002", "title": "Detail", "category": "functional"},
+}
+
+
+def case(case_id, status="PASSED", **fields):
+    return {"type": "case", "caseId": case_id, "status": status, "durationSec": 1.5, **fields}
+
+
+def test_follow_reads_only_complete_new_lines(tmp_path):
+    stream = tmp_path / "results.jsonl"
+    builder = ReportBuilder(plan=PLAN)
+    assert builder.follow(stream) is False  # no file yet
+
+    start_run(stream, ["TC001", "TC002"], "abc123")
+    append_record(stream, case("TC001"))
+    assert builder.follow(stream) is True
+    assert list(builder.cases) == ["TC001"]
+
+    # A half-written line is left for the next call.
+    with open(stream, "ab") as f:
+        f.write(b'{"type": "case", "caseId": "TC002", "status": "FAI')
+    assert builder.follow(stream) is False
+    with open(stream, "ab") as f:
+        f.write(b'LED", "durationSec": 2.0}\n')
+    assert builder.follow(stream) is True
+    assert builder.cases["TC002"]["status"] == "FAILED"
+    assert builder.follow(stream) is False
+
+
+def test_a_new_run_header_resets_the_cases(tmp_path):
+    stream = tmp_path / "results.jsonl"
+    start_run(stream, ["TC001"], "old")
+    append_record(stream, case("TC001", "FAILED"))
+    append_record(stream, {"type": "end", "elapsedSec": 3.0})
+    start_run(stream, ["TC002"], "new")
+    append_record(stream, case("TC002"))
+    builder = ReportBuilder(plan=PLAN)
+    builder.follow(stream)
+    assert builder.header["commit"] == "new"
+    assert list(builder.cases) == ["TC002"]
+    assert builder.elapsed_sec is None
+
+
+def test_a_truncated_stream_is_read_from_the_start(tmp_path):
+    stream = tmp_path / "results.jsonl"
+    start_run(stream, ["TC001", "TC002"], "abc")
+    append_record(stream, case("TC001"))
+    append_record(stream, case("TC002"))
+    builder = ReportBuilder(plan=PLAN)
+    builder.follow(stream)
+
+    stream.unlink()
+    start_run(stream, ["TC001"], "def")
+    assert builder.follow(stream) is True
+    assert builder.header["commit"] == "def" and builder.cases == {}
+
+
+def test_coverage_groups_by_requirement_and_counts_statuses():
+    builder = ReportBuilder(plan=PLAN)
+    for record in (case("TC001"), case("TC002", "BLOCKED"), case("TC003", "FAILED")):
+        builder.feed(record)
+    assert builder.coverage() == [
+        ("Landing Page", 1, {"PASSED": 1, "FAILED": 0, "BLOCKED": 0}),
+        ("Functional", 1, {"PASSED": 0, "FAILED": 0, "BLOCKED": 1}),
+        ("Uncategorized", 1, {"PASSED": 0, "FAILED": 1, "BLOCKED": 0}),
+    ]
+    assert builder.pass_rate() == pytest.approx(100 / 3)
+
+
+def test_markdown_shows_progress_steps_and_retries():
+    builder = ReportBuilder(plan=PLAN)
+    builder.feed({"type": "run", "startedAt": "2026-01-01T00:00:00", "commit": "abc", "cases": ["TC001", "TC002"]})
+    builder.feed(case(
+        "TC001", steps=[{"description": "open", "status": "PASSED", "ms": 120.0},
+                        {"description": "later", "status": "PENDING", "ms": 0}],
+        attempts=[{"status": "FAILED", "durationSec": 1.0}, {"status": "PASSED", "durationSec": 0.5}],
+        flaky=True, artifacts={"evidence": "tmp/evidence/TC001.zip", "network": None},
+    ))
+    text = builder.render_markdown()
+    assert "in progress: 1/2 case(s) reported" in text
+    assert "1/2 step(s) executed, slowest: open (120 ms)" in text
+    assert "2 attempts: failed (1.0s), passed (0.5s) (flaky)" in text
+    assert "- **evidence:** `tmp/evidence/TC001.zip`" in text
+    assert "network" not in text
+    assert "| Landing Page | 1 | 1 | 0 | 0 |" in text
+
+    builder.feed({"type": "end", "elapsedSec": 4.25})
+    assert "complete in 4.2s" in builder.render_markdown()
+
+
+def test_html_escapes_errors():
+    builder = ReportBuilder(plan=PLAN)
+    builder.feed(case("TC001", "FAILED", error="expected <div> & got nothing"))
+    assert "expected &lt;div&gt; &amp; got nothing" in builder.render_html()
+
+
+def test_write_replaces_both_reports(tmp_path):
+    builder = ReportBuilder(plan=PLAN)
+    builder.feed(case("TC001"))
+    md, html = tmp_path / "r.md", tmp_path / "r.html"
+    builder.write(md, html)
+    assert md.read_text(encoding="utf-8").startswith("# Harness Test Report")
+    assert "<h1>Harness Test Report</h1>" in html.read_text(encoding="utf-8")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["r.html", "r.md"]
@@ -0,0 +1,158 @@
+"""Sharding and dependency blocking in :mod:`harness.scheduler`, without a browser."""
+
+import asyncio
+import types
+from contextlib import asynccontextmanager
+
+import pytest
+
+from harness import scheduler
+from harness.scheduler import BLOCKED, FAILED, PASSED, RunOptions, plan_shards
+
+
+def entry(case_id, priority="Medium", steps=1):
+    return {"id": case_id, "priority": priority, "steps": ["step"] * steps}
+
+
+def test_dependency_groups_join_chains_and_keep_singletons():
+    groups = scheduler._dependency_groups(
+        ["TC001", "TC002", "TC003", "TC004"], {"TC002": ["TC001"], "TC004": ["TC002"]}
+    )
+    assert sorted(sorted(g) for g in groups) == [["TC001", "TC002", "TC004"], ["TC003"]]
+
+
+def test_dependency_groups_ignore_cases_outside_the_run():
+    groups = scheduler._dependency_groups(["TC002"], {"TC002": ["TC001"]})
+    assert groups == [["TC002"]]
+
+
+def test_plan_shards_keeps_dependency_groups_in_one_shard():
+    plan = {c: entry(c) for c in ("TC001", "TC002", "TC003", "TC004")}
+    shards = plan_shards(list(plan), plan, {"TC003": ["TC001"]}, processes=3)
+    assert len(shards) == 3
+    owner = {case_id: i for i, shard in enumerate(shards) for case_id in shard}
+    assert owner["TC001"] == owner["TC003"]
+
+
+def test_plan_shards_never_makes_more_shards_than_groups():
+    plan = {c: entry(c) for c in ("TC001", "TC002")}
+    assert plan_shards(list(plan), plan, {"TC002": ["TC001"]}, processes=8) == [["TC001", "TC002"]]
+    assert plan_shards(list(plan), plan, {}, processes=0) == [["TC001", "TC002"]]
+
+
+def test_plan_shards_balances_by_cost_and_orders_by_priority():
+    plan = {
+        "TC001": entry("TC001", "Low", steps=10),
+        "TC002": entry("TC002", "High", steps=2),
+        "TC003": entry("TC003", "High", steps=6),
+        "TC004": entry("TC004", "Medium", steps=3),
+    }
+    shards = plan_shards(list(plan), plan, {}, processes=2)
+    # Largest first onto the lightest shard: 10 | 6 + 3 + 2.
+    assert shards == [["TC001"], ["TC003", "TC002", "TC004"]]
+
+
+def test_plan_shards_prefers_recorded_durations():
+    plan = {c: entry(c, steps=1) for c in ("TC001", "TC002", "TC003")}
+    durations = {"TC001": 1.0, "TC002": 30.0, "TC003": 2.0}
+    shards = plan_shards(list(plan), plan, {}, processes=2, durations=durations)
+    assert ["TC002"] in shards
+
+
+def test_plan_shards_orders_cases_missing_from_the_plan_last():
+    plan = {"TC001": entry("TC001", "Low")}
+    shards = plan_shards(["TC900", "TC001"], plan, {}, processes=1)
+    assert shards == [["TC001", "TC900"]]
+
+
+class FakePool:
+    browser = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @asynccontextmanager
+    async def context(self, **kwargs):
+        yield types.SimpleNamespace()
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    """Run :func:`scheduler.run_shard` against case modules from ``modules``."""
+    modules = {}
+
+    async def no_context_options(module, browser):
+        return {}
+
+    async def no_policy(context, module, size_cache):
+        return None
+
+    async def no_network(context, case_id, options):
+        return None
+
+    monkeypatch.setattr(scheduler, "BrowserPool", FakePool)
+    monkeypatch.setattr(scheduler, "load_plan", lambda: {})
+    monkeypatch.setattr(scheduler, "load_case", lambda name: modules[name])
+    monkeypatch.setattr(scheduler, "context_options", no_context_options)
+    monkeypatch.setattr(scheduler.resources, "apply_policy", no_policy)
+    monkeypatch.setattr(scheduler.resources, "SizeCache", lambda: types.SimpleNamespace(save=lambda: None))
+    monkeypatch.setattr(scheduler.waits, "step_log", lambda context: [])
+    monkeypatch.setattr(scheduler.network, "install", no_network)
+    return modules
+
+
+def case(outcomes):
+    """A case module whose runs pass (``True``) or fail (``False``) in turn."""
+    runs = iter(outcomes)
+
+    async def run_test(context):
+        if not next(runs):
+            raise AssertionError("boom")
+
+    return types.SimpleNamespace(run_test=run_test)
+
+
+def run_shard(case_ids, deps, **options):
+    cases = {case_id: case_id for case_id in case_ids}
+    opts = RunOptions(evidence_steps=0, **options)
+    return {r["caseId"]: r for r in asyncio.run(scheduler.run_shard(cases, case_ids, deps, opts))}
+
+
+def test_run_shard_blocks_cases_whose_dependency_failed(fake_browser):
+    fake_browser.update(TC001=case([False]), TC002=case([True]), TC003=case([True]))
+    results = run_shard(["TC002", "TC001", "TC003"], {"TC002": ["TC001"]})
+    assert results["TC001"]["status"] == FAILED
+    assert results["TC002"]["status"] == BLOCKED
+    assert results["TC002"]["error"] == "dependency failed: TC001"
+    assert results["TC003"]["status"] == PASSED
+
+
+def test_run_shard_blocks_transitively(fake_browser):
+    fake_browser.update(TC001=case([False]), TC002=case([True]), TC003=case([True]))
+    results = run_shard(["TC001", "TC002", "TC003"], {"TC002": ["TC001"], "TC003": ["TC002"]})
+    assert [results[c]["status"] for c in ("TC001", "TC002", "TC003")] == [FAILED, BLOCKED, BLOCKED]
+
+
+def test_run_shard_runs_dependents_after_a_passing_dependency(fake_browser):
+    order = []
+
+    def tracked(case_id):
+        async def run_test(context):
+            order.append(case_id)
+        return types.SimpleNamespace(run_test=run_test)
+
+    fake_browser.update(TC001=tracked("TC001"), TC002=tracked("TC002"))
+    results = run_shard(["TC002", "TC001"], {"TC002": ["TC001"]})
+    assert order == ["TC001", "TC002"]
+    assert results["TC002"]["status"] == PASSED
+
+
+def test_run_shard_retries_and_marks_flaky(fake_browser):
+    fake_browser.update(TC001=case([False, True]), TC002=case([False, False]))
+    results = run_shard(["TC001", "TC002"], {}, retries=1)
+    assert results["TC001"]["status"] == PASSED and results["TC001"]["flaky"]
+    assert [a["status"] for a in results["TC001"]["attempts"]] == [FAILED, PASSED]
+    assert results["TC002"]["status"] == FAILED and not results["TC002"]["flaky"]